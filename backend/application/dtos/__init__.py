@@ -1,12 +1,36 @@
 # Application DTOs
-from application.dtos.email_dto import (
-    ClassificarEmailRequest,
-    ClassificarEmailResponse,
-    ClassificarArquivoResponse,
-)
+# Importações preguiçosas (PEP 562): cada módulo só é carregado no primeiro acesso
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from application.dtos.email_dto import (
+        ClassificarEmailRequest,
+        ClassificarEmailResponse,
+        ClassificarArquivoResponse,
+    )
+
+_MODULOS = {
+    "ClassificarEmailRequest": "application.dtos.email_dto",
+    "ClassificarEmailResponse": "application.dtos.email_dto",
+    "ClassificarArquivoResponse": "application.dtos.email_dto",
+}
 
 __all__ = [
     "ClassificarEmailRequest",
     "ClassificarEmailResponse",
     "ClassificarArquivoResponse",
 ]
+
+
+def __getattr__(nome: str):
+    modulo = _MODULOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,11 +4,10 @@ DTOs (Data Transfer Objects) para operações com emails.
 DTOs são usados para transferir dados entre camadas da aplicação.
 """
 
-from pydantic import BaseModel, Field
-
-
 from typing import Optional, Literal
 
+from pydantic import BaseModel, ConfigDict, Field
+
 
 class ClassificarEmailRequest(BaseModel):
     """Request para classificação de email via texto."""
@@ -24,19 +23,22 @@ class ClassificarEmailRequest(BaseModel):
         description="Provedor de IA a usar (openai ou gemini). Se não informado, usa o padrão do servidor."
     )
     
-    class Config:
-        json_schema_extra = {
+    # Sem defer_build: o FastAPI monta o schema do corpo da requisição a partir
+    # do modelo, e com o build adiado o pydantic emite UnsupportedFieldAttributeWarning
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "conteudo": "Olá, gostaria de saber o status do meu chamado #12345. Aguardo retorno.",
                 "provider": "openai"
             }
         }
+    )
 
 
 class ClassificarEmailResponse(BaseModel):
     """Response da classificação de email."""
     
-    categoria: str = Field(
+    categoria: Literal["Produtivo", "Improdutivo"] = Field(
         ...,
         description="Categoria atribuída: Produtivo ou Improdutivo"
     )
@@ -67,8 +69,11 @@ class ClassificarEmailResponse(BaseModel):
         description="Modelo de IA utilizado para gerar a resposta (ex: gpt-3.5-turbo, gemini-1.5-flash)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "categoria": "Produtivo",
                 "confianca": 0.95,
@@ -79,6 +84,7 @@ class ClassificarEmailResponse(BaseModel):
                 "modelo_usado": "gpt-3.5-turbo"
             }
         }
+    )
 
 
 class ClassificarArquivoResponse(ClassificarEmailResponse):
@@ -89,8 +95,8 @@ class ClassificarArquivoResponse(ClassificarEmailResponse):
         description="Nome do arquivo processado"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "categoria": "Produtivo",
                 "confianca": 0.92,
@@ -102,3 +108,4 @@ class ClassificarArquivoResponse(ClassificarEmailResponse):
                 "modelo_usado": "gemini-1.5-flash"
             }
         }
+    )
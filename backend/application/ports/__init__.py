@@ -1,5 +1,31 @@
 # Application Ports (Interfaces)
-from application.ports.classificador_port import ClassificadorPort
-from application.ports.leitor_arquivo_port import LeitorArquivoPort
+# Importações preguiçosas (PEP 562): cada módulo só é carregado no primeiro acesso
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["ClassificadorPort", "LeitorArquivoPort"]
+if TYPE_CHECKING:
+    from application.ports.classificador_port import ClassificadorPort
+    from application.ports.leitor_arquivo_port import LeitorArquivoPort
+
+_MODULOS = {
+    "ClassificadorPort": "application.ports.classificador_port",
+    "LeitorArquivoPort": "application.ports.leitor_arquivo_port",
+}
+
+__all__ = [
+    "ClassificadorPort",
+    "LeitorArquivoPort",
+]
+
+
+def __getattr__(nome: str):
+    modulo = _MODULOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,24 +4,29 @@ Port (Interface) para o serviço de classificação.
 Define o contrato que qualquer implementação de classificador deve seguir.
 """
 
-from abc import ABC, abstractmethod
+from typing import List, Protocol, Sequence
 
 from domain.value_objects.classificacao_resultado import ClassificacaoResultado
 
 
-class ClassificadorPort(ABC):
+class ClassificadorPort(Protocol):
     """
     Interface para o serviço de classificação de emails.
     
     Esta abstração permite trocar a implementação do classificador
     (OpenAI, HuggingFace, etc.) sem alterar a lógica de negócio.
+    
+    Tipagem estrutural: as implementações não precisam herdar desta
+    classe, basta oferecer os mesmos métodos.
     """
     
-    @abstractmethod
-    def classificar(self, conteudo: str) -> ClassificacaoResultado:
+    async def classificar(self, conteudo: str) -> ClassificacaoResultado:
         """
         Classifica o conteúdo do email e retorna o resultado.
         
+        A classificação é I/O (chamada à API de IA), por isso é assíncrona:
+        um único worker consegue manter várias chamadas em andamento.
+        
         Args:
             conteudo: Texto do email a ser classificado
             
@@ -31,9 +36,23 @@ class ClassificadorPort(ABC):
         Raises:
             ClassificacaoException: Se ocorrer erro na classificação
         """
-        pass
+        ...
+    
+    async def classificar_lote(self, conteudos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica vários emails de forma concorrente.
+        
+        Args:
+            conteudos: Textos dos emails a serem classificados
+            
+        Returns:
+            Lista de ClassificacaoResultado, na mesma ordem dos conteúdos
+            
+        Raises:
+            ClassificacaoException: Se ocorrer erro na classificação
+        """
+        ...
     
-    @abstractmethod
     def get_modelo(self) -> str:
         """
         Retorna o nome do modelo de IA sendo utilizado.
@@ -41,9 +60,8 @@ class ClassificadorPort(ABC):
         Returns:
             Nome do modelo (ex: 'gpt-3.5-turbo', 'gemini-1.5-flash')
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_provider(self) -> str:
         """
         Retorna o nome do provedor de IA.
@@ -51,4 +69,4 @@ class ClassificadorPort(ABC):
         Returns:
             Nome do provider (ex: 'openai', 'gemini')
         """
-        pass
\ No newline at end of file
+        ...
@@ -4,24 +4,26 @@ Port (Interface) para leitura de arquivos.
 Define o contrato para leitores de diferentes formatos de arquivo.
 """
 
-from abc import ABC, abstractmethod
+from typing import BinaryIO, Protocol
 
 
-class LeitorArquivoPort(ABC):
+class LeitorArquivoPort(Protocol):
     """
     Interface para leitura de arquivos.
     
     Esta abstração permite adicionar novos formatos de arquivo
     sem alterar a lógica existente.
+    
+    Tipagem estrutural: as implementações não precisam herdar desta
+    classe, basta oferecer os mesmos métodos.
     """
     
-    @abstractmethod
-    def ler(self, arquivo: bytes) -> str:
+    def ler(self, arquivo: BinaryIO) -> str:
         """
         Extrai o texto do arquivo.
         
         Args:
-            arquivo: Conteúdo do arquivo em bytes
+            arquivo: Stream binário do arquivo, posicionado no início
             
         Returns:
             Texto extraído do arquivo
@@ -29,9 +31,17 @@ class LeitorArquivoPort(ABC):
         Raises:
             ArquivoInvalidoException: Se o arquivo não puder ser lido
         """
-        pass
+        ...
+    
+    def extensoes_suportadas(self) -> tuple[str, ...]:
+        """
+        Retorna as extensões suportadas pelo leitor.
+        
+        Returns:
+            Tupla com as extensões em minúsculas (ex: ('.txt', '.text'))
+        """
+        ...
     
-    @abstractmethod
     def suporta_extensao(self, extensao: str) -> bool:
         """
         Verifica se o leitor suporta a extensão do arquivo.
@@ -42,4 +52,4 @@ class LeitorArquivoPort(ABC):
         Returns:
             True se a extensão é suportada, False caso contrário
         """
-        pass
+        ...
@@ -1,5 +1,31 @@
 # Application Use Cases
-from application.use_cases.classificar_email_use_case import ClassificarEmailUseCase
-from application.use_cases.classificar_arquivo_use_case import ClassificarArquivoUseCase
+# Importações preguiçosas (PEP 562): cada módulo só é carregado no primeiro acesso
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["ClassificarEmailUseCase", "ClassificarArquivoUseCase"]
+if TYPE_CHECKING:
+    from application.use_cases.classificar_email_use_case import ClassificarEmailUseCase
+    from application.use_cases.classificar_arquivo_use_case import ClassificarArquivoUseCase
+
+_MODULOS = {
+    "ClassificarEmailUseCase": "application.use_cases.classificar_email_use_case",
+    "ClassificarArquivoUseCase": "application.use_cases.classificar_arquivo_use_case",
+}
+
+__all__ = [
+    "ClassificarEmailUseCase",
+    "ClassificarArquivoUseCase",
+]
+
+
+def __getattr__(nome: str):
+    modulo = _MODULOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
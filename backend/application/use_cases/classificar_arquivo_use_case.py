@@ -4,13 +4,14 @@ Use Case: Classificar Email por Arquivo.
 Caso de uso responsável por classificar um email a partir de um arquivo (.txt ou .pdf).
 """
 
+import asyncio
 import logging
-from typing import List
+from os.path import splitext
+from typing import BinaryIO, Mapping
 
 from application.ports.classificador_port import ClassificadorPort
 from application.ports.leitor_arquivo_port import LeitorArquivoPort
 from application.dtos.email_dto import ClassificarArquivoResponse
-from domain.entities.email import Email
 from domain.exceptions import (
     ConteudoInvalidoException,
     ClassificacaoException,
@@ -30,31 +31,34 @@ class ClassificarArquivoUseCase:
     do texto e classificação do conteúdo.
     """
     
+    __slots__ = ("_classificador", "_leitor_por_extensao")
+    
     def __init__(
         self,
         classificador: ClassificadorPort,
-        leitores: List[LeitorArquivoPort]
+        leitores: Mapping[str, LeitorArquivoPort]
     ):
         """
         Inicializa o use case com suas dependências.
         
         Args:
             classificador: Implementação do serviço de classificação
-            leitores: Lista de leitores de arquivo disponíveis
+            leitores: Registro extensão -> leitor (ex: {'.txt': LeitorTxt()}),
+                com extensões em minúsculas
         """
         self._classificador = classificador
-        self._leitores = leitores
+        self._leitor_por_extensao = leitores
     
-    def executar(
+    async def executar(
         self,
-        arquivo: bytes,
+        arquivo: BinaryIO,
         nome_arquivo: str
     ) -> ClassificarArquivoResponse:
         """
         Executa a classificação do email a partir de um arquivo.
         
         Args:
-            arquivo: Conteúdo do arquivo em bytes
+            arquivo: Stream binário do arquivo (lido pelo leitor sob demanda)
             nome_arquivo: Nome original do arquivo
             
         Returns:
@@ -72,34 +76,26 @@ class ClassificarArquivoUseCase:
         # Encontrar leitor apropriado
         leitor = self._encontrar_leitor(extensao)
         
-        # Extrair texto do arquivo
-        conteudo = leitor.ler(arquivo)
+        # Extrair texto do arquivo (parsing síncrono, executado fora do event loop)
+        conteudo = await asyncio.to_thread(leitor.ler, arquivo)
         
-        if not conteudo or not conteudo.strip():
+        if not conteudo or conteudo.isspace():
             raise ArquivoInvalidoException("Arquivo está vazio ou não contém texto")
         
         try:
-            # Criar entidade de domínio
-            email = Email(conteudo=conteudo)
-            
             # Obter informações do modelo sendo usado
             modelo_usado = self._classificador.get_modelo()
             provider = self._classificador.get_provider()
             
-            logger.info(f"📎 [UseCase] Classificando arquivo '{nome_arquivo}' com provider={provider}, modelo={modelo_usado}")
+            logger.info("📎 [UseCase] Classificando arquivo '%s' com provider=%s, modelo=%s", nome_arquivo, provider, modelo_usado)
             
             # Executar classificação
-            resultado = self._classificador.classificar(email.conteudo)
+            resultado = await self._classificador.classificar(conteudo)
             
-            # Retornar resposta
-            return ClassificarArquivoResponse(
-                categoria=resultado.categoria.value,
-                confianca=resultado.confianca,
-                resposta_sugerida=resultado.resposta_sugerida,
+            # Resultado já validado pelo value object: dispensa nova validação do pydantic
+            return ClassificarArquivoResponse.model_construct(
+                **resultado.para_dict(),
                 nome_arquivo=nome_arquivo,
-                assunto=resultado.assunto,
-                remetente=resultado.remetente,
-                destinatario=resultado.destinatario,
                 modelo_usado=modelo_usado
             )
         
@@ -108,13 +104,14 @@ class ClassificarArquivoUseCase:
     
     def _extrair_extensao(self, nome_arquivo: str) -> str:
         """Extrai a extensão do nome do arquivo."""
-        if '.' not in nome_arquivo:
+        extensao = splitext(nome_arquivo)[1]
+        if not extensao:
             raise FormatoNaoSuportadoException("sem extensão")
-        return '.' + nome_arquivo.rsplit('.', 1)[-1].lower()
+        return extensao.lower()
     
     def _encontrar_leitor(self, extensao: str) -> LeitorArquivoPort:
         """Encontra o leitor apropriado para a extensão."""
-        for leitor in self._leitores:
-            if leitor.suporta_extensao(extensao):
-                return leitor
-        raise FormatoNaoSuportadoException(extensao)
+        try:
+            return self._leitor_por_extensao[extensao]
+        except KeyError:
+            raise FormatoNaoSuportadoException(extensao)
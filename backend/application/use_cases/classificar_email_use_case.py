@@ -8,7 +8,6 @@ import logging
 
 from application.ports.classificador_port import ClassificadorPort
 from application.dtos.email_dto import ClassificarEmailRequest, ClassificarEmailResponse
-from domain.entities.email import Email
 from domain.exceptions import ConteudoInvalidoException, ClassificacaoException
 
 
@@ -23,6 +22,8 @@ class ClassificarEmailUseCase:
     o conteúdo e delegando a classificação para o serviço apropriado.
     """
     
+    __slots__ = ("_classificador",)
+    
     def __init__(self, classificador: ClassificadorPort):
         """
         Inicializa o use case com suas dependências.
@@ -32,7 +33,7 @@ class ClassificarEmailUseCase:
         """
         self._classificador = classificador
     
-    def executar(self, request: ClassificarEmailRequest) -> ClassificarEmailResponse:
+    async def executar(self, request: ClassificarEmailRequest) -> ClassificarEmailResponse:
         """
         Executa a classificação do email.
         
@@ -47,32 +48,29 @@ class ClassificarEmailUseCase:
             ClassificacaoException: Se ocorrer erro na classificação
         """
         try:
-            # Criar entidade de domínio (valida regras de negócio)
-            email = Email(conteudo=request.conteudo)
+            # Validar regra de negócio: conteúdo não pode estar vazio
+            conteudo = request.conteudo
+            if not conteudo or conteudo.isspace():
+                raise ConteudoInvalidoException("Conteúdo do email não pode estar vazio")
             
             # Obter informações do modelo sendo usado
             modelo_usado = self._classificador.get_modelo()
             provider = self._classificador.get_provider()
             
-            logger.info(f"📧 [UseCase] Classificando email com provider={provider}, modelo={modelo_usado}")
+            logger.info("📧 [UseCase] Classificando email com provider=%s, modelo=%s", provider, modelo_usado)
             
             # Executar classificação via porta (abstração)
-            resultado = self._classificador.classificar(email.conteudo)
+            resultado = await self._classificador.classificar(conteudo)
             
-            # Retornar DTO de resposta
-            return ClassificarEmailResponse(
-                categoria=resultado.categoria.value,
-                confianca=resultado.confianca,
-                resposta_sugerida=resultado.resposta_sugerida,
-                assunto=resultado.assunto,
-                remetente=resultado.remetente,
-                destinatario=resultado.destinatario,
+            # Resultado já validado pelo value object: dispensa nova validação do pydantic
+            return ClassificarEmailResponse.model_construct(
+                **resultado.para_dict(),
                 modelo_usado=modelo_usado
             )
         
+        except (ConteudoInvalidoException, ClassificacaoException):
+            raise
         except ValueError as e:
             raise ConteudoInvalidoException(str(e))
         except Exception as e:
-            if isinstance(e, (ConteudoInvalidoException, ClassificacaoException)):
-                raise
             raise ClassificacaoException(f"Erro inesperado: {str(e)}")
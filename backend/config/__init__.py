@@ -1,4 +1,4 @@
 # Config
-from config.settings import Settings
+from config.settings import Settings, get_settings
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "get_settings"]
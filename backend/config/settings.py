@@ -4,8 +4,11 @@ Configurações da Aplicação.
 Gerencia configurações via variáveis de ambiente.
 """
 
+from functools import lru_cache
+from typing import Any
+
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 
 class Settings(BaseSettings):
@@ -41,6 +44,10 @@ class Settings(BaseSettings):
         default="openai",
         description="Provedor de IA: 'openai' ou 'gemini'"
     )
+    local_filter_threshold: float = Field(
+        default=0.85,
+        description="Confiança mínima para o filtro local classificar sem chamar a IA (acima de 0.95 desativa)"
+    )
     
     # OpenAI
     openai_api_key: str = Field(
@@ -56,9 +63,47 @@ class Settings(BaseSettings):
         description="Modelos de fallback da OpenAI (separados por vírgula)"
     )
     openai_max_tokens: int = Field(
-        default=4000,
+        default=800,
         description="Máximo de tokens para resposta da OpenAI"
     )
+    openai_cache_size: int = Field(
+        default=10_000,
+        description="Máximo de classificações da OpenAI em cache por conteúdo (0 desativa)"
+    )
+    openai_semantic_cache_size: int = Field(
+        default=0,
+        description="Máximo de classificações no cache semântico da OpenAI, por embedding (0 desativa)"
+    )
+    openai_semantic_cache_threshold: float = Field(
+        default=0.9,
+        description="Similaridade de cosseno mínima para reaproveitar a classificação de um email parecido"
+    )
+    openai_long_model: str = Field(
+        default="",
+        description="Modelo da OpenAI para emails longos (vazio usa sempre o modelo principal)"
+    )
+    openai_long_model_min_tokens: int = Field(
+        default=300,
+        description="Tamanho estimado, em tokens, a partir do qual o email usa o modelo para emails longos"
+    )
+    openai_rpm_limit: int = Field(
+        default=500,
+        description="Cota de requisições por minuto da conta OpenAI (0 desativa o limitador)"
+    )
+    openai_tpm_limit: int = Field(
+        default=200_000,
+        description="Cota de tokens de entrada por minuto da conta OpenAI (0 desativa o limitador)"
+    )
+    openai_dynamic_batch: bool = Field(
+        default=False,
+        description="Agrupar requisições concorrentes em uma única chamada à OpenAI"
+    )
+    
+    # Cache de classificações
+    classification_cache_path: str = Field(
+        default="",
+        description="Arquivo SQLite para persistir o cache de classificações (vazio mantém só em memória)"
+    )
     
     # Google Gemini
     gemini_api_key: str = Field(
@@ -77,27 +122,59 @@ class Settings(BaseSettings):
         default=8192,
         description="Máximo de tokens para resposta do Gemini"
     )
+    gemini_cache_size: int = Field(
+        default=10_000,
+        description="Máximo de classificações do Gemini em cache por conteúdo (0 desativa)"
+    )
+    gemini_two_phase: bool = Field(
+        default=False,
+        description="Classificar primeiro e gerar a resposta só para emails produtivos"
+    )
+    gemini_dynamic_batch: bool = Field(
+        default=False,
+        description="Agrupar requisições concorrentes em uma única chamada ao Gemini"
+    )
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
     
+    # Listas derivadas, calculadas uma única vez após a validação
+    _cors_origins_list: list[str] = PrivateAttr(default_factory=list)
+    _openai_fallback_list: list[str] = PrivateAttr(default_factory=list)
+    _gemini_fallback_list: list[str] = PrivateAttr(default_factory=list)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Pré-calcula as listas derivadas das strings separadas por vírgula."""
+        self._cors_origins_list = _separar_lista(self.cors_origins)
+        self._openai_fallback_list = _separar_lista(self.openai_models_fallback)
+        self._gemini_fallback_list = _separar_lista(self.gemini_models_fallback)
+    
     @property
     def cors_origins_list(self) -> list[str]:
         """Retorna a lista de origens CORS."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+        return self._cors_origins_list
     
     @property
     def openai_fallback_list(self) -> list[str]:
         """Retorna a lista de modelos de fallback da OpenAI."""
-        if not self.openai_models_fallback:
-            return []
-        return [model.strip() for model in self.openai_models_fallback.split(",")]
+        return self._openai_fallback_list
     
     @property
     def gemini_fallback_list(self) -> list[str]:
         """Retorna a lista de modelos de fallback do Gemini."""
-        if not self.gemini_models_fallback:
-            return []
-        return [model.strip() for model in self.gemini_models_fallback.split(",")]
+        return self._gemini_fallback_list
+
+
+def _separar_lista(valor: str) -> list[str]:
+    """Separa uma string por vírgulas, removendo espaços."""
+    if not valor:
+        return []
+    return [item.strip() for item in valor.split(",")]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Retorna as configurações da aplicação (instância única por processo)."""
+    return Settings()
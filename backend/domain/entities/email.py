@@ -15,7 +15,7 @@ class CategoriaEmail(Enum):
     IMPRODUTIVO = "Improdutivo"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email:
     """
     Entidade Email - representa um email a ser classificado.
@@ -34,7 +34,7 @@ class Email:
     
     def __post_init__(self):
         """Valida os dados da entidade após inicialização."""
-        if not self.conteudo or not self.conteudo.strip():
+        if not self.conteudo or self.conteudo.isspace():
             raise ValueError("Conteúdo do email não pode estar vazio")
     
     @property
@@ -0,0 +1,45 @@
+"""
+Value Object para resultado parcial de uma classificação em streaming.
+
+Permite entregar categoria e confiança assim que o modelo as produz,
+antes de a resposta sugerida terminar de ser gerada.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from domain.entities.email import CategoriaEmail
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+
+
+@dataclass(frozen=True, slots=True)
+class ClassificacaoParcial:
+    """
+    Value Object imutável para um evento de classificação em streaming.
+    
+    Atributos:
+        categoria: Categoria já identificada no texto recebido
+        confianca: Confiança já identificada no texto recebido
+        resultado: Resultado completo (presente apenas no último evento)
+    
+    Raises:
+        ValueError: Se a confiança não estiver entre 0 e 1
+    """
+    categoria: CategoriaEmail
+    confianca: float
+    resultado: Optional[ClassificacaoResultado] = field(default=None)
+    
+    def __post_init__(self):
+        """Valida os dados do value object após inicialização."""
+        if not 0 <= self.confianca <= 1:
+            raise ValueError("Confiança deve estar entre 0 e 1")
+    
+    @property
+    def completo(self) -> bool:
+        """Retorna True se o evento traz o resultado completo."""
+        return self.resultado is not None
+    
+    @classmethod
+    def de_resultado(cls, resultado: ClassificacaoResultado) -> "ClassificacaoParcial":
+        """Cria o evento final a partir do resultado completo."""
+        return cls(categoria=resultado.categoria, confianca=resultado.confianca, resultado=resultado)
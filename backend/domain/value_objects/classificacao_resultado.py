@@ -10,7 +10,7 @@ from typing import Optional
 from domain.entities.email import CategoriaEmail
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassificacaoResultado:
     """
     Value Object imutável para resultado da classificação.
@@ -38,7 +38,7 @@ class ClassificacaoResultado:
         if not 0 <= self.confianca <= 1:
             raise ValueError("Confiança deve estar entre 0 e 1")
         
-        if not self.resposta_sugerida or not self.resposta_sugerida.strip():
+        if not self.resposta_sugerida or self.resposta_sugerida.isspace():
             raise ValueError("Resposta sugerida não pode estar vazia")
     
     @property
@@ -50,3 +50,19 @@ class ClassificacaoResultado:
     def alta_confianca(self) -> bool:
         """Retorna True se a confiança é maior que 80%."""
         return self.confianca >= 0.8
+    
+    def para_dict(self) -> dict:
+        """
+        Retorna os campos como dicionário de tipos primitivos (categoria como texto).
+        
+        Montado campo a campo: dataclasses.asdict() copia recursivamente e é
+        bem mais lento.
+        """
+        return {
+            "categoria": self.categoria.value,
+            "confianca": self.confianca,
+            "resposta_sugerida": self.resposta_sugerida,
+            "assunto": self.assunto,
+            "remetente": self.remetente,
+            "destinatario": self.destinatario,
+        }
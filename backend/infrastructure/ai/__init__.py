@@ -1,11 +1,43 @@
 # AI - Integração com APIs de Inteligência Artificial
-from infrastructure.ai.openai_classificador import OpenAIClassificador
-from infrastructure.ai.gemini_classificador import GeminiClassificador
-from infrastructure.ai.classificador_factory import ClassificadorFactory, AIProvider
+# Importações preguiçosas (PEP 562): o SDK de um provedor só é carregado quando
+# o classificador correspondente é usado
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from infrastructure.ai.openai_classificador import OpenAIClassificador
+    from infrastructure.ai.gemini_classificador import GeminiClassificador
+    from infrastructure.ai.dynamic_batch_classificador import DynamicBatchClassificador
+    from infrastructure.ai.batch_classificador import BatchClassificador
+    from infrastructure.ai.classificador_factory import ClassificadorFactory, AIProvider
+
+_MODULOS = {
+    "OpenAIClassificador": "infrastructure.ai.openai_classificador",
+    "GeminiClassificador": "infrastructure.ai.gemini_classificador",
+    "DynamicBatchClassificador": "infrastructure.ai.dynamic_batch_classificador",
+    "BatchClassificador": "infrastructure.ai.batch_classificador",
+    "ClassificadorFactory": "infrastructure.ai.classificador_factory",
+    "AIProvider": "infrastructure.ai.classificador_factory",
+}
 
 __all__ = [
     "OpenAIClassificador",
-    "GeminiClassificador", 
+    "GeminiClassificador",
+    "DynamicBatchClassificador",
+    "BatchClassificador",
     "ClassificadorFactory",
     "AIProvider"
 ]
+
+
+def __getattr__(nome: str):
+    modulo = _MODULOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
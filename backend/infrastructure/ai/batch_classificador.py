@@ -0,0 +1,251 @@
+"""
+Classificador OpenAI para lotes offline via Batch API.
+
+Para cargas que não dependem de latência (importação de uma caixa de
+entrada, reclassificação noturna): custa metade do preço das chamadas
+síncronas e não consome o limite de requisições, ao custo de um retorno
+que pode levar horas.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from domain.exceptions import ClassificacaoException
+from infrastructure.ai.cache_classificacao import CacheClassificacao
+from infrastructure.ai.cache_semantico import CacheSemantico
+from infrastructure.ai.conversor_resposta import converter_resposta
+from infrastructure.ai.json_utils import carregar_json, gerar_json
+from infrastructure.ai.openai_classificador import OpenAIClassificador
+from infrastructure.nlp.classificador_heuristico import ClassificadorHeuristico
+from infrastructure.nlp.preprocessador import PreprocessadorTexto
+
+
+logger = logging.getLogger(__name__)
+
+
+_ENDPOINT = "/v1/chat/completions"
+
+# Status em que o lote ainda pode terminar com sucesso
+_STATUS_EM_ANDAMENTO = frozenset({"validating", "in_progress", "finalizing"})
+
+
+class BatchClassificador(OpenAIClassificador):
+    """
+    Classificador OpenAI cujo classificar_lote usa a Batch API.
+    
+    classificar() de um único email continua síncrono, pela API de chat.
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        preprocessador: Optional[PreprocessadorTexto] = None,
+        modelo: str = "gpt-4o-mini",
+        max_tokens: int = 800,
+        max_concurrency: int = 8,
+        cache: Optional[CacheClassificacao] = None,
+        cache_semantico: Optional[CacheSemantico] = None,
+        modelo_longo: Optional[str] = None,
+        tokens_modelo_longo: int = 300,
+        rpm_limit: Optional[int] = 500,
+        tpm_limit: Optional[int] = 200_000,
+        limiar_filtro_local: float = ClassificadorHeuristico.LIMIAR_PADRAO,
+        intervalo_consulta_s: float = 60.0
+    ):
+        """
+        Inicializa o classificador.
+        
+        Args:
+            api_key: Chave de API da OpenAI
+            preprocessador: Instância do preprocessador de texto (opcional)
+            modelo: Modelo da OpenAI a ser usado
+            max_tokens: Máximo de tokens para a resposta
+            max_concurrency: Máximo de chamadas simultâneas ao reclassificar itens com falha
+            cache: Cache de classificações por conteúdo, usado na API síncrona (opcional)
+            cache_semantico: Cache de emails parecidos, usado na API síncrona (opcional)
+            modelo_longo: Modelo usado para emails longos (None usa sempre o modelo)
+            tokens_modelo_longo: Tamanho estimado, em tokens, a partir do qual
+                o email vai para modelo_longo
+            rpm_limit: Cota de requisições por minuto da API síncrona (None desativa o limitador)
+            tpm_limit: Cota de tokens de entrada por minuto da API síncrona (None desativa o limitador)
+            limiar_filtro_local: Confiança mínima para o filtro local decidir sem a API
+            intervalo_consulta_s: Intervalo entre as consultas ao status do lote
+        """
+        super().__init__(
+            api_key=api_key,
+            preprocessador=preprocessador,
+            modelo=modelo,
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            cache_semantico=cache_semantico,
+            modelo_longo=modelo_longo,
+            tokens_modelo_longo=tokens_modelo_longo,
+            rpm_limit=rpm_limit,
+            tpm_limit=tpm_limit,
+            limiar_filtro_local=limiar_filtro_local
+        )
+        self._intervalo_consulta_s = intervalo_consulta_s
+    
+    async def _classificar_pela_api(self, textos_processados: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica vários textos já pré-processados em um job da Batch API.
+        
+        Chamado por classificar_lote só com os emails que o filtro local e o
+        cache não resolveram. Envia um arquivo JSONL com uma requisição por email, aguarda o fim do
+        job e lê o arquivo de saída. Itens que falharem no job são
+        classificados pela API síncrona.
+        
+        Args:
+            textos_processados: Textos pré-processados dos emails
+        
+        Returns:
+            Lista de ClassificacaoResultado, na mesma ordem dos textos
+        
+        Raises:
+            ClassificacaoException: Se o job falhar, expirar ou for cancelado
+        """
+        if not textos_processados:
+            return []
+        
+        try:
+            respostas = await self._executar_lote(textos_processados)
+        except ClassificacaoException:
+            raise
+        except Exception as e:
+            logger.error("❌ [OpenAI Batch] Erro ao classificar lote com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação em lote: {str(e)}")
+        
+        resultados: List[Optional[ClassificacaoResultado]] = [None] * len(textos_processados)
+        for indice, resposta in respostas.items():
+            try:
+                resultados[indice] = converter_resposta(resposta)
+            except (TypeError, ValueError):
+                logger.warning("⚠️ [OpenAI Batch] Resposta inválida para o item %s", indice)
+        
+        pendentes = [indice for indice, resultado in enumerate(resultados) if resultado is None]
+        if pendentes:
+            logger.warning("⚠️ [OpenAI Batch] %s itens sem resultado; reclassificando pela API síncrona", len(pendentes))
+            refeitos = await super()._classificar_pela_api([textos_processados[indice] for indice in pendentes])
+            for indice, resultado in zip(pendentes, refeitos):
+                resultados[indice] = resultado
+        
+        return resultados
+    
+    async def _executar_lote(self, textos_processados: Sequence[str]) -> Dict[int, dict]:
+        """
+        Envia o job, aguarda sua conclusão e retorna as respostas por índice.
+        
+        Args:
+            textos_processados: Textos pré-processados dos emails
+        
+        Returns:
+            Dicionário índice → resposta decodificada, apenas para os itens com sucesso
+        """
+        lote_id = await self._enviar_textos(textos_processados)
+        await self.aguardar_lote(lote_id)
+        return await self.coletar_lote(lote_id)
+    
+    async def enviar_lote(self, conteudos: Sequence[str]) -> str:
+        """
+        Envia um job da Batch API sem aguardar o resultado.
+        
+        Para jobs que sobrevivem ao processo: guarde o id retornado e chame
+        coletar_lote mais tarde. O custom_id de cada requisição é o índice
+        do email em conteudos.
+        
+        Args:
+            conteudos: Textos dos emails a serem classificados
+        
+        Returns:
+            Id do lote criado
+        """
+        return await self._enviar_textos([await self._preparar_texto(conteudo) for conteudo in conteudos])
+    
+    async def _enviar_textos(self, textos_processados: Sequence[str]) -> str:
+        """Cria o arquivo JSONL e o job da Batch API para textos já pré-processados."""
+        linhas = []
+        for indice, texto in enumerate(textos_processados):
+            corpo = self._criar_requisicao(texto)
+            # No arquivo do lote não há SDK: os parâmetros extras vão no próprio corpo
+            corpo.update(corpo.pop("extra_body", {}))
+            linhas.append(gerar_json({
+                "custom_id": str(indice),
+                "method": "POST",
+                "url": _ENDPOINT,
+                "body": corpo
+            }))
+        
+        arquivo = await self._client.files.create(
+            file=("lote.jsonl", b"\n".join(linhas)),
+            purpose="batch"
+        )
+        lote = await self._client.batches.create(
+            input_file_id=arquivo.id,
+            endpoint=_ENDPOINT,
+            completion_window="24h"
+        )
+        logger.info("📦 [OpenAI Batch] Lote %s criado com %s emails", lote.id, len(textos_processados))
+        return lote.id
+    
+    async def aguardar_lote(self, lote_id: str) -> None:
+        """
+        Consulta o lote a cada intervalo_consulta_s até que ele termine.
+        
+        Args:
+            lote_id: Id retornado por enviar_lote
+        
+        Raises:
+            ClassificacaoException: Se o lote falhar, expirar ou for cancelado
+        """
+        lote = await self._client.batches.retrieve(lote_id)
+        while lote.status in _STATUS_EM_ANDAMENTO:
+            await asyncio.sleep(self._intervalo_consulta_s)
+            lote = await self._client.batches.retrieve(lote_id)
+        
+        if lote.status != "completed":
+            raise ClassificacaoException(f"Lote {lote_id} terminou com status '{lote.status}'")
+    
+    async def coletar_lote(self, lote_id: str) -> Dict[int, dict]:
+        """
+        Lê as respostas de um lote concluído.
+        
+        Args:
+            lote_id: Id retornado por enviar_lote
+        
+        Returns:
+            Dicionário índice → resposta decodificada, apenas para os itens com sucesso
+        
+        Raises:
+            ClassificacaoException: Se o lote ainda não tiver sido concluído
+        """
+        lote = await self._client.batches.retrieve(lote_id)
+        if lote.status != "completed":
+            raise ClassificacaoException(f"Lote {lote_id} ainda não concluído (status '{lote.status}')")
+        
+        if not lote.output_file_id:
+            return {}
+        
+        saida = await self._client.files.content(lote.output_file_id)
+        return self._ler_saida(saida.text)
+    
+    def _ler_saida(self, conteudo: str) -> Dict[int, dict]:
+        """Decodifica o JSONL de saída do job, ignorando itens com erro."""
+        respostas: Dict[int, dict] = {}
+        for linha in conteudo.splitlines():
+            if not linha.strip():
+                continue
+            item = carregar_json(linha)
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                continue
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+                resposta = carregar_json(content)
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            if isinstance(resposta, dict):
+                respostas[int(item["custom_id"])] = resposta
+        return respostas
@@ -0,0 +1,73 @@
+"""
+Cache de classificações por conteúdo.
+
+Evita chamar a API de IA novamente para emails repetidos
+(respostas automáticas, newsletters, reenvios).
+"""
+
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Optional
+
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+
+
+class CacheClassificacao:
+    """
+    Cache LRU em memória de ClassificacaoResultado, indexado pelo hash do conteúdo.
+    
+    Usado apenas a partir do event loop, então dispensa lock. Como o value
+    object é imutável, a mesma instância pode ser devolvida a várias requisições.
+    Os métodos são assíncronos para que subclasses com armazenamento externo
+    (ver CacheClassificacaoPersistente) não bloqueiem o event loop.
+    """
+    
+    def __init__(self, tamanho_maximo: int = 10_000, namespace: str = ""):
+        """
+        Inicializa o cache.
+        
+        Args:
+            tamanho_maximo: Número máximo de classificações mantidas
+            namespace: Prefixo das chaves (ex.: modelo e versão do prompt), para
+                que classificações de outra configuração não sejam reaproveitadas
+        """
+        self._tamanho_maximo = tamanho_maximo
+        self._namespace = namespace.encode("utf-8") + b"\x00" if namespace else b""
+        self._itens: "OrderedDict[bytes, ClassificacaoResultado]" = OrderedDict()
+    
+    async def obter(self, conteudo: str) -> Optional[ClassificacaoResultado]:
+        """Retorna a classificação em cache para o conteúdo, se houver."""
+        return self._obter_da_memoria(conteudo)
+    
+    async def guardar(self, conteudo: str, resultado: ClassificacaoResultado) -> None:
+        """
+        Guarda a classificação do conteúdo.
+        
+        Apenas resultados de alta confiança são guardados, para que uma
+        classificação duvidosa não seja repetida para todas as cópias do email.
+        """
+        if resultado.alta_confianca:
+            self._guardar_na_memoria(conteudo, resultado)
+    
+    def _obter_da_memoria(self, conteudo: str) -> Optional[ClassificacaoResultado]:
+        """Consulta apenas o LRU em memória."""
+        chave = self._chave(conteudo)
+        resultado = self._itens.get(chave)
+        if resultado is not None:
+            self._itens.move_to_end(chave)
+        return resultado
+    
+    def _guardar_na_memoria(self, conteudo: str, resultado: ClassificacaoResultado) -> None:
+        """Guarda no LRU em memória, descartando a entrada menos usada se cheio."""
+        chave = self._chave(conteudo)
+        self._itens[chave] = resultado
+        self._itens.move_to_end(chave)
+        if len(self._itens) > self._tamanho_maximo:
+            self._itens.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._itens)
+    
+    def _chave(self, conteudo: str) -> bytes:
+        """Gera a chave do cache a partir do namespace e do conteúdo."""
+        return blake2b(self._namespace + conteudo.encode("utf-8"), digest_size=16).digest()
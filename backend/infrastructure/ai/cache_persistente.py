@@ -0,0 +1,145 @@
+"""
+Cache de classificações persistido em SQLite.
+
+Mantém as classificações entre reinícios e entre workers do mesmo host:
+reimportar uma caixa de entrada não chama a API de novo para emails já
+classificados.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from typing import Optional
+
+from domain.entities.email import CategoriaEmail
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from infrastructure.ai.cache_classificacao import CacheClassificacao
+from infrastructure.ai.json_utils import carregar_json, gerar_json
+
+
+logger = logging.getLogger(__name__)
+
+# A cada quantas gravações o banco é podado
+_INTERVALO_PODA = 1_000
+
+
+class CacheClassificacaoPersistente(CacheClassificacao):
+    """
+    Cache LRU em memória com um arquivo SQLite por trás.
+    
+    As consultas passam primeiro pela memória; só as ausências vão ao banco,
+    uma busca por chave primária, executada em thread para não bloquear o
+    event loop. O modo WAL permite que vários workers leiam enquanto outro
+    grava. Falhas no banco são registradas e tratadas como ausência: o cache
+    nunca impede a classificação.
+    
+    O banco guarda no máximo tamanho_maximo_banco linhas: a cada
+    _INTERVALO_PODA gravações deste processo, as mais antigas (pela ordem de
+    gravação) são apagadas.
+    """
+    
+    def __init__(
+        self,
+        caminho: str,
+        tamanho_maximo: int = 10_000,
+        namespace: str = "",
+        tamanho_maximo_banco: int = 100_000
+    ):
+        """
+        Inicializa o cache, criando o banco se necessário.
+        
+        Args:
+            caminho: Caminho do arquivo SQLite
+            tamanho_maximo: Número máximo de classificações mantidas em memória
+            namespace: Prefixo das chaves (ex.: modelo e versão do prompt)
+            tamanho_maximo_banco: Número máximo de classificações mantidas no banco
+        """
+        super().__init__(tamanho_maximo=tamanho_maximo, namespace=namespace)
+        self._tamanho_maximo_banco = tamanho_maximo_banco
+        self._gravacoes = 0
+        # A conexão é usada pelas threads de asyncio.to_thread, uma de cada vez
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False, isolation_level=None)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS classificacoes (chave BLOB PRIMARY KEY, valor BLOB NOT NULL)"
+        )
+    
+    async def obter(self, conteudo: str) -> Optional[ClassificacaoResultado]:
+        """Retorna a classificação em cache para o conteúdo, da memória ou do banco."""
+        resultado = self._obter_da_memoria(conteudo)
+        if resultado is not None:
+            return resultado
+        
+        chave = self._chave(conteudo)
+        try:
+            valor = await asyncio.to_thread(self._ler, chave)
+        except sqlite3.Error as e:
+            logger.warning("⚠️ [Cache] Falha ao ler o cache persistente: %s", e)
+            return None
+        if valor is None:
+            return None
+        
+        try:
+            dados = carregar_json(valor)
+            dados["categoria"] = CategoriaEmail(dados["categoria"])
+            resultado = ClassificacaoResultado(**dados)
+        except (ValueError, KeyError, TypeError) as e:
+            # Linha corrompida ou de um formato antigo: descarta para não tentar de novo
+            logger.warning("⚠️ [Cache] Entrada inválida no cache persistente, descartada: %s", e)
+            try:
+                await asyncio.to_thread(self._apagar, chave)
+            except sqlite3.Error as erro:
+                logger.warning("⚠️ [Cache] Falha ao apagar entrada do cache persistente: %s", erro)
+            return None
+        
+        self._guardar_na_memoria(conteudo, resultado)
+        return resultado
+    
+    async def guardar(self, conteudo: str, resultado: ClassificacaoResultado) -> None:
+        """Guarda a classificação na memória e no banco (apenas alta confiança)."""
+        if not resultado.alta_confianca:
+            return
+        
+        self._guardar_na_memoria(conteudo, resultado)
+        self._gravacoes += 1
+        podar = self._gravacoes % _INTERVALO_PODA == 0
+        try:
+            await asyncio.to_thread(
+                self._gravar, self._chave(conteudo), gerar_json(resultado.para_dict()), podar
+            )
+        except sqlite3.Error as e:
+            logger.warning("⚠️ [Cache] Falha ao gravar o cache persistente: %s", e)
+    
+    def _ler(self, chave: bytes) -> Optional[bytes]:
+        """Busca o valor da chave no banco (executado fora do event loop)."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT valor FROM classificacoes WHERE chave = ?", (chave,)
+            ).fetchone()
+        return linha[0] if linha is not None else None
+    
+    def _apagar(self, chave: bytes) -> None:
+        """Remove a chave do banco (executado fora do event loop)."""
+        with self._lock:
+            self._conexao.execute("DELETE FROM classificacoes WHERE chave = ?", (chave,))
+    
+    def _gravar(self, chave: bytes, valor: bytes, podar: bool) -> None:
+        """
+        Grava a chave no banco e, se pedido, apaga as linhas mais antigas.
+        
+        INSERT OR REPLACE reinsere a linha com um rowid novo, então o rowid
+        acompanha a ordem de gravação e a poda mantém as mais recentes.
+        """
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO classificacoes (chave, valor) VALUES (?, ?)", (chave, valor)
+            )
+            if podar:
+                self._conexao.execute(
+                    "DELETE FROM classificacoes WHERE rowid <= "
+                    "(SELECT MAX(rowid) FROM classificacoes) - ?",
+                    (self._tamanho_maximo_banco,)
+                )
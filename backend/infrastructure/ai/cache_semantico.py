@@ -0,0 +1,119 @@
+"""
+Cache semântico de classificações.
+
+Reaproveita a classificação de emails parecidos, e não só idênticos (mesmo
+modelo de newsletter ou resposta automática com outro nome ou data), pela
+similaridade de cosseno entre os embeddings do texto.
+
+Só a categoria e a confiança são guardadas: assunto, remetente, destinatário
+e resposta sugerida pertencem ao email original e não podem ser entregues
+para o email de outra pessoa.
+"""
+
+import math
+from collections import OrderedDict
+from itertools import count
+from operator import mul
+from typing import List, Optional, Sequence, Tuple
+
+from domain.entities.email import CategoriaEmail
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+
+try:
+    # numpy é opcional: compara o embedding com todo o cache em uma única operação
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+
+Vetor = Tuple[float, ...]
+Classificacao = Tuple[CategoriaEmail, float]
+
+
+class CacheSemantico:
+    """
+    Cache LRU em memória de (categoria, confiança), indexado por embedding.
+    
+    Os vetores são normalizados ao entrar, então o produto escalar é a
+    similaridade de cosseno. A busca é exaustiva: com alguns milhares de
+    itens ainda custa bem menos que uma chamada ao modelo.
+    
+    Usado apenas a partir do event loop, então dispensa lock.
+    """
+    
+    def __init__(self, limiar: float = 0.9, tamanho_maximo: int = 1_000):
+        """
+        Inicializa o cache.
+        
+        Args:
+            limiar: Similaridade de cosseno mínima para reaproveitar uma classificação
+            tamanho_maximo: Número máximo de classificações mantidas
+        """
+        self._limiar = limiar
+        self._tamanho_maximo = tamanho_maximo
+        self._itens: "OrderedDict[int, Tuple[Vetor, Classificacao]]" = OrderedDict()
+        self._ids = count()
+        # Matriz dos vetores (numpy), refeita só quando o conjunto de itens muda
+        self._matriz = None
+        self._ids_matriz: List[int] = []
+    
+    def obter(self, embedding: Sequence[float]) -> Optional[Classificacao]:
+        """
+        Retorna a classificação do item mais parecido, se a similaridade atingir o limiar.
+        
+        Args:
+            embedding: Embedding do texto pré-processado do email
+        
+        Returns:
+            Categoria e confiança em cache, ou None
+        """
+        if not self._itens:
+            return None
+        
+        vetor = _normalizar(embedding)
+        if np is not None:
+            chave, similaridade = self._mais_parecido_numpy(vetor)
+        else:
+            chave, similaridade = max(
+                ((chave, sum(map(mul, vetor, item[0]))) for chave, item in self._itens.items()),
+                key=lambda par: par[1]
+            )
+        
+        if similaridade < self._limiar:
+            return None
+        
+        self._itens.move_to_end(chave)
+        return self._itens[chave][1]
+    
+    def guardar(self, embedding: Sequence[float], resultado: ClassificacaoResultado) -> None:
+        """
+        Guarda a categoria e a confiança do resultado associadas ao embedding.
+        
+        Apenas resultados de alta confiança são guardados, como no cache exato.
+        """
+        if not resultado.alta_confianca:
+            return
+        
+        self._itens[next(self._ids)] = (_normalizar(embedding), (resultado.categoria, resultado.confianca))
+        if len(self._itens) > self._tamanho_maximo:
+            self._itens.popitem(last=False)
+        self._matriz = None
+    
+    def __len__(self) -> int:
+        return len(self._itens)
+    
+    def _mais_parecido_numpy(self, vetor: Vetor) -> Tuple[int, float]:
+        """Busca o item mais parecido com uma multiplicação matriz-vetor."""
+        if self._matriz is None:
+            self._ids_matriz = list(self._itens)
+            self._matriz = np.array([self._itens[chave][0] for chave in self._ids_matriz])
+        
+        similaridades = self._matriz @ np.asarray(vetor)
+        indice = int(similaridades.argmax())
+        return self._ids_matriz[indice], float(similaridades[indice])
+
+
+def _normalizar(embedding: Sequence[float]) -> Vetor:
+    """Normaliza o vetor para norma 1."""
+    norma = math.sqrt(sum(valor * valor for valor in embedding)) or 1.0
+    return tuple(valor / norma for valor in embedding)
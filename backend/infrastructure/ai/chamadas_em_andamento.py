@@ -0,0 +1,98 @@
+"""
+Coalescência de classificações simultâneas do mesmo conteúdo.
+
+Cópias de um email que chegam juntas (reenvios, listas de distribuição)
+passam pelo cache antes que a primeira classificação termine; sem isso,
+cada uma faria a sua própria chamada à API de IA.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+
+class ChamadasEmAndamento(Generic[T]):
+    """
+    Compartilha o resultado de chamadas com a mesma chave que estão em andamento.
+    
+    A primeira requisição de uma chave dispara a chamada; as seguintes, até
+    ela terminar, aguardam o mesmo resultado (ou a mesma exceção). Usado
+    apenas a partir do event loop, então dispensa lock.
+    """
+    
+    def __init__(self):
+        """Inicializa o registro de chamadas em andamento."""
+        self._tarefas: Dict[Hashable, "asyncio.Future[T]"] = {}
+    
+    async def executar(self, chave: Hashable, chamada: Callable[[], Awaitable[T]]) -> T:
+        """
+        Executa a chamada ou aguarda a que já está em andamento para a chave.
+        
+        A chamada compartilhada é protegida com asyncio.shield: se uma das
+        requisições for cancelada (cliente desconectou), as demais seguem
+        aguardando o resultado.
+        
+        Args:
+            chave: Identifica chamadas equivalentes (ex.: o texto pré-processado)
+            chamada: Fábrica da corrotina, usada apenas se não houver chamada em andamento
+        
+        Returns:
+            Resultado da chamada
+        """
+        tarefa = self._tarefas.get(chave)
+        if tarefa is None:
+            tarefa = asyncio.ensure_future(chamada())
+            self._registrar(chave, tarefa)
+        return await asyncio.shield(tarefa)
+    
+    async def executar_grupo(
+        self,
+        chaves: Sequence[Hashable],
+        chamada: Callable[[List[Hashable]], Awaitable[Sequence[T]]]
+    ) -> List[T]:
+        """
+        Executa uma única chamada para as chaves que ainda não estão em andamento.
+        
+        As chaves já em andamento aguardam a chamada existente; as demais vão
+        juntas para a chamada em grupo, e cada uma é registrada com o seu
+        resultado, então executar() e outros grupos com a mesma chave aguardam
+        este grupo em vez de chamar a API de novo.
+        
+        Args:
+            chaves: Chaves dos itens (ex.: os textos pré-processados)
+            chamada: Recebe as chaves novas, sem repetição, e devolve um resultado
+                por chave, na mesma ordem
+        
+        Returns:
+            Resultados na mesma ordem das chaves
+        """
+        novas = [chave for chave in dict.fromkeys(chaves) if chave not in self._tarefas]
+        if novas:
+            grupo = asyncio.ensure_future(chamada(novas))
+            for indice, chave in enumerate(novas):
+                self._registrar(chave, asyncio.ensure_future(_item(grupo, indice)))
+        
+        tarefas = [self._tarefas[chave] for chave in chaves]
+        return list(await asyncio.gather(*(asyncio.shield(tarefa) for tarefa in tarefas)))
+    
+    def _registrar(self, chave: Hashable, tarefa: "asyncio.Future[T]") -> None:
+        """Registra a chamada em andamento até que ela termine."""
+        self._tarefas[chave] = tarefa
+        tarefa.add_done_callback(lambda concluida: self._concluir(chave, concluida))
+    
+    def _concluir(self, chave: Hashable, tarefa: "asyncio.Future[T]") -> None:
+        """Remove a chamada concluída do registro."""
+        self._tarefas.pop(chave, None)
+        # Marca a exceção como recuperada mesmo se todas as requisições foram canceladas
+        if not tarefa.cancelled():
+            tarefa.exception()
+    
+    def __len__(self) -> int:
+        return len(self._tarefas)
+
+
+async def _item(grupo: "asyncio.Future[Sequence[T]]", indice: int) -> T:
+    """Extrai o resultado de um item da chamada em grupo."""
+    return (await grupo)[indice]
@@ -8,8 +8,9 @@ from enum import Enum
 from typing import Optional
 
 from application.ports.classificador_port import ClassificadorPort
-from infrastructure.ai.openai_classificador import OpenAIClassificador
-from infrastructure.ai.gemini_classificador import GeminiClassificador
+from infrastructure.ai.dynamic_batch_classificador import DynamicBatchClassificador
+from infrastructure.ai.cache_classificacao import CacheClassificacao
+from infrastructure.ai.cache_semantico import CacheSemantico
 from infrastructure.nlp.preprocessador import PreprocessadorTexto
 
 
@@ -32,7 +33,18 @@ class ClassificadorFactory:
         api_key: str,
         modelo: Optional[str] = None,
         preprocessador: Optional[PreprocessadorTexto] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 8,
+        enable_dynamic_batch: bool = False,
+        cache: Optional[CacheClassificacao] = None,
+        cache_semantico: Optional[CacheSemantico] = None,
+        enable_two_phase: bool = False,
+        enable_batch_api: bool = False,
+        modelo_longo: Optional[str] = None,
+        tokens_modelo_longo: int = 300,
+        rpm_limit: Optional[int] = None,
+        tpm_limit: Optional[int] = None,
+        limiar_filtro_local: Optional[float] = None
     ) -> ClassificadorPort:
         """
         Cria uma instância do classificador baseado no provider.
@@ -43,30 +55,74 @@ class ClassificadorFactory:
             modelo: Modelo específico a ser usado (opcional)
             preprocessador: Preprocessador de texto (opcional)
             max_tokens: Máximo de tokens para resposta (opcional)
-            
+            max_concurrency: Máximo de chamadas simultâneas em lote
+            enable_dynamic_batch: Agrupa chamadas concorrentes em uma só
+            cache: Cache de classificações compartilhado
+            cache_semantico: Cache de classificações de emails parecidos (apenas OpenAI)
+            enable_two_phase: Gera a resposta só para produtivos, em uma segunda chamada (apenas Gemini)
+            enable_batch_api: Classifica lotes pela Batch API, para jobs offline (apenas OpenAI)
+            modelo_longo: Modelo para emails longos (apenas OpenAI)
+            tokens_modelo_longo: Tamanho, em tokens, a partir do qual usar modelo_longo (apenas OpenAI)
+            rpm_limit: Cota de requisições por minuto (None usa o padrão do provedor, 0 desativa)
+            tpm_limit: Cota de tokens de entrada por minuto (None usa o padrão do provedor, 0 desativa)
+            limiar_filtro_local: Confiança mínima para o filtro local decidir sem a API (None usa o padrão)
+        
         Returns:
             Instância do classificador
-            
+        
         Raises:
             ValueError: Se o provider não for suportado
         """
         preprocessador = preprocessador or PreprocessadorTexto()
+        limites = {
+            nome: valor
+            for nome, valor in (
+                ("rpm_limit", rpm_limit),
+                ("tpm_limit", tpm_limit),
+                ("limiar_filtro_local", limiar_filtro_local),
+            )
+            if valor is not None
+        }
         
+        # Os adaptadores são importados só no ramo do provedor escolhido: cada
+        # SDK leva centenas de ms para carregar
         if provider == AIProvider.OPENAI:
-            return OpenAIClassificador(
+            from infrastructure.ai.openai_classificador import OpenAIClassificador
+            from infrastructure.ai.batch_classificador import BatchClassificador
+            
+            classe = BatchClassificador if enable_batch_api else OpenAIClassificador
+            classificador = classe(
                 api_key=api_key,
                 preprocessador=preprocessador,
                 modelo=modelo or "gpt-4o-mini",
-                max_tokens=max_tokens or 4000
+                max_tokens=max_tokens or 800,
+                max_concurrency=max_concurrency,
+                cache=cache,
+                cache_semantico=cache_semantico,
+                modelo_longo=modelo_longo,
+                tokens_modelo_longo=tokens_modelo_longo,
+                **limites
             )
+            if enable_dynamic_batch:
+                return DynamicBatchClassificador(classificador)
+            return classificador
         
         elif provider == AIProvider.GEMINI:
-            return GeminiClassificador(
+            from infrastructure.ai.gemini_classificador import GeminiClassificador
+            
+            classificador = GeminiClassificador(
                 api_key=api_key,
                 preprocessador=preprocessador,
                 modelo=modelo or "gemini-2.5-flash-preview-05-20",
-                max_tokens=max_tokens or 8192
+                max_tokens=max_tokens or 8192,
+                max_concurrency=max_concurrency,
+                cache=cache,
+                enable_two_phase=enable_two_phase,
+                **limites
             )
+            if enable_dynamic_batch:
+                return DynamicBatchClassificador(classificador)
+            return classificador
         
         else:
             raise ValueError(f"Provider não suportado: {provider}")
@@ -77,7 +133,18 @@ class ClassificadorFactory:
         api_key: str,
         modelo: Optional[str] = None,
         preprocessador: Optional[PreprocessadorTexto] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 8,
+        enable_dynamic_batch: bool = False,
+        cache: Optional[CacheClassificacao] = None,
+        cache_semantico: Optional[CacheSemantico] = None,
+        enable_two_phase: bool = False,
+        enable_batch_api: bool = False,
+        modelo_longo: Optional[str] = None,
+        tokens_modelo_longo: int = 300,
+        rpm_limit: Optional[int] = None,
+        tpm_limit: Optional[int] = None,
+        limiar_filtro_local: Optional[float] = None
     ) -> ClassificadorPort:
         """
         Cria classificador pelo nome do provider (string).
@@ -88,7 +155,18 @@ class ClassificadorFactory:
             modelo: Modelo específico (opcional)
             preprocessador: Preprocessador (opcional)
             max_tokens: Máximo de tokens para resposta (opcional)
-            
+            max_concurrency: Máximo de chamadas simultâneas em lote
+            enable_dynamic_batch: Agrupa chamadas concorrentes em uma só
+            cache: Cache de classificações compartilhado
+            cache_semantico: Cache de classificações de emails parecidos (apenas OpenAI)
+            enable_two_phase: Gera a resposta só para produtivos, em uma segunda chamada (apenas Gemini)
+            enable_batch_api: Classifica lotes pela Batch API, para jobs offline (apenas OpenAI)
+            modelo_longo: Modelo para emails longos (apenas OpenAI)
+            tokens_modelo_longo: Tamanho, em tokens, a partir do qual usar modelo_longo (apenas OpenAI)
+            rpm_limit: Cota de requisições por minuto (None usa o padrão do provedor, 0 desativa)
+            tpm_limit: Cota de tokens de entrada por minuto (None usa o padrão do provedor, 0 desativa)
+            limiar_filtro_local: Confiança mínima para o filtro local decidir sem a API (None usa o padrão)
+        
         Returns:
             Instância do classificador
         """
@@ -105,5 +183,16 @@ class ClassificadorFactory:
             api_key=api_key,
             modelo=modelo,
             preprocessador=preprocessador,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            max_concurrency=max_concurrency,
+            enable_dynamic_batch=enable_dynamic_batch,
+            cache=cache,
+            cache_semantico=cache_semantico,
+            enable_two_phase=enable_two_phase,
+            enable_batch_api=enable_batch_api,
+            modelo_longo=modelo_longo,
+            tokens_modelo_longo=tokens_modelo_longo,
+            rpm_limit=rpm_limit,
+            tpm_limit=tpm_limit,
+            limiar_filtro_local=limiar_filtro_local
         )
@@ -0,0 +1,107 @@
+"""
+Conversão da resposta dos modelos de IA para o value object de domínio.
+
+Compartilhado pelos classificadores Gemini e OpenAI, que recebem o mesmo
+formato de JSON.
+"""
+
+import re
+from typing import Any, Optional
+
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from domain.entities.email import CategoriaEmail
+
+
+RESPOSTA_PADRAO = "Obrigado pelo seu email. Retornaremos em breve."
+
+# Resposta cordial para improdutivos quando o modelo não escreve a resposta
+# (fluxo em duas fases do Gemini, cache semântico da OpenAI)
+_RESPOSTA_IMPRODUTIVO = (
+    "{saudacao}\n\n"
+    "Agradecemos a sua mensagem. O conteúdo foi recebido e registrado pela "
+    "nossa equipe, e seguimos à disposição.\n\n"
+    "Atenciosamente,"
+)
+
+# Com saída estruturada o modelo devolve o valor exato do enum; as chaves em
+# minúsculas cobrem respostas fora do schema. Categoria ambígua vira Produtivo:
+# é melhor responder a mais do que ignorar um pedido
+_CATEGORIA_PADRAO = CategoriaEmail.PRODUTIVO
+_CATEGORIAS = {
+    **{categoria.value: categoria for categoria in CategoriaEmail},
+    **{categoria.value.lower(): categoria for categoria in CategoriaEmail},
+}
+
+# Valores que o modelo usa para "ausente" nos metadados
+_VALORES_NULOS = frozenset({"", "null", "none"})
+
+# Despedida seguida de placeholder ("[Seu Nome]") e/ou nome próprio no fim da
+# linha: mantém só a despedida
+_NOME_PROPRIO = r'[A-Z][a-záàâãéèêíïóôõöúçñ]+'
+_DESPEDIDA_RE = re.compile(
+    r'(Atenciosamente,?|Cordialmente,?)'
+    r'(?:\s*\[.*?\])?'
+    rf'(?:\s+{_NOME_PROPRIO}(?:\s+{_NOME_PROPRIO})*\s*$)?',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def converter_categoria(categoria: Any) -> CategoriaEmail:
+    """Converte o texto da categoria para o enum (Produtivo por padrão)."""
+    if isinstance(categoria, str):
+        encontrada = _CATEGORIAS.get(categoria)
+        if encontrada is not None:
+            return encontrada
+    return _CATEGORIAS.get(str(categoria or "").strip().lower(), _CATEGORIA_PADRAO)
+
+
+def limpar_resposta(resposta: str) -> str:
+    """
+    Remove placeholders e texto após a despedida.
+    
+    Args:
+        resposta: Texto da resposta sugerida
+    
+    Returns:
+        Resposta limpa sem placeholders
+    """
+    return _DESPEDIDA_RE.sub(r'\1', resposta).strip()
+
+
+def criar_resposta_improdutivo(remetente: Optional[str] = None) -> str:
+    """Monta a resposta cordial para improdutivos, saudando o remetente pelo nome."""
+    nome = (remetente or "").split("<", 1)[0].strip().strip('"')
+    if not nome or "@" in nome or nome.lower() == "null":
+        saudacao = "Olá,"
+    else:
+        saudacao = f"Olá {nome},"
+    return _RESPOSTA_IMPRODUTIVO.format(saudacao=saudacao)
+
+
+def converter_resposta(resposta: dict) -> ClassificacaoResultado:
+    """
+    Converte a resposta da API para o value object.
+    
+    Args:
+        resposta: Dicionário com a resposta da API
+    
+    Returns:
+        ClassificacaoResultado
+    """
+    confianca = float(resposta.get("confianca", 0.5))
+    
+    return ClassificacaoResultado(
+        categoria=converter_categoria(resposta.get("categoria")),
+        confianca=max(0.0, min(1.0, confianca)),
+        resposta_sugerida=limpar_resposta(resposta.get("resposta_sugerida", RESPOSTA_PADRAO)),
+        assunto=_nulo(resposta.get("assunto")),
+        remetente=_nulo(resposta.get("remetente")),
+        destinatario=_nulo(resposta.get("destinatario"))
+    )
+
+
+def _nulo(valor: Any) -> Optional[Any]:
+    """Normaliza "null", "none" e strings vazias para None."""
+    if isinstance(valor, str) and valor.strip().lower() in _VALORES_NULOS:
+        return None
+    return valor
@@ -0,0 +1,179 @@
+"""
+Classificador com micro-lotes dinâmicos.
+
+Agrupa chamadas concorrentes de classificar() em uma única chamada à API
+(OpenAI ou Gemini), amortizando as instruções do prompt entre vários emails.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, List, Optional, Sequence, Set, Tuple, Union
+
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+
+if TYPE_CHECKING:
+    from infrastructure.ai.gemini_classificador import GeminiClassificador
+    from infrastructure.ai.openai_classificador import OpenAIClassificador
+
+
+logger = logging.getLogger(__name__)
+
+
+_ItemFila = Tuple[str, "asyncio.Future[ClassificacaoResultado]"]
+
+
+class DynamicBatchClassificador:
+    """
+    Decorador de OpenAIClassificador ou GeminiClassificador que forma lotes dinâmicos.
+    
+    Cada chamada a classificar() entra em uma fila. Um laço em segundo plano
+    retira o primeiro item e aguarda até batch_wait_timeout_s por novos itens,
+    até max_batch_size, e então classifica o grupo com classificar_agrupado():
+    filtro local, cache e coalescência valem para cada email, e os que
+    restam vão juntos em uma única chamada.
+    
+    Só traz ganho quando a mesma instância atende várias requisições
+    (deve ser compartilhada, não criada por requisição).
+    """
+    
+    def __init__(
+        self,
+        classificador: Union["OpenAIClassificador", "GeminiClassificador"],
+        max_batch_size: int = 8,
+        batch_wait_timeout_s: float = 0.002
+    ):
+        """
+        Inicializa o classificador em lote.
+        
+        Args:
+            classificador: Classificador (com classificar_agrupado) usado nas chamadas
+            max_batch_size: Máximo de emails por chamada à API
+            batch_wait_timeout_s: Tempo máximo de espera por novos itens do lote
+        """
+        self._classificador = classificador
+        self._max_batch_size = max_batch_size
+        self._batch_wait_timeout_s = batch_wait_timeout_s
+        self._fila: Optional["asyncio.Queue[_ItemFila]"] = None
+        self._laco: Optional[asyncio.Task] = None
+        self._em_andamento: Set[asyncio.Task] = set()
+    
+    async def classificar(self, conteudo: str) -> ClassificacaoResultado:
+        """
+        Enfileira o email e aguarda o resultado do lote em que ele entrar.
+        
+        Args:
+            conteudo: Texto do email a ser classificado
+        
+        Returns:
+            ClassificacaoResultado com categoria, confiança e resposta
+        
+        Raises:
+            ClassificacaoException: Se ocorrer erro na classificação
+        """
+        fila = self._garantir_laco()
+        futuro = asyncio.get_running_loop().create_future()
+        await fila.put((conteudo, futuro))
+        return await futuro
+    
+    async def classificar_lote(self, conteudos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """Classifica vários emails, deixando a fila agrupá-los."""
+        return list(await asyncio.gather(*(self.classificar(conteudo) for conteudo in conteudos)))
+    
+    async def fechar(self) -> None:
+        """
+        Encerra o laço de lotes e os lotes em processamento.
+        
+        Chamado no desligamento da aplicação. Requisições que ainda aguardam
+        na fila ou em um lote interrompido recebem CancelledError.
+        """
+        laco_atual = asyncio.get_running_loop()
+        tarefas = [
+            tarefa for tarefa in (self._laco, *self._em_andamento)
+            if tarefa is not None and not tarefa.done() and tarefa.get_loop() is laco_atual
+        ]
+        for tarefa in tarefas:
+            tarefa.cancel()
+        await asyncio.gather(*tarefas, return_exceptions=True)
+        
+        if self._fila is not None:
+            while not self._fila.empty():
+                _, futuro = self._fila.get_nowait()
+                futuro.cancel()
+        self._fila = None
+        self._laco = None
+    
+    def get_modelo(self) -> str:
+        """Retorna o nome do modelo de IA sendo utilizado."""
+        return self._classificador.get_modelo()
+    
+    def get_provider(self) -> str:
+        """Retorna o nome do provedor de IA."""
+        return self._classificador.get_provider()
+    
+    def _garantir_laco(self) -> "asyncio.Queue[_ItemFila]":
+        """Cria a fila e o laço de lotes no event loop atual, se necessário."""
+        if self._laco is None or self._laco.done() or self._laco.get_loop() is not asyncio.get_running_loop():
+            self._fila = asyncio.Queue()
+            self._laco = asyncio.create_task(self._laco_lotes(self._fila))
+        return self._fila
+    
+    async def _laco_lotes(self, fila: "asyncio.Queue[_ItemFila]") -> None:
+        """Forma lotes a partir da fila e dispara o processamento de cada um."""
+        while True:
+            lote = [await fila.get()]
+            
+            try:
+                while len(lote) < self._max_batch_size:
+                    try:
+                        lote.append(await asyncio.wait_for(fila.get(), timeout=self._batch_wait_timeout_s))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Encerrado por fechar() enquanto o lote se formava
+                for _, futuro in lote:
+                    futuro.cancel()
+                raise
+            
+            # Processar em paralelo para o laço voltar a formar o próximo lote
+            tarefa = asyncio.create_task(self._processar(lote))
+            self._em_andamento.add(tarefa)
+            tarefa.add_done_callback(self._em_andamento.discard)
+    
+    async def _processar(self, lote: List[_ItemFila]) -> None:
+        """
+        Classifica um lote e entrega cada resultado ao seu futuro.
+        
+        Um lote de um só email segue o caminho normal de classificar(). Se o
+        grupo falhar (ex.: array com tamanho errado), cada email é
+        classificado individualmente.
+        """
+        textos = [texto for texto, _ in lote]
+        resultados: List[object]
+        
+        try:
+            if len(lote) == 1:
+                resultados = await asyncio.gather(self._classificador.classificar(textos[0]), return_exceptions=True)
+            else:
+                try:
+                    resultados = list(await self._classificador.classificar_agrupado(textos))
+                except Exception as e:
+                    # Resposta em grupo inválida: classificar individualmente
+                    logger.warning("⚠️ [Lote] Falha no lote de %s emails, classificando individualmente: %s", len(lote), e)
+                    resultados = await asyncio.gather(
+                        *(self._classificador.classificar(texto) for texto in textos),
+                        return_exceptions=True
+                    )
+        except asyncio.CancelledError:
+            # Lote interrompido por fechar(): não deixar as requisições esperando
+            for _, futuro in lote:
+                futuro.cancel()
+            raise
+        
+        for (_, futuro), resultado in zip(lote, resultados):
+            if futuro.done():
+                # Requisição cancelada enquanto aguardava o lote
+                continue
+            if isinstance(resultado, BaseException):
+                futuro.set_exception(resultado)
+            else:
+                futuro.set_result(resultado)
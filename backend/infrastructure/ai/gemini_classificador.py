@@ -4,23 +4,142 @@ Implementação do Classificador usando Google Gemini.
 Esta classe implementa a interface ClassificadorPort usando a API do Google Gemini.
 """
 
-import json
+import asyncio
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 
 import google.generativeai as genai
+from google.api_core.exceptions import ResourceExhausted
 
-from application.ports.classificador_port import ClassificadorPort
 from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from domain.value_objects.classificacao_parcial import ClassificacaoParcial
 from domain.entities.email import CategoriaEmail
 from domain.exceptions import ClassificacaoException
+from infrastructure.ai.cache_classificacao import CacheClassificacao
+from infrastructure.ai.chamadas_em_andamento import ChamadasEmAndamento
+from infrastructure.ai.conversor_resposta import (
+    converter_categoria,
+    converter_resposta,
+    criar_resposta_improdutivo,
+)
+from infrastructure.ai.json_utils import carregar_json, extrair_classificacao_parcial
+from infrastructure.ai.prompts import INSTRUCOES, INSTRUCOES_CLASSIFICACAO, REGRAS_RESPOSTA
+from infrastructure.ai.rate_limiter import get_limitador
+from infrastructure.ai.retry import com_retentativas
+from infrastructure.nlp.classificador_heuristico import ClassificadorHeuristico
 from infrastructure.nlp.preprocessador import PreprocessadorTexto
 
 
 logger = logging.getLogger(__name__)
 
 
-class GeminiClassificador(ClassificadorPort):
+# Partes fixas do prompt de email único: o prefixo é idêntico em todas as chamadas,
+# o que permite o cache implícito de prefixo do provedor
+_PROMPT_PREFIX = INSTRUCOES + """═══════════════════════════════════════
+EMAIL PARA CLASSIFICAR:
+═══════════════════════════════════════
+"""
+
+_PROMPT_SUFFIX = """
+═══════════════════════════════════════"""
+
+
+# Fluxo em duas fases: primeiro só a classificação e os metadados (saída curta);
+# a resposta é gerada em uma segunda chamada apenas para emails produtivos
+_PROMPT_CLASSIFICACAO_PREFIX = INSTRUCOES_CLASSIFICACAO + """═══════════════════════════════════════
+EMAIL PARA CLASSIFICAR:
+═══════════════════════════════════════
+"""
+
+_PROMPT_CLASSIFICACAO_SUFFIX = _PROMPT_SUFFIX
+
+_PROMPT_RESPOSTA_PREFIX = """Você é especialista em atendimento ao cliente da Autou, empresa do setor financeiro.
+O email abaixo foi RECEBIDO de um cliente e requer ação ou resposta. Escreva a resposta: um email COMPLETO, pronto para enviar e PERSONALIZADO, útil e detalhado, mostrando que você leu e entendeu a mensagem.
+""" + REGRAS_RESPOSTA + """
+═══════════════════════════════════════
+EMAIL RECEBIDO:
+═══════════════════════════════════════
+"""
+
+_PROMPT_RESPOSTA_SUFFIX = """
+═══════════════════════════════════════
+
+RESPONDA APENAS com o texto da resposta (sem markdown, sem explicações)."""
+
+# Saída estruturada: o modelo devolve JSON puro no formato do schema (sem
+# blocos markdown nem texto ao redor), dispensando instruções de formato no prompt
+_SCHEMA_CLASSIFICACAO = {
+    "type": "object",
+    "properties": {
+        "categoria": {"type": "string", "enum": ["Produtivo", "Improdutivo"]},
+        "confianca": {"type": "number"},
+        "assunto": {"type": "string", "nullable": True},
+        "remetente": {"type": "string", "nullable": True},
+        "destinatario": {"type": "string", "nullable": True},
+    },
+    "required": ["categoria", "confianca"],
+}
+
+_SCHEMA_RESPOSTA = {
+    **_SCHEMA_CLASSIFICACAO,
+    "properties": {
+        **_SCHEMA_CLASSIFICACAO["properties"],
+        "resposta_sugerida": {"type": "string"},
+    },
+    "required": ["categoria", "confianca", "resposta_sugerida"],
+}
+
+_SCHEMA_LOTE = {"type": "array", "items": _SCHEMA_RESPOSTA}
+
+# Teto da saída da fase de classificação: o JSON é curto, mas modelos com
+# raciocínio interno consomem parte do limite antes de responder
+_MAX_TOKENS_CLASSIFICACAO = 1024
+
+
+# Limite de caracteres do email enviado ao modelo (~2 mil tokens)
+_MAX_EMAIL_CHARS = 8000
+
+
+# Chave com que o SDK foi configurado por último (configuração global do módulo genai)
+_api_key_configurada: Optional[str] = None
+
+
+def _configurar_genai(api_key: str) -> None:
+    """
+    Configura o SDK do Gemini apenas quando a chave muda.
+    
+    genai.configure() descarta os clientes (e canais) já criados; chamá-lo a
+    cada requisição impediria o reaproveitamento das conexões com a API.
+    """
+    global _api_key_configurada
+    if api_key != _api_key_configurada:
+        genai.configure(api_key=api_key)
+        _api_key_configurada = api_key
+
+
+@lru_cache(maxsize=8)
+def _get_model(api_key: str, modelo: str) -> genai.GenerativeModel:
+    """
+    Retorna o GenerativeModel compartilhado para a chave e o modelo.
+    
+    O modelo guarda o cliente assíncrono criado na primeira chamada; reutilizá-lo
+    evita reinicializar o SDK a cada classificador instanciado por requisição.
+    """
+    _configurar_genai(api_key)
+    return genai.GenerativeModel(modelo)
+
+
+def _descartar_tarefa(tarefa: asyncio.Task) -> None:
+    """Cancela a tarefa especulativa ou consome seu erro, se já tiver terminado."""
+    if not tarefa.done():
+        tarefa.cancel()
+    elif not tarefa.cancelled():
+        # Marca a exceção como tratada para evitar o aviso "never retrieved"
+        tarefa.exception()
+
+
+class GeminiClassificador:
     """
     Implementação do classificador usando Google Gemini.
     
@@ -33,7 +152,14 @@ class GeminiClassificador(ClassificadorPort):
         api_key: str,
         preprocessador: Optional[PreprocessadorTexto] = None,
         modelo: str = "gemini-2.5-flash",
-        max_tokens: int = 8192
+        max_tokens: int = 8192,
+        max_concurrency: int = 8,
+        cache: Optional[CacheClassificacao] = None,
+        enable_local_filter: bool = True,
+        limiar_filtro_local: float = ClassificadorHeuristico.LIMIAR_PADRAO,
+        enable_two_phase: bool = False,
+        rpm_limit: Optional[int] = 1500,
+        tpm_limit: Optional[int] = 1_000_000
     ):
         """
         Inicializa o classificador.
@@ -42,45 +168,288 @@ class GeminiClassificador(ClassificadorPort):
             api_key: Chave de API do Google Gemini
             preprocessador: Instância do preprocessador de texto (opcional)
             modelo: Modelo do Gemini a ser usado
+            max_tokens: Máximo de tokens para a resposta
+            max_concurrency: Máximo de chamadas simultâneas em classificar_lote
+            cache: Cache de classificações por conteúdo (opcional)
+            enable_local_filter: Classifica localmente emails obviamente improdutivos,
+                sem chamar a API
+            limiar_filtro_local: Confiança mínima para o filtro local decidir sem a API
+            enable_two_phase: Classifica primeiro e só gera a resposta (segunda
+                chamada) para emails produtivos
+            rpm_limit: Cota de requisições por minuto (None desativa o limitador)
+            tpm_limit: Cota de tokens de entrada por minuto (None desativa o limitador)
         """
-        genai.configure(api_key=api_key)
-        self._model = genai.GenerativeModel(modelo)
+        self._model = _get_model(api_key, modelo)
         self._preprocessador = preprocessador or PreprocessadorTexto()
         self._modelo = modelo
         self._max_tokens = max_tokens
+        self._semaforo = asyncio.Semaphore(max_concurrency)
+        self._cache = cache
+        self._em_andamento: ChamadasEmAndamento[ClassificacaoResultado] = ChamadasEmAndamento()
+        self._heuristica = ClassificadorHeuristico(limiar=limiar_filtro_local)
+        self._filtro_local = self._heuristica if enable_local_filter else None
+        self._duas_fases = enable_two_phase
+        self._limitador_requisicoes = get_limitador("gemini", api_key, "rpm", rpm_limit) if rpm_limit else None
+        self._limitador_tokens = get_limitador("gemini", api_key, "tpm", tpm_limit) if tpm_limit else None
     
-    def classificar(self, conteudo: str) -> ClassificacaoResultado:
+    async def classificar(self, conteudo: str) -> ClassificacaoResultado:
         """
         Classifica o conteúdo do email usando a API do Google Gemini.
         
         Args:
             conteudo: Texto do email a ser classificado
-            
+        
         Returns:
             ClassificacaoResultado com categoria, confiança e resposta
-            
+        
         Raises:
             ClassificacaoException: Se ocorrer erro na API
         """
+        resultado = self._classificar_localmente(conteudo)
+        if resultado is not None:
+            return resultado
+        
         try:
-            logger.info(f"🤖 [Gemini] Iniciando classificação com modelo: {self._modelo}")
-            
             # Pré-processar texto
-            texto_processado = self._preprocessador.processar(conteudo)
+            texto_processado = await self._preparar_texto(conteudo)
             
-            # Chamar API
-            resposta = self._chamar_api(texto_processado)
+            resultado = await self._obter_do_cache(texto_processado)
+            if resultado is not None:
+                return resultado
             
-            # Converter resposta
-            resultado = self._converter_resposta(resposta)
+            # Cópias simultâneas do mesmo email compartilham uma única classificação
+            return await self._em_andamento.executar(
+                texto_processado, lambda: self._classificar_texto(texto_processado)
+            )
+        
+        except Exception as e:
+            logger.error("❌ [Gemini] Erro ao classificar email com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+    
+    async def _classificar_texto(self, texto_processado: str) -> ClassificacaoResultado:
+        """Classifica o texto já pré-processado pela API e guarda o resultado no cache."""
+        logger.info("🤖 [Gemini] Iniciando classificação com modelo: %s", self._modelo)
+        
+        # Chamar API
+        if self._duas_fases:
+            resposta = await self._chamar_api_duas_fases(texto_processado)
+        else:
+            resposta = await self._chamar_api(texto_processado)
+        
+        # Converter resposta
+        resultado = converter_resposta(resposta)
+        
+        logger.info("✅ [Gemini] Resposta gerada com: %s | Categoria: %s | Confiança: %.2f", self._modelo, resultado.categoria.value, resultado.confianca)
+        
+        if self._cache is not None:
+            await self._cache.guardar(texto_processado, resultado)
+        
+        return resultado
+    
+    async def classificar_stream(self, conteudo: str) -> AsyncIterator[ClassificacaoParcial]:
+        """
+        Classifica o email em streaming.
+        
+        Emite um evento parcial com categoria e confiança assim que esses campos
+        chegam do modelo e, ao final, um evento com o resultado completo.
+        
+        Args:
+            conteudo: Texto do email a ser classificado
+        
+        Yields:
+            ClassificacaoParcial; o último evento tem completo=True
+        
+        Raises:
+            ClassificacaoException: Se ocorrer erro na API
+        """
+        resultado = self._classificar_localmente(conteudo)
+        if resultado is not None:
+            yield ClassificacaoParcial.de_resultado(resultado)
+            return
+        
+        try:
+            texto_processado = await self._preparar_texto(conteudo)
+        except Exception as e:
+            raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+        
+        resultado = await self._obter_do_cache(texto_processado)
+        if resultado is not None:
+            yield ClassificacaoParcial.de_resultado(resultado)
+            return
+        
+        try:
+            logger.info("🤖 [Gemini] Iniciando classificação em streaming com modelo: %s", self._modelo)
             
-            logger.info(f"✅ [Gemini] Resposta gerada com: {self._modelo} | Categoria: {resultado.categoria.value} | Confiança: {resultado.confianca:.2f}")
+            response = await self._chamar_modelo(
+                self._criar_prompt(texto_processado),
+                self._max_tokens,
+                schema=_SCHEMA_RESPOSTA,
+                stream=True
+            )
             
-            return resultado
+            partes: List[str] = []
+            parcial_emitida = False
+            async for chunk in response:
+                partes.append(chunk.text)
+                if not parcial_emitida:
+                    campos = extrair_classificacao_parcial("".join(partes))
+                    if campos is not None:
+                        parcial_emitida = True
+                        yield ClassificacaoParcial(
+                            categoria=converter_categoria(campos[0]),
+                            confianca=max(0.0, min(1.0, campos[1]))
+                        )
+            
+            resultado = converter_resposta(self._interpretar_conteudo("".join(partes)))
         
         except Exception as e:
-            logger.error(f"❌ [Gemini] Erro ao classificar email com modelo {self._modelo}: {e}")
+            logger.error("❌ [Gemini] Erro ao classificar email em streaming com modelo %s: %s", self._modelo, e)
             raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+        
+        logger.info("✅ [Gemini] Resposta gerada com: %s | Categoria: %s | Confiança: %.2f", self._modelo, resultado.categoria.value, resultado.confianca)
+        
+        if self._cache is not None:
+            await self._cache.guardar(texto_processado, resultado)
+        
+        yield ClassificacaoParcial.de_resultado(resultado)
+    
+    def _classificar_localmente(self, conteudo: str) -> Optional[ClassificacaoResultado]:
+        """Resolve o email pelo filtro local, quando possível."""
+        if self._filtro_local is None:
+            return None
+        
+        resultado = self._filtro_local.classificar(conteudo)
+        if resultado is not None:
+            logger.info(
+                "⚡ [Gemini] Email classificado pelo filtro local | Categoria: %s | Taxa do filtro: %.0f%%",
+                resultado.categoria.value,
+                self._filtro_local.taxa_decisao * 100
+            )
+        return resultado
+    
+    async def _obter_do_cache(self, texto_processado: str) -> Optional[ClassificacaoResultado]:
+        """
+        Busca a classificação no cache pelo texto já pré-processado.
+        
+        A chave usa o texto normalizado (espaços, URLs), então cópias que só
+        diferem na formatação também são reaproveitadas.
+        """
+        if self._cache is None:
+            return None
+        
+        resultado = await self._cache.obter(texto_processado)
+        if resultado is not None:
+            logger.info("♻️ [Gemini] Classificação reaproveitada do cache | Categoria: %s", resultado.categoria.value)
+        return resultado
+    
+    async def classificar_lote(self, conteudos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica vários emails em paralelo.
+        
+        As chamadas à API são disparadas concorrentemente, limitadas pelo
+        semáforo de max_concurrency para respeitar o limite de requisições.
+        
+        Args:
+            conteudos: Textos dos emails a serem classificados
+        
+        Returns:
+            Lista de ClassificacaoResultado, na mesma ordem dos conteúdos
+        
+        Raises:
+            ClassificacaoException: Se a classificação de algum email falhar
+        """
+        return list(await asyncio.gather(
+            *(self._classificar_limitado(conteudo) for conteudo in conteudos)
+        ))
+    
+    async def _classificar_limitado(self, conteudo: str) -> ClassificacaoResultado:
+        """Classifica um email respeitando o limite de concorrência."""
+        async with self._semaforo:
+            return await self.classificar(conteudo)
+    
+    async def classificar_agrupado(self, conteudos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica vários emails, enviando os que faltam em uma única chamada à API.
+        
+        Cada email passa pelo mesmo caminho de classificar(): filtro local,
+        cache e coalescência com classificações em andamento. Só os restantes,
+        sem repetição, vão juntos para o modelo, e os resultados são guardados
+        no cache.
+        
+        Args:
+            conteudos: Textos dos emails a serem classificados
+        
+        Returns:
+            Lista de ClassificacaoResultado, na mesma ordem dos conteúdos
+        
+        Raises:
+            ClassificacaoException: Se a API falhar ou o array não corresponder aos emails
+        """
+        resultados = [self._classificar_localmente(conteudo) for conteudo in conteudos]
+        # Texto pré-processado -> posições dos emails com esse texto
+        pendentes: Dict[str, List[int]] = {}
+        
+        try:
+            for indice, conteudo in enumerate(conteudos):
+                if resultados[indice] is not None:
+                    continue
+                texto_processado = await self._preparar_texto(conteudo)
+                resultados[indice] = await self._obter_do_cache(texto_processado)
+                if resultados[indice] is None:
+                    pendentes.setdefault(texto_processado, []).append(indice)
+            
+            if pendentes:
+                classificados = await self._em_andamento.executar_grupo(
+                    list(pendentes), self._classificar_grupo_e_guardar
+                )
+                for indices, resultado in zip(pendentes.values(), classificados):
+                    for indice in indices:
+                        resultados[indice] = resultado
+        
+        except ClassificacaoException:
+            raise
+        except Exception as e:
+            logger.error("❌ [Gemini] Erro ao classificar grupo com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação em grupo: {str(e)}")
+        
+        return resultados
+    
+    async def _classificar_grupo_e_guardar(self, textos: List[str]) -> List[ClassificacaoResultado]:
+        """Classifica textos já pré-processados pela API e guarda os resultados no cache."""
+        if len(textos) == 1 or self._duas_fases:
+            # O fluxo em duas fases não tem versão em grupo
+            return list(await asyncio.gather(*(self._classificar_texto(texto) for texto in textos)))
+        
+        resultados = await self._classificar_grupo_api(textos)
+        if self._cache is not None:
+            for texto, resultado in zip(textos, resultados):
+                await self._cache.guardar(texto, resultado)
+        return resultados
+    
+    async def _classificar_grupo_api(self, textos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica textos já pré-processados em uma única chamada à API.
+        
+        As instruções do prompt são enviadas uma só vez para todo o grupo e o
+        modelo devolve um array JSON com um objeto por email.
+        """
+        try:
+            logger.info("🤖 [Gemini] Classificando grupo de %s emails com modelo: %s", len(textos), self._modelo)
+            
+            itens = carregar_json(
+                await self._gerar(self._criar_prompt_lote(textos), self._max_tokens, _SCHEMA_LOTE)
+            )
+        
+        except Exception as e:
+            logger.error("❌ [Gemini] Erro ao classificar grupo com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação em grupo: {str(e)}")
+        
+        if not isinstance(itens, list) or len(itens) != len(textos):
+            raise ClassificacaoException(
+                f"Resposta em grupo inválida: esperados {len(textos)} itens"
+            )
+        
+        return [converter_resposta(item) for item in itens]
     
     def get_modelo(self) -> str:
         """Retorna o nome do modelo de IA sendo utilizado."""
@@ -90,243 +459,162 @@ class GeminiClassificador(ClassificadorPort):
         """Retorna o nome do provedor de IA."""
         return "gemini"
     
-    def _chamar_api(self, texto: str) -> dict:
+    async def _chamar_api(self, texto: str) -> dict:
         """
         Realiza a chamada à API do Google Gemini.
         
         Args:
             texto: Texto preprocessado do email
-            
+        
         Returns:
             Dicionário com a resposta da API
         """
-        prompt = self._criar_prompt(texto)
+        content = await self._gerar(self._criar_prompt(texto), self._max_tokens, _SCHEMA_RESPOSTA)
+        return self._interpretar_conteudo(content)
+    
+    async def _chamar_api_duas_fases(self, texto: str) -> dict:
+        """
+        Classifica e, apenas para emails produtivos, gera a resposta em seguida.
         
-        response = self._model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.3,
-                max_output_tokens=self._max_tokens,
-            )
-        )
+        A primeira chamada devolve só categoria, confiança e metadados (saída
+        curta). Improdutivos recebem uma resposta cordial pronta, sem a
+        segunda chamada.
         
-        # Extrair JSON da resposta
-        content = response.text
+        Execução especulativa: quando a heurística local não aponta para
+        improdutivo (caso mais provável é produtivo), a resposta é gerada em
+        paralelo com a classificação e descartada se o email for improdutivo.
+        
+        Args:
+            texto: Texto preprocessado do email
+        
+        Returns:
+            Dicionário no mesmo formato da resposta de _chamar_api
+        """
+        tarefa_resposta: Optional[asyncio.Task] = None
+        if not self._heuristica.sugere_improdutivo(texto):
+            tarefa_resposta = asyncio.create_task(
+                self._gerar(self._criar_prompt_resposta(texto), self._max_tokens)
+            )
         
-        # Tentar encontrar JSON na resposta
         try:
-            # Tentar parse direto
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # Tentar extrair JSON de markdown code block
-            if "```json" in content:
-                json_str = content.split("```json")[1].split("```")[0]
-                return json.loads(json_str.strip())
-            elif "```" in content:
-                json_str = content.split("```")[1].split("```")[0]
-                return json.loads(json_str.strip())
+            resposta = self._interpretar_conteudo(
+                await self._gerar(
+                    self._criar_prompt_classificacao(texto), _MAX_TOKENS_CLASSIFICACAO, _SCHEMA_CLASSIFICACAO
+                )
+            )
+            
+            if converter_categoria(resposta.get("categoria", "")) is CategoriaEmail.PRODUTIVO:
+                if tarefa_resposta is None:
+                    texto_resposta = await self._gerar(self._criar_prompt_resposta(texto), self._max_tokens)
+                else:
+                    texto_resposta = await tarefa_resposta
+                resposta["resposta_sugerida"] = texto_resposta.strip()
             else:
-                # Fallback para resposta padrão
-                logger.warning(f"Não foi possível parsear JSON: {content}")
-                return {
-                    "categoria": "Produtivo",
-                    "confianca": 0.5,
-                    "resposta_sugerida": "Obrigado pelo seu email. Retornaremos em breve."
-                }
+                resposta["resposta_sugerida"] = criar_resposta_improdutivo(resposta.get("remetente"))
+        
+        finally:
+            if tarefa_resposta is not None:
+                _descartar_tarefa(tarefa_resposta)
+        
+        return resposta
     
-    def _criar_prompt(self, texto: str) -> str:
-        """Cria o prompt para classificação."""
-        return f"""Você é um especialista em atendimento ao cliente da empresa Autou, uma empresa do setor financeiro.
-Sua missão é analisar emails recebidos e classificá-los para otimizar o tempo da equipe de suporte.
-
-## CONTEXTO IMPORTANTE:
-- A empresa recebe alto volume de emails diariamente
-- Precisamos identificar quais emails REQUEREM UMA AÇÃO ou RESPOSTA da equipe
-- O email analisado é sempre algo que CHEGOU na caixa de entrada (ou seja, foi RECEBIDO)
-- Identifique quem é o REMETENTE (quem enviou) e quem é o DESTINATÁRIO (quem recebeu)
-
-## SUA TAREFA:
-1. **Extrair metadados** do email: assunto, remetente e destinatário
-2. **Classificar** o email como "Produtivo" ou "Improdutivo"
-3. **Atribuir** um nível de confiança (0.0 a 1.0)
-4. **Sugerir** uma resposta apropriada (se necessário)
-
-## EXTRAÇÃO DE METADADOS (MUITO IMPORTANTE - EXTRAIA COM PRECISÃO):
-- **assunto**: EXTRAIA O ASSUNTO EXATO E COMPLETO do email original. 
-  - Procure por "Assunto:", "Subject:", "Ref:", "Re:", "Fwd:" no texto
-  - O assunto geralmente aparece no início do email ou nos cabeçalhos
-  - Copie o assunto EXATAMENTE como está escrito, sem modificar
-  - Exemplo: Se o email tem "Assunto: Próxima Fase | Processo Seletivo AutoU", retorne exatamente "Próxima Fase | Processo Seletivo AutoU"
-  - Use null APENAS se realmente não houver assunto identificável
-- **remetente**: Extraia quem ENVIOU o email original.
-  - Procure por "De:", "From:" no texto
-  - Formato: "Nome <email>" ou apenas o nome/email disponível
-- **destinatario**: Extraia para quem o email foi ENVIADO.
-  - Procure por "Para:", "To:" no texto
-  - Use null se não encontrar
-
-## CRITÉRIOS DE CLASSIFICAÇÃO:
-
-### ✅ PRODUTIVO - Emails de CLIENTES que REQUEREM AÇÃO ou RESPOSTA:
-- **Solicitações de suporte técnico**: Problemas, bugs, erros no sistema
-- **Atualizações sobre casos em aberto**: Follow-up de tickets, pendências
-- **Dúvidas sobre o sistema**: Perguntas sobre funcionalidades, uso do produto
-- **Reclamações de clientes**: Insatisfações que precisam ser resolvidas
-- **Solicitações de informação**: Pedidos de dados, relatórios, esclarecimentos
-- **Pedidos de orçamento/proposta**: Interesse comercial direto de clientes
-
-### ❌ IMPRODUTIVO - Emails que NÃO necessitam de ação imediata:
-- **Mensagens de felicitações**: Aniversário, Natal, Ano Novo, etc.
-- **Agradecimentos simples**: "Obrigado", "Valeu" sem solicitação
-- **Newsletters e divulgações**: Anúncios de eventos, cursos, promoções
-- **Emails de marketing**: Propagandas, ofertas, convites para eventos
-- **Notificações automatizadas**: Lembretes de sistema, avisos de vencimento, boletos
-- **Emails de cobrança/financeiro automatizado**: Faturas, lembretes de pagamento
-- **Confirmações automáticas de sistemas**: Cadastros, senhas, códigos
-- **Spam**: Mensagens não solicitadas
-- **Auto-respostas automáticas**: Confirmações de recebimento
-- **Correntes e conteúdo viral**: Piadas, memes, etc.
-
-## REGRA PRINCIPAL:
-> "Classifique como PRODUTIVO apenas se o email for de um CLIENTE pedindo ajuda, suporte ou informação. Notificações automáticas de sistemas, lembretes, cobranças e marketing são IMPRODUTIVOS."
-
-## EXEMPLOS:
-- "Estou com problema no login" → PRODUTIVO (cliente pedindo suporte)
-- "Qual o status do meu chamado #123?" → PRODUTIVO (follow-up de cliente)
-- "Como faço para exportar relatório?" → PRODUTIVO (dúvida de cliente)
-- "Feliz Natal!" → IMPRODUTIVO (felicitação)
-- "Obrigado pela ajuda!" → IMPRODUTIVO (agradecimento)
-- "Inscreva-se no nosso evento!" → IMPRODUTIVO (marketing)
-- "Sua fatura vence dia 20" → IMPRODUTIVO (notificação automática)
-- "Lembrete: Declaração Anual" → IMPRODUTIVO (lembrete de sistema)
-- "Seu boleto está disponível" → IMPRODUTIVO (notificação financeira)
-
-## CONFIANÇA:
-- 0.9 a 1.0: Certeza absoluta da classificação
-- 0.7 a 0.89: Alta confiança
-- 0.5 a 0.69: Confiança moderada (caso ambíguo)
-- Abaixo de 0.5: Baixa confiança (revisar manualmente)
-
-## REGRAS DA RESPOSTA SUGERIDA:
-- A resposta deve ser um email COMPLETO e pronto para enviar
-- DEVE incluir saudação apropriada no INÍCIO (detecte quem é o remetente do email):
-  - Se for pessoa física: "Prezado(a) [Nome REAL extraído]," ou "Olá [Nome REAL],"
-  - Se for empresa/equipe: "Prezada Equipe [Nome da Empresa]," ou "Prezados,"
-  - Se não souber o nome: "Prezado(a)," ou "Olá,"
-- DEVE terminar APENAS com "Atenciosamente," - NADA MAIS após isso!
-- Para PRODUTIVO: Resposta útil e detalhada que ajude a resolver a solicitação
-- Para IMPRODUTIVO: Resposta breve mas CORDIAL e PERSONALIZADA ao contexto do email
-  - SEMPRE inclua saudação com o nome do remetente se disponível
-  - Demonstre que você leu e entendeu o email
-  - Responda de forma educada mesmo sendo breve
-
-## REGRA CRÍTICA SOBRE DESPEDIDA (OBRIGATÓRIO):
-- A resposta DEVE terminar EXATAMENTE com a palavra "Atenciosamente," e PONTO FINAL
-- **NUNCA** escreva NADA após "Atenciosamente," - nem nome, nem [Seu Nome], nem assinatura
-- **PROIBIDO**: "Atenciosamente, [Seu Nome]" ou "Atenciosamente, Maria" ou qualquer variação
-- **CORRETO**: A resposta termina em "Atenciosamente," e nada mais
-- A assinatura será adicionada automaticamente pelo sistema
-
-## REGRAS CRÍTICAS (ANTI-ALUCINAÇÃO):
-- **NUNCA** invente informações que não estão no email
-- **NUNCA** assuma dados como números de protocolo, datas ou valores não mencionados
-- **NUNCA** prometa prazos, descontos ou soluções específicas
-- **NUNCA** mencione produtos, serviços ou recursos não citados no email
-- Se não tiver certeza de algo, use termos genéricos
-- Base sua resposta APENAS no conteúdo do email fornecido
-- Não faça suposições sobre o contexto além do que está escrito
-
-═══════════════════════════════════════
-EMAIL PARA CLASSIFICAR:
-═══════════════════════════════════════
-{texto}
-═══════════════════════════════════════
-
-IMPORTANTE: Analise o email com INTELIGÊNCIA. Entenda o contexto, o tom, a intenção do remetente.
-- A resposta_sugerida deve ser PERSONALIZADA e demonstrar que você leu e entendeu o email
-- NUNCA responda apenas "Não é necessário responder este email" - sempre elabore uma resposta cordial
-
-RESPONDA APENAS com um objeto JSON válido (sem markdown, sem explicações):
-{{"categoria": "Produtivo ou Improdutivo", "confianca": número entre 0.0 e 1.0, "resposta_sugerida": "resposta PERSONALIZADA e apropriada ao contexto", "assunto": "assunto extraído do email ou null", "remetente": "remetente extraído ou null", "destinatario": "destinatário extraído ou null"}}"""
+    async def _gerar(self, prompt: str, max_tokens: int, schema: Optional[dict] = None) -> str:
+        """Envia o prompt ao modelo e retorna o texto gerado."""
+        response = await self._chamar_modelo(prompt, max_tokens, schema=schema)
+        return response.text
     
-    def _limpar_resposta(self, resposta: str) -> str:
+    async def _chamar_modelo(
+        self,
+        prompt: str,
+        max_tokens: int,
+        schema: Optional[dict] = None,
+        stream: bool = False
+    ):
         """
-        Remove placeholders e texto após a despedida.
+        Chama o modelo, repetindo a chamada com backoff se o limite de requisições for atingido.
         
         Args:
-            resposta: Texto da resposta sugerida
-            
+            prompt: Prompt completo
+            max_tokens: Teto de tokens da saída
+            schema: Schema da saída JSON; sem schema, a saída é texto livre
+            stream: Se True, retorna a resposta em streaming
+        
         Returns:
-            Resposta limpa sem placeholders
+            Resposta do SDK (iterável assíncrono quando stream=True)
         """
-        import re
-        
-        # Padrões para remover após "Atenciosamente," ou "Cordialmente,"
-        # Remove: [Seu Nome], [Nome], [Assinatura], ou qualquer nome após a despedida
-        padroes_remover = [
-            r'(Atenciosamente,?)\s*\[.*?\]',  # [Seu Nome], [Nome], etc
-            r'(Cordialmente,?)\s*\[.*?\]',
-            r'(Atenciosamente,?)\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+(\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+)*\s*$',  # Nome próprio após
-            r'(Cordialmente,?)\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+(\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+)*\s*$',
-        ]
-        
-        resultado = resposta
-        for padrao in padroes_remover:
-            resultado = re.sub(padrao, r'\1', resultado, flags=re.IGNORECASE | re.MULTILINE)
+        if schema is None:
+            config = genai.types.GenerationConfig(temperature=0.3, max_output_tokens=max_tokens)
+        else:
+            config = genai.types.GenerationConfig(
+                temperature=0.3,
+                max_output_tokens=max_tokens,
+                response_mime_type="application/json",
+                response_schema=schema,
+            )
         
-        # Garantir que termina com "Atenciosamente," limpo
-        resultado = resultado.strip()
+        async def chamar():
+            if self._limitador_requisicoes is not None:
+                await self._limitador_requisicoes.adquirir()
+            if self._limitador_tokens is not None:
+                # Estimativa de ~4 caracteres por token
+                await self._limitador_tokens.adquirir(len(prompt) // 4)
+            return await self._model.generate_content_async(prompt, generation_config=config, stream=stream)
         
-        return resultado
+        return await com_retentativas(chamar, excecoes=(ResourceExhausted,))
     
-    def _converter_resposta(self, resposta: dict) -> ClassificacaoResultado:
+    def _interpretar_conteudo(self, content: str) -> dict:
         """
-        Converte a resposta da API para o value object.
+        Extrai o dicionário de classificação do texto retornado pelo modelo.
         
         Args:
-            resposta: Dicionário com a resposta da API
-            
+            content: Texto completo da resposta
+        
         Returns:
-            ClassificacaoResultado
+            Dicionário com a resposta, ou uma resposta padrão se não houver JSON válido
         """
-        categoria_str = resposta.get("categoria", "").strip()
-        
-        if categoria_str.lower() == "produtivo":
-            categoria = CategoriaEmail.PRODUTIVO
-        elif categoria_str.lower() == "improdutivo":
-            categoria = CategoriaEmail.IMPRODUTIVO
-        else:
-            categoria = CategoriaEmail.PRODUTIVO
+        try:
+            resposta = carregar_json(content)
+        except ValueError:
+            # Saída cortada pelo limite de tokens
+            resposta = None
         
-        confianca = float(resposta.get("confianca", 0.5))
-        confianca = max(0.0, min(1.0, confianca))
+        if not isinstance(resposta, dict):
+            # Fallback para resposta padrão
+            logger.warning("Não foi possível parsear JSON: %s", content)
+            return {
+                "categoria": "Produtivo",
+                "confianca": 0.5,
+                "resposta_sugerida": "Obrigado pelo seu email. Retornaremos em breve."
+            }
         
-        resposta_sugerida = resposta.get(
-            "resposta_sugerida",
-            "Obrigado pelo seu email. Retornaremos em breve."
-        )
-        
-        # Limpar a resposta: remover [Seu Nome] e variações após "Atenciosamente,"
-        resposta_sugerida = self._limpar_resposta(resposta_sugerida)
-        
-        # Extrair metadados (podem ser null/None)
-        assunto = resposta.get("assunto")
-        remetente = resposta.get("remetente")
-        destinatario = resposta.get("destinatario")
-        
-        # Limpar valores "null" string
-        if assunto and str(assunto).lower() == "null":
-            assunto = None
-        if remetente and str(remetente).lower() == "null":
-            remetente = None
-        if destinatario and str(destinatario).lower() == "null":
-            destinatario = None
-        
-        return ClassificacaoResultado(
-            categoria=categoria,
-            confianca=confianca,
-            resposta_sugerida=resposta_sugerida,
-            assunto=assunto,
-            remetente=remetente,
-            destinatario=destinatario
+        return resposta
+    
+    async def _preparar_texto(self, conteudo: str) -> str:
+        """Pré-processa o email e limita seu tamanho para o prompt."""
+        texto = await self._preprocessador.processar_async(conteudo)
+        return self._preprocessador.truncar(texto, _MAX_EMAIL_CHARS)
+    
+    def _criar_prompt(self, texto: str) -> str:
+        """Cria o prompt para classificação."""
+        return _PROMPT_PREFIX + texto + _PROMPT_SUFFIX
+    
+    def _criar_prompt_classificacao(self, texto: str) -> str:
+        """Cria o prompt da fase de classificação (sem resposta sugerida)."""
+        return _PROMPT_CLASSIFICACAO_PREFIX + texto + _PROMPT_CLASSIFICACAO_SUFFIX
+    
+    def _criar_prompt_resposta(self, texto: str) -> str:
+        """Cria o prompt da fase de geração da resposta."""
+        return _PROMPT_RESPOSTA_PREFIX + texto + _PROMPT_RESPOSTA_SUFFIX
+    
+    def _criar_prompt_lote(self, textos: Sequence[str]) -> str:
+        """Cria o prompt para classificação de vários emails em uma chamada."""
+        emails = "\n".join(
+            f"--- EMAIL {indice} ---\n{texto}" for indice, texto in enumerate(textos, start=1)
         )
+        return f"""{INSTRUCOES}═══════════════════════════════════════
+EMAILS PARA CLASSIFICAR ({len(textos)}):
+═══════════════════════════════════════
+{emails}
+═══════════════════════════════════════
+
+Analise CADA email de forma independente e responda com exatamente {len(textos)} objetos, na mesma ordem dos emails."""
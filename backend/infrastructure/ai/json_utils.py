@@ -0,0 +1,51 @@
+"""
+Utilitários para ler e gerar o JSON trocado com os modelos de IA.
+
+Os provedores são chamados em modo de saída estruturada, então a resposta
+completa é JSON puro; durante o streaming, porém, o texto ainda está incompleto.
+"""
+
+import json
+import re
+from typing import Any, Optional, Tuple
+
+try:
+    # orjson é opcional: codifica e decodifica bem mais rápido que o json da stdlib
+    import orjson
+    carregar_json = orjson.loads
+    
+    def gerar_json(valor: Any) -> bytes:
+        """Serializa o valor em JSON UTF-8."""
+        return orjson.dumps(valor)
+except ImportError:  # pragma: no cover - depende do ambiente
+    carregar_json = json.loads
+    
+    def gerar_json(valor: Any) -> bytes:
+        """Serializa o valor em JSON UTF-8."""
+        return json.dumps(valor, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Campos legíveis em um JSON ainda incompleto (streaming); o número só é aceito
+# depois do delimitador, para não ler "0.9" de um "0.95" ainda em trânsito
+_CATEGORIA_PARCIAL_RE = re.compile(r'"categoria"\s*:\s*"([^"]*)"')
+_CONFIANCA_PARCIAL_RE = re.compile(r'"confianca"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]')
+
+
+def extrair_classificacao_parcial(content: str) -> Optional[Tuple[str, float]]:
+    """
+    Lê categoria e confiança de uma resposta JSON ainda em streaming.
+    
+    Args:
+        content: Texto recebido do modelo até o momento
+    
+    Returns:
+        Tupla (categoria, confianca) quando ambos os campos já estão completos,
+        ou None caso contrário
+    """
+    categoria = _CATEGORIA_PARCIAL_RE.search(content)
+    if not categoria:
+        return None
+    confianca = _CONFIANCA_PARCIAL_RE.search(content)
+    if not confianca:
+        return None
+    return categoria.group(1), float(confianca.group(1))
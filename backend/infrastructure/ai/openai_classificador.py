@@ -4,23 +4,125 @@ Implementação do Classificador usando OpenAI GPT.
 Esta classe implementa a interface ClassificadorPort usando a API da OpenAI.
 """
 
-import json
+import asyncio
 import logging
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, Timeout
 
-from application.ports.classificador_port import ClassificadorPort
+from domain.value_objects.classificacao_parcial import ClassificacaoParcial
 from domain.value_objects.classificacao_resultado import ClassificacaoResultado
 from domain.entities.email import CategoriaEmail
 from domain.exceptions import ClassificacaoException
+from infrastructure.ai.cache_classificacao import CacheClassificacao
+from infrastructure.ai.cache_semantico import CacheSemantico
+from infrastructure.ai.chamadas_em_andamento import ChamadasEmAndamento
+from infrastructure.ai.conversor_resposta import (
+    converter_categoria,
+    converter_resposta,
+    criar_resposta_improdutivo,
+)
+from infrastructure.ai.json_utils import carregar_json, extrair_classificacao_parcial
+from infrastructure.ai.prompts import INSTRUCOES, VERSAO_PROMPT
+from infrastructure.ai.rate_limiter import get_limitador
+from infrastructure.ai.telemetria_uso import get_telemetria
+from infrastructure.nlp.classificador_heuristico import ClassificadorHeuristico
 from infrastructure.nlp.preprocessador import PreprocessadorTexto
 
 
 logger = logging.getLogger(__name__)
 
 
-class OpenAIClassificador(ClassificadorPort):
+# Prompt de sistema fixo e sempre na primeira mensagem. Compacto (~500 tokens):
+# fica abaixo do mínimo do cache automático de prompt da OpenAI (1024 tokens),
+# mas custa menos que o prompt longo mesmo com o desconto do cache
+_SYSTEM_PROMPT = INSTRUCOES
+
+# Saída estruturada estrita: o modelo só gera JSON válido neste formato, o que
+# dispensa instruções de formato no prompt. No modo strict todos os campos são
+# obrigatórios; os metadados ausentes vêm como null
+_METADADO = {"type": ["string", "null"]}
+_SCHEMA_CLASSIFICACAO = {
+    "type": "object",
+    "properties": {
+        "categoria": {"type": "string", "enum": ["Produtivo", "Improdutivo"]},
+        "confianca": {"type": "number"},
+        "resposta_sugerida": {"type": "string"},
+        "assunto": _METADADO,
+        "remetente": _METADADO,
+        "destinatario": _METADADO,
+    },
+    "required": ["categoria", "confianca", "resposta_sugerida", "assunto", "remetente", "destinatario"],
+    "additionalProperties": False,
+}
+_FORMATO_RESPOSTA = {
+    "type": "json_schema",
+    "json_schema": {"name": "classificacao_email", "strict": True, "schema": _SCHEMA_CLASSIFICACAO},
+}
+
+# Vários emails em uma só chamada: a raiz do schema estrito precisa ser um objeto
+_FORMATO_RESPOSTA_GRUPO = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "classificacao_emails",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"resultados": {"type": "array", "items": _SCHEMA_CLASSIFICACAO}},
+            "required": ["resultados"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Teto de tokens de saída do modelo, limite para a saída de um grupo de emails
+_MAX_TOKENS_MODELO = 16_384
+
+# Mensagem de sistema montada uma vez e reutilizada (o SDK não a altera)
+_MENSAGEM_SISTEMA = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Agrupa as chamadas com o mesmo prefixo (mensagem de sistema) no mesmo
+# servidor do cache de prompt da OpenAI; muda junto com as instruções
+_CHAVE_CACHE_PROMPT = f"classificacao-email-{VERSAO_PROMPT}"
+
+_USER_PROMPT_PREFIX = "EMAIL RECEBIDO:\n"
+
+# Limite de caracteres do email enviado ao modelo (~1500 tokens); threads
+# encaminhadas longas são cortadas no meio, preservando cabeçalhos e o pedido final
+_MAX_EMAIL_CHARS = 6000
+
+# Embeddings do cache semântico: 256 dimensões bastam para achar cópias de um
+# mesmo modelo de email e deixam a busca no cache barata
+_MODELO_EMBEDDING = "text-embedding-3-small"
+_DIMENSOES_EMBEDDING = 256
+
+# Retentativas feitas pelo próprio SDK: só erros transitórios (429, 408, 409,
+# 5xx, timeout e falha de conexão) são repetidos, com backoff exponencial e
+# jitter, respeitando o cabeçalho Retry-After. Erros permanentes como
+# BadRequestError e AuthenticationError são lançados de imediato
+_MAX_RETENTATIVAS = 5
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> DefaultAsyncHttpxClient:
+    """
+    Retorna o cliente HTTP compartilhado por todos os classificadores OpenAI.
+    
+    Um único pool de conexões por processo: as conexões TLS com a API
+    permanecem abertas entre requisições em vez de serem refeitas a cada uma.
+    """
+    return DefaultAsyncHttpxClient(timeout=Timeout(60, connect=10))
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Retorna o cliente OpenAI compartilhado para a chave, sobre o pool HTTP comum."""
+    return AsyncOpenAI(api_key=api_key, http_client=_get_http_client(), max_retries=_MAX_RETENTATIVAS)
+
+
+class OpenAIClassificador:
     """
     Implementação do classificador usando OpenAI GPT.
     
@@ -33,7 +135,17 @@ class OpenAIClassificador(ClassificadorPort):
         api_key: str,
         preprocessador: Optional[PreprocessadorTexto] = None,
         modelo: str = "gpt-4o-mini",
-        max_tokens: int = 4000
+        max_tokens: int = 800,
+        max_concurrency: int = 8,
+        tamanho_grupo: int = 8,
+        cache: Optional[CacheClassificacao] = None,
+        cache_semantico: Optional[CacheSemantico] = None,
+        enable_local_filter: bool = True,
+        limiar_filtro_local: float = ClassificadorHeuristico.LIMIAR_PADRAO,
+        modelo_longo: Optional[str] = None,
+        tokens_modelo_longo: int = 300,
+        rpm_limit: Optional[int] = 500,
+        tpm_limit: Optional[int] = 200_000
     ):
         """
         Inicializa o classificador.
@@ -42,44 +154,400 @@ class OpenAIClassificador(ClassificadorPort):
             api_key: Chave de API da OpenAI
             preprocessador: Instância do preprocessador de texto (opcional)
             modelo: Modelo da OpenAI a ser usado
+            max_tokens: Máximo de tokens para a resposta
+            max_concurrency: Máximo de chamadas simultâneas em classificar_lote
+            tamanho_grupo: Emails enviados juntos em cada chamada de classificar_lote
+                (1 desativa o agrupamento; limitado para caber no teto de saída do modelo)
+            cache: Cache de classificações por conteúdo (opcional)
+            cache_semantico: Cache de classificações de emails parecidos, por
+                embedding (opcional; custa uma chamada de embedding por email)
+            enable_local_filter: Classifica localmente emails obviamente improdutivos,
+                sem chamar a API
+            limiar_filtro_local: Confiança mínima para o filtro local decidir sem a API
+            modelo_longo: Modelo usado para emails longos (None usa sempre o modelo)
+            tokens_modelo_longo: Tamanho estimado, em tokens, a partir do qual
+                o email vai para modelo_longo
+            rpm_limit: Cota de requisições por minuto (None desativa o limitador)
+            tpm_limit: Cota de tokens de entrada por minuto (None desativa o limitador)
         """
-        self._client = OpenAI(api_key=api_key)
+        self._client = _get_client(api_key)
         self._preprocessador = preprocessador or PreprocessadorTexto()
         self._modelo = modelo
         self._max_tokens = max_tokens
+        self._semaforo = asyncio.Semaphore(max_concurrency)
+        # Cada email do grupo precisa de até max_tokens de saída: grupos maiores
+        # que o teto do modelo teriam o JSON cortado no meio
+        self._tamanho_grupo = max(1, min(tamanho_grupo, _MAX_TOKENS_MODELO // max_tokens))
+        self._cache = cache
+        self._cache_semantico = cache_semantico
+        self._em_andamento: ChamadasEmAndamento[ClassificacaoResultado] = ChamadasEmAndamento()
+        self._filtro_local = ClassificadorHeuristico(limiar=limiar_filtro_local) if enable_local_filter else None
+        self._modelo_longo = modelo_longo
+        self._tokens_modelo_longo = tokens_modelo_longo
+        self._limitador_requisicoes = get_limitador("openai", api_key, "rpm", rpm_limit) if rpm_limit else None
+        self._limitador_tokens = get_limitador("openai", api_key, "tpm", tpm_limit) if tpm_limit else None
     
-    def classificar(self, conteudo: str) -> ClassificacaoResultado:
+    async def classificar(self, conteudo: str) -> ClassificacaoResultado:
         """
         Classifica o conteúdo do email usando a API da OpenAI.
         
         Args:
             conteudo: Texto do email a ser classificado
-            
+        
         Returns:
             ClassificacaoResultado com categoria, confiança e resposta
-            
+        
         Raises:
             ClassificacaoException: Se ocorrer erro na API
         """
+        resultado = self._classificar_localmente(conteudo)
+        if resultado is not None:
+            return resultado
+        return await self._classificar_remoto(conteudo)
+    
+    async def _classificar_remoto(self, conteudo: str) -> ClassificacaoResultado:
+        """Classifica o email pelo cache ou pela API, sem passar pelo filtro local."""
         try:
-            logger.info(f"🤖 [OpenAI] Iniciando classificação com modelo: {self._modelo}")
-            
             # Pré-processar texto
-            texto_processado = self._preprocessador.processar(conteudo)
+            texto_processado = await self._preparar_texto(conteudo)
+            
+            # Cache pelo texto normalizado: cópias que só diferem na formatação também contam
+            if self._cache is not None:
+                resultado = await self._cache.obter(texto_processado)
+                if resultado is not None:
+                    logger.info("♻️ [OpenAI] Classificação reaproveitada do cache | Categoria: %s", resultado.categoria.value)
+                    return resultado
             
-            # Chamar API
-            resposta = self._chamar_api(texto_processado)
+            # Cópias simultâneas do mesmo email compartilham uma única classificação
+            return await self._em_andamento.executar(
+                texto_processado, lambda: self._classificar_texto(texto_processado)
+            )
+        
+        except Exception as e:
+            logger.error("❌ [OpenAI] Erro ao classificar email com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+    
+    async def _classificar_texto(self, texto_processado: str) -> ClassificacaoResultado:
+        """Classifica o texto já pré-processado pelo cache semântico ou pela API."""
+        # Cache semântico: emails do mesmo modelo, com pequenas variações. Só a
+        # categoria é reaproveitada; um produtivo ainda precisa de uma resposta
+        # escrita para este email, então segue para a API
+        embedding = None
+        if self._cache_semantico is not None:
+            embedding = await self._gerar_embedding(texto_processado)
+            semelhante = self._cache_semantico.obter(embedding) if embedding is not None else None
+            if semelhante is not None and semelhante[0] == CategoriaEmail.IMPRODUTIVO:
+                logger.info("♻️ [OpenAI] Classificação reaproveitada de email semelhante | Categoria: %s", semelhante[0].value)
+                return ClassificacaoResultado(
+                    categoria=semelhante[0],
+                    confianca=semelhante[1],
+                    resposta_sugerida=criar_resposta_improdutivo()
+                )
+        
+        logger.info("🤖 [OpenAI] Iniciando classificação com modelo: %s", self._modelo)
+        
+        # Chamar API
+        resposta = await self._chamar_api(texto_processado)
+        
+        # Converter resposta
+        resultado = converter_resposta(resposta)
+        
+        logger.info("✅ [OpenAI] Resposta gerada com: %s | Categoria: %s | Confiança: %.2f", self._modelo, resultado.categoria.value, resultado.confianca)
+        
+        if self._cache is not None:
+            await self._cache.guardar(texto_processado, resultado)
+        if embedding is not None:
+            self._cache_semantico.guardar(embedding, resultado)
+        
+        return resultado
+    
+    async def classificar_stream(self, conteudo: str) -> AsyncIterator[ClassificacaoParcial]:
+        """
+        Classifica o email em streaming.
+        
+        Emite um evento parcial com categoria e confiança assim que esses campos
+        chegam do modelo (o schema os declara antes de resposta_sugerida) e, ao
+        final, um evento com o resultado completo.
+        
+        Args:
+            conteudo: Texto do email a ser classificado
+        
+        Yields:
+            ClassificacaoParcial; o último evento tem completo=True
+        
+        Raises:
+            ClassificacaoException: Se ocorrer erro na API
+        """
+        resultado = self._classificar_localmente(conteudo)
+        if resultado is not None:
+            yield ClassificacaoParcial.de_resultado(resultado)
+            return
+        
+        try:
+            texto_processado = await self._preparar_texto(conteudo)
+        except Exception as e:
+            raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+        
+        if self._cache is not None:
+            resultado = await self._cache.obter(texto_processado)
+            if resultado is not None:
+                logger.info("♻️ [OpenAI] Classificação reaproveitada do cache | Categoria: %s", resultado.categoria.value)
+                yield ClassificacaoParcial.de_resultado(resultado)
+                return
+        
+        try:
+            logger.info("🤖 [OpenAI] Iniciando classificação em streaming com modelo: %s", self._modelo)
             
-            # Converter resposta
-            resultado = self._converter_resposta(resposta)
+            requisicao = self._criar_requisicao(texto_processado)
+            await self._aguardar_cota(requisicao)
+            inicio = time.perf_counter()
+            response = await self._criar_completion(
+                requisicao,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
             
-            logger.info(f"✅ [OpenAI] Resposta gerada com: {self._modelo} | Categoria: {resultado.categoria.value} | Confiança: {resultado.confianca:.2f}")
+            partes: List[str] = []
+            parcial_emitida = False
+            async for chunk in response:
+                if not chunk.choices:
+                    # O último chunk traz só o uso de tokens da chamada
+                    self._registrar_uso(requisicao["model"], chunk.usage, time.perf_counter() - inicio)
+                    continue
+                partes.append(chunk.choices[0].delta.content or "")
+                if not parcial_emitida:
+                    campos = extrair_classificacao_parcial("".join(partes))
+                    if campos is not None:
+                        parcial_emitida = True
+                        yield ClassificacaoParcial(
+                            categoria=converter_categoria(campos[0]),
+                            confianca=max(0.0, min(1.0, campos[1]))
+                        )
             
-            return resultado
+            resultado = converter_resposta(carregar_json("".join(partes)))
+        
+        except Exception as e:
+            logger.error("❌ [OpenAI] Erro ao classificar email em streaming com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+        
+        logger.info("✅ [OpenAI] Resposta gerada com: %s | Categoria: %s | Confiança: %.2f", self._modelo, resultado.categoria.value, resultado.confianca)
+        
+        if self._cache is not None:
+            await self._cache.guardar(texto_processado, resultado)
+        
+        yield ClassificacaoParcial.de_resultado(resultado)
+    
+    async def classificar_lote(self, conteudos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica vários emails, chamando a API só para os que o filtro local e o cache não resolverem.
+        
+        Cópias do mesmo email (mesmo texto pré-processado) são enviadas uma
+        só vez, e os resultados da API são guardados no cache: reimportar uma
+        caixa de entrada não paga de novo pelos emails já classificados. O
+        cache semântico fica de fora, pois custaria uma chamada de embedding
+        por email; os textos vão direto à API, já pré-processados.
+        
+        Args:
+            conteudos: Textos dos emails a serem classificados
+        
+        Returns:
+            Lista de ClassificacaoResultado, na mesma ordem dos conteúdos
         
+        Raises:
+            ClassificacaoException: Se a classificação de algum email falhar
+        """
+        resultados, pendentes = await self._resolver_sem_api(conteudos)
+        
+        if pendentes:
+            textos = list(pendentes)
+            classificados = await self._classificar_pela_api(textos)
+            await self._guardar_no_cache(textos, classificados)
+            for indices, resultado in zip(pendentes.values(), classificados):
+                for indice in indices:
+                    resultados[indice] = resultado
+        
+        return resultados
+    
+    async def _resolver_sem_api(
+        self, conteudos: Sequence[str]
+    ) -> Tuple[List[Optional[ClassificacaoResultado]], Dict[str, List[int]]]:
+        """
+        Resolve os emails pelo filtro local e pelo cache.
+        
+        Returns:
+            Resultados (None para os não resolvidos) e, para cada texto
+            pré-processado que falta, as posições dos emails com esse texto
+        
+        Raises:
+            ClassificacaoException: Se o pré-processamento falhar
+        """
+        resultados = [self._classificar_localmente(conteudo) for conteudo in conteudos]
+        pendentes: Dict[str, List[int]] = {}
+        
+        try:
+            for indice, conteudo in enumerate(conteudos):
+                if resultados[indice] is not None:
+                    continue
+                texto_processado = await self._preparar_texto(conteudo)
+                if self._cache is not None:
+                    resultados[indice] = await self._cache.obter(texto_processado)
+                if resultados[indice] is None:
+                    pendentes.setdefault(texto_processado, []).append(indice)
         except Exception as e:
-            logger.error(f"❌ [OpenAI] Erro ao classificar email com modelo {self._modelo}: {e}")
+            logger.error("❌ [OpenAI] Erro ao preparar emails com modelo %s: %s", self._modelo, e)
             raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+        
+        reaproveitados = len(conteudos) - sum(len(indices) for indices in pendentes.values())
+        if reaproveitados:
+            logger.info("♻️ [OpenAI] %s de %s emails resolvidos sem chamar a API", reaproveitados, len(conteudos))
+        return resultados, pendentes
+    
+    async def _guardar_no_cache(
+        self, textos_processados: Sequence[str], resultados: Sequence[ClassificacaoResultado]
+    ) -> None:
+        """Guarda no cache os resultados da API, pelo texto pré-processado."""
+        if self._cache is None:
+            return
+        for texto_processado, resultado in zip(textos_processados, resultados):
+            await self._cache.guardar(texto_processado, resultado)
+    
+    async def _classificar_pela_api(self, textos_processados: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica vários textos já pré-processados pela API, em paralelo.
+        
+        Os emails são enviados em grupos de tamanho_grupo por chamada (uma
+        requisição em vez de várias, quando o gargalo é o limite de requisições
+        por minuto). As chamadas são disparadas concorrentemente, limitadas pelo
+        semáforo de max_concurrency. Não consulta nem preenche os caches.
+        
+        Args:
+            textos_processados: Textos pré-processados dos emails
+        
+        Returns:
+            Lista de ClassificacaoResultado, na mesma ordem dos textos
+        
+        Raises:
+            ClassificacaoException: Se a classificação de algum email falhar
+        """
+        return await self._classificar_em_grupos(textos_processados)
+    
+    async def _classificar_em_grupos(self, textos_processados: Sequence[str]) -> List[ClassificacaoResultado]:
+        """Classifica pela API síncrona, em grupos de tamanho_grupo (BatchClassificador não a sobrescreve)."""
+        if self._tamanho_grupo == 1:
+            return list(await asyncio.gather(
+                *(self._classificar_texto_limitado(texto) for texto in textos_processados)
+            ))
+        
+        grupos = [
+            textos_processados[inicio:inicio + self._tamanho_grupo]
+            for inicio in range(0, len(textos_processados), self._tamanho_grupo)
+        ]
+        resultados = await asyncio.gather(*(self._classificar_grupo_limitado(grupo) for grupo in grupos))
+        return [resultado for grupo in resultados for resultado in grupo]
+    
+    async def classificar_agrupado(self, conteudos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica vários emails, enviando os que faltam em grupos à API.
+        
+        Usado pelos lotes dinâmicos. Cada email passa pelo mesmo caminho de
+        classificar(): filtro local, cache e coalescência com classificações
+        em andamento. Só os restantes, sem repetição, vão à API síncrona em
+        grupos de tamanho_grupo, como em classificar_lote (sem cache
+        semântico), e os resultados são guardados no cache.
+        
+        Args:
+            conteudos: Textos dos emails a serem classificados
+        
+        Returns:
+            Lista de ClassificacaoResultado, na mesma ordem dos conteúdos
+        
+        Raises:
+            ClassificacaoException: Se a chamada falhar ou a resposta não tiver um item por email
+        """
+        resultados, pendentes = await self._resolver_sem_api(conteudos)
+        
+        if pendentes:
+            try:
+                classificados = await self._em_andamento.executar_grupo(
+                    list(pendentes), self._classificar_grupo_e_guardar
+                )
+            except ClassificacaoException:
+                raise
+            except Exception as e:
+                logger.error("❌ [OpenAI] Erro ao classificar grupo com modelo %s: %s", self._modelo, e)
+                raise ClassificacaoException(f"Falha na classificação em grupo: {str(e)}")
+            for indices, resultado in zip(pendentes.values(), classificados):
+                for indice in indices:
+                    resultados[indice] = resultado
+        
+        return resultados
+    
+    async def _classificar_grupo_e_guardar(self, textos: List[str]) -> List[ClassificacaoResultado]:
+        """Classifica textos já pré-processados em grupos de tamanho_grupo e guarda os resultados no cache."""
+        resultados = await self._classificar_em_grupos(textos)
+        await self._guardar_no_cache(textos, resultados)
+        return resultados
+    
+    async def _classificar_grupo_api(self, textos: Sequence[str]) -> List[ClassificacaoResultado]:
+        """
+        Classifica textos já pré-processados em uma única chamada à API.
+        
+        Raises:
+            ClassificacaoException: Se a chamada falhar ou a resposta não tiver um item por email
+        """
+        try:
+            logger.info("🤖 [OpenAI] Classificando %s emails em uma chamada com modelo: %s", len(textos), self._modelo)
+            
+            resposta = await self._enviar(self._criar_requisicao_grupo(textos))
+            itens = resposta.get("resultados") if isinstance(resposta, dict) else None
+        
+        except Exception as e:
+            logger.error("❌ [OpenAI] Erro ao classificar grupo com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação em grupo: {str(e)}")
+        
+        if not isinstance(itens, list) or len(itens) != len(textos):
+            raise ClassificacaoException(
+                f"Resposta em grupo inválida: esperados {len(textos)} itens"
+            )
+        
+        return [converter_resposta(item) for item in itens]
+    
+    def _classificar_localmente(self, conteudo: str) -> Optional[ClassificacaoResultado]:
+        """Resolve o email pelo filtro local, quando possível."""
+        if self._filtro_local is None:
+            return None
+        
+        resultado = self._filtro_local.classificar(conteudo)
+        if resultado is not None:
+            logger.info(
+                "⚡ [OpenAI] Email classificado pelo filtro local | Categoria: %s | Taxa do filtro: %.0f%%",
+                resultado.categoria.value,
+                self._filtro_local.taxa_decisao * 100
+            )
+        return resultado
+    
+    async def _classificar_texto_limitado(self, texto_processado: str) -> ClassificacaoResultado:
+        """Classifica um texto já pré-processado pela API, respeitando o limite de concorrência."""
+        try:
+            async with self._semaforo:
+                return converter_resposta(await self._chamar_api(texto_processado))
+        except Exception as e:
+            logger.error("❌ [OpenAI] Erro ao classificar email com modelo %s: %s", self._modelo, e)
+            raise ClassificacaoException(f"Falha na classificação: {str(e)}")
+    
+    async def _classificar_grupo_limitado(self, textos_processados: Sequence[str]) -> List[ClassificacaoResultado]:
+        """Classifica um grupo em uma chamada; se a resposta vier incompleta, email a email."""
+        if len(textos_processados) == 1:
+            return [await self._classificar_texto_limitado(textos_processados[0])]
+        
+        try:
+            async with self._semaforo:
+                return await self._classificar_grupo_api(textos_processados)
+        except ClassificacaoException:
+            logger.warning("⚠️ [OpenAI] Grupo de %s emails falhou; classificando individualmente", len(textos_processados))
+            return list(await asyncio.gather(
+                *(self._classificar_texto_limitado(texto) for texto in textos_processados)
+            ))
     
     def get_modelo(self) -> str:
         """Retorna o nome do modelo de IA sendo utilizado."""
@@ -89,245 +557,178 @@ class OpenAIClassificador(ClassificadorPort):
         """Retorna o nome do provedor de IA."""
         return "openai"
     
-    def _chamar_api(self, texto: str) -> dict:
+    async def _chamar_api(self, texto: str) -> dict:
         """
         Realiza a chamada à API da OpenAI.
         
         Args:
             texto: Texto preprocessado do email
-            
+        
         Returns:
             Dicionário com a resposta da API
         """
-        system_prompt = self._criar_system_prompt()
-        user_prompt = self._criar_user_prompt(texto)
-        
-        response = self._client.chat.completions.create(
-            model=self._modelo,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=self._max_tokens,
-            response_format={"type": "json_object"}
-        )
-        
-        content = response.choices[0].message.content
-        return json.loads(content)
+        return await self._enviar(self._criar_requisicao(texto))
     
-    def _criar_system_prompt(self) -> str:
-        """Cria o prompt de sistema para a classificação."""
-        return """Você é um especialista em atendimento ao cliente da empresa Autou, uma empresa do setor financeiro.
-Sua missão é analisar emails recebidos e classificá-los para otimizar o tempo da equipe de suporte.
-
-## CONTEXTO IMPORTANTE:
-- A empresa recebe alto volume de emails diariamente
-- Precisamos identificar quais emails REQUEREM UMA AÇÃO ou RESPOSTA da equipe
-- O email analisado é sempre algo que CHEGOU na caixa de entrada (ou seja, foi RECEBIDO)
-- Identifique quem é o REMETENTE (quem enviou) e quem é o DESTINATÁRIO (quem recebeu)
-
-## SUA TAREFA:
-1. **Extrair metadados** do email: assunto, remetente e destinatário
-2. **Classificar** o email como "Produtivo" ou "Improdutivo"
-3. **Atribuir** um nível de confiança (0.0 a 1.0)
-4. **Sugerir** uma resposta apropriada (se necessário)
-
-## EXTRAÇÃO DE METADADOS (MUITO IMPORTANTE - EXTRAIA COM PRECISÃO):
-- **assunto**: EXTRAIA O ASSUNTO EXATO E COMPLETO do email original. 
-  - Procure por "Assunto:", "Subject:", "Ref:", "Re:", "Fwd:" no texto
-  - O assunto geralmente aparece no início do email ou nos cabeçalhos
-  - Copie o assunto EXATAMENTE como está escrito, sem modificar
-  - Exemplo: Se o email tem "Assunto: Próxima Fase | Processo Seletivo AutoU", retorne exatamente "Próxima Fase | Processo Seletivo AutoU"
-  - Use null APENAS se realmente não houver assunto identificável
-- **remetente**: Extraia quem ENVIOU o email original.
-  - Procure por "De:", "From:" no texto
-  - Formato: "Nome <email>" ou apenas o nome/email disponível
-- **destinatario**: Extraia para quem o email foi ENVIADO.
-  - Procure por "Para:", "To:" no texto
-  - Use null se não encontrar
-
-## CRITÉRIOS DE CLASSIFICAÇÃO:
-
-### ✅ PRODUTIVO - Emails de CLIENTES que REQUEREM AÇÃO ou RESPOSTA:
-- **Solicitações de suporte técnico**: Problemas, bugs, erros no sistema
-- **Atualizações sobre casos em aberto**: Follow-up de tickets, pendências
-- **Dúvidas sobre o sistema**: Perguntas sobre funcionalidades, uso do produto
-- **Reclamações de clientes**: Insatisfações que precisam ser resolvidas
-- **Solicitações de informação**: Pedidos de dados, relatórios, esclarecimentos
-- **Pedidos de orçamento/proposta**: Interesse comercial direto de clientes
-
-### ❌ IMPRODUTIVO - Emails que NÃO necessitam de ação imediata:
-- **Mensagens de felicitações**: Aniversário, Natal, Ano Novo, etc.
-- **Agradecimentos simples**: "Obrigado", "Valeu" sem solicitação
-- **Newsletters e divulgações**: Anúncios de eventos, cursos, promoções
-- **Emails de marketing**: Propagandas, ofertas, convites para eventos
-- **Notificações automatizadas**: Lembretes de sistema, avisos de vencimento, boletos
-- **Emails de cobrança/financeiro automatizado**: Faturas, lembretes de pagamento
-- **Confirmações automáticas de sistemas**: Cadastros, senhas, códigos
-- **Spam**: Mensagens não solicitadas
-- **Auto-respostas automáticas**: Confirmações de recebimento
-- **Correntes e conteúdo viral**: Piadas, memes, etc.
-
-## REGRA PRINCIPAL:
-> "Classifique como PRODUTIVO apenas se o email for de um CLIENTE pedindo ajuda, suporte ou informação. Notificações automáticas de sistemas, lembretes, cobranças e marketing são IMPRODUTIVOS."
-
-## EXEMPLOS:
-- "Estou com problema no login" → PRODUTIVO (cliente pedindo suporte)
-- "Qual o status do meu chamado #123?" → PRODUTIVO (follow-up de cliente)
-- "Como faço para exportar relatório?" → PRODUTIVO (dúvida de cliente)
-- "Feliz Natal!" → IMPRODUTIVO (felicitação)
-- "Obrigado pela ajuda!" → IMPRODUTIVO (agradecimento)
-- "Inscreva-se no nosso evento!" → IMPRODUTIVO (marketing)
-- "Sua fatura vence dia 20" → IMPRODUTIVO (notificação automática)
-- "Lembrete: Declaração Anual" → IMPRODUTIVO (lembrete de sistema)
-- "Seu boleto está disponível" → IMPRODUTIVO (notificação financeira)
-
-## CONFIANÇA:
-- 0.9 a 1.0: Certeza absoluta da classificação
-- 0.7 a 0.89: Alta confiança
-- 0.5 a 0.69: Confiança moderada (caso ambíguo)
-- Abaixo de 0.5: Baixa confiança (revisar manualmente)
-
-## FORMATO DE RESPOSTA (JSON):
-{
-    "categoria": "Produtivo" ou "Improdutivo",
-    "confianca": número entre 0.0 e 1.0,
-    "resposta_sugerida": "resposta apropriada ao contexto",
-    "assunto": "assunto extraído do email ou null",
-    "remetente": "remetente extraído ou null",
-    "destinatario": "destinatário extraído ou null"
-}
-
-## REGRAS DA RESPOSTA SUGERIDA:
-- A resposta deve ser um email COMPLETO e pronto para enviar
-- DEVE incluir saudação apropriada no INÍCIO (detecte quem é o remetente do email):
-  - Se for pessoa física: "Prezado(a) [Nome REAL extraído]," ou "Olá [Nome REAL],"
-  - Se for empresa/equipe: "Prezada Equipe [Nome da Empresa]," ou "Prezados,"
-  - Se não souber o nome: "Prezado(a)," ou "Olá,"
-- DEVE terminar APENAS com "Atenciosamente," - NADA MAIS após isso!
-- Para PRODUTIVO: Resposta útil e detalhada que ajude a resolver a solicitação
-- Para IMPRODUTIVO: Resposta breve mas CORDIAL e PERSONALIZADA ao contexto do email
-  - SEMPRE inclua saudação com o nome do remetente se disponível
-  - Demonstre que você leu e entendeu o email
-  - Responda de forma educada mesmo sendo breve
-  - NUNCA use a frase "Não é necessário responder este email"
-
-## REGRA CRÍTICA SOBRE DESPEDIDA (OBRIGATÓRIO):
-- A resposta DEVE terminar EXATAMENTE com a palavra "Atenciosamente," e PONTO FINAL
-- **NUNCA** escreva NADA após "Atenciosamente," - nem nome, nem [Seu Nome], nem assinatura
-- **PROIBIDO**: "Atenciosamente, [Seu Nome]" ou "Atenciosamente, Maria" ou qualquer variação
-- **CORRETO**: A resposta termina em "Atenciosamente," e nada mais
-- A assinatura será adicionada automaticamente pelo sistema
-
-## REGRAS CRÍTICAS (ANTI-ALUCINAÇÃO):
-- **NUNCA** invente informações que não estão no email
-- **NUNCA** assuma dados como números de protocolo, datas ou valores não mencionados
-- **NUNCA** prometa prazos, descontos ou soluções específicas
-- **NUNCA** mencione produtos, serviços ou recursos não citados no email
-- Se não tiver certeza de algo, use termos genéricos
-- Base sua resposta APENAS no conteúdo do email fornecido
-- Não faça suposições sobre o contexto além do que está escrito"""
-    
-    def _criar_user_prompt(self, texto: str) -> str:
-        """Cria o prompt do usuário com o conteúdo do email."""
-        return f"""Analise o email abaixo com INTELIGÊNCIA. Entenda o contexto, o tom, a intenção do remetente e o valor que essa mensagem traz para a relação empresa/cliente.
-
-═══════════════════════════════════════
-EMAIL RECEBIDO:
-═══════════════════════════════════════
-{texto}
-═══════════════════════════════════════
-
-IMPORTANTE: 
-- A resposta_sugerida deve ser PERSONALIZADA e demonstrar que você leu e entendeu o email
-- NUNCA responda apenas "Não é necessário responder este email" - sempre elabore uma resposta cordial
-- Mesmo para emails Improdutivos, crie uma resposta educada e contextualizada
-
-Retorne sua análise em JSON com:
-- Classificação inteligente (lembre: críticas construtivas, elogios, feedback = PRODUTIVO)
-- Resposta PERSONALIZADA que demonstre que você leu e entendeu o email
-- Tom adequado ao contexto da mensagem"""
-    
-    def _limpar_resposta(self, resposta: str) -> str:
+    async def _enviar(self, requisicao: dict):
         """
-        Remove placeholders e texto após a despedida.
+        Envia a requisição respeitando as cotas por minuto e decodifica o JSON retornado.
         
         Args:
-            resposta: Texto da resposta sugerida
-            
+            requisicao: Parâmetros da chamada de chat completion
+        
         Returns:
-            Resposta limpa sem placeholders
+            Conteúdo JSON decodificado da resposta
         """
-        import re
-        
-        # Padrões para remover após "Atenciosamente," ou "Cordialmente,"
-        # Remove: [Seu Nome], [Nome], [Assinatura], ou qualquer nome após a despedida
-        padroes_remover = [
-            r'(Atenciosamente,?)\s*\[.*?\]',  # [Seu Nome], [Nome], etc
-            r'(Cordialmente,?)\s*\[.*?\]',
-            r'(Atenciosamente,?)\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+(\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+)*\s*$',  # Nome próprio após
-            r'(Cordialmente,?)\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+(\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+)*\s*$',
-        ]
-        
-        resultado = resposta
-        for padrao in padroes_remover:
-            resultado = re.sub(padrao, r'\1', resultado, flags=re.IGNORECASE | re.MULTILINE)
+        await self._aguardar_cota(requisicao)
         
-        # Garantir que termina com "Atenciosamente," limpo
-        resultado = resultado.strip()
+        # Erros transitórios já são repetidos pelo SDK (ver _MAX_RETENTATIVAS)
+        inicio = time.perf_counter()
+        response = await self._criar_completion(requisicao)
+        self._registrar_uso(requisicao["model"], response.usage, time.perf_counter() - inicio)
         
-        return resultado
+        content = response.choices[0].message.content
+        return carregar_json(content)
     
-    def _converter_resposta(self, resposta: dict) -> ClassificacaoResultado:
+    async def _criar_completion(self, requisicao: dict, **opcoes):
         """
-        Converte a resposta da API para o value object.
+        Chama a API de chat completion e alinha os limitadores às cotas informadas nos cabeçalhos.
         
         Args:
-            resposta: Dicionário com a resposta da API
-            
+            requisicao: Parâmetros da chamada de chat completion
+            **opcoes: Parâmetros adicionais (ex.: stream)
+        
         Returns:
-            ClassificacaoResultado
+            Resposta do SDK (stream assíncrono quando stream=True)
+        """
+        raw = await self._client.chat.completions.with_raw_response.create(**requisicao, **opcoes)
+        self._sincronizar_cotas(raw.headers)
+        return raw.parse()
+    
+    def _sincronizar_cotas(self, headers) -> None:
+        """Reduz o saldo dos limitadores ao restante informado em x-ratelimit-remaining-*."""
+        for limitador, cabecalho in (
+            (self._limitador_requisicoes, "x-ratelimit-remaining-requests"),
+            (self._limitador_tokens, "x-ratelimit-remaining-tokens"),
+        ):
+            valor = headers.get(cabecalho)
+            if limitador is None or valor is None:
+                continue
+            try:
+                limitador.sincronizar(float(valor))
+            except ValueError:
+                continue
+    
+    async def _gerar_embedding(self, texto: str) -> Optional[List[float]]:
+        """
+        Gera o embedding do texto para o cache semântico.
+        
+        Falhas não interrompem a classificação: sem embedding, o email
+        simplesmente não passa pelo cache semântico.
         """
-        categoria_str = resposta.get("categoria", "").strip()
-        
-        if categoria_str.lower() == "produtivo":
-            categoria = CategoriaEmail.PRODUTIVO
-        elif categoria_str.lower() == "improdutivo":
-            categoria = CategoriaEmail.IMPRODUTIVO
-        else:
-            # Default para produtivo em caso de resposta inesperada
-            categoria = CategoriaEmail.PRODUTIVO
-        
-        confianca = float(resposta.get("confianca", 0.5))
-        confianca = max(0.0, min(1.0, confianca))  # Garantir range válido
-        
-        resposta_sugerida = resposta.get(
-            "resposta_sugerida",
-            "Obrigado pelo seu email. Retornaremos em breve."
+        try:
+            if self._limitador_requisicoes is not None:
+                await self._limitador_requisicoes.adquirir()
+            inicio = time.perf_counter()
+            response = await self._client.embeddings.create(
+                model=_MODELO_EMBEDDING,
+                input=texto,
+                dimensions=_DIMENSOES_EMBEDDING
+            )
+        except Exception as e:
+            logger.warning("⚠️ [OpenAI] Falha ao gerar embedding para o cache semântico: %s", e)
+            return None
+        
+        get_telemetria().registrar(
+            _MODELO_EMBEDDING,
+            tokens_entrada=response.usage.prompt_tokens,
+            tokens_saida=0,
+            latencia_s=time.perf_counter() - inicio
         )
+        return response.data[0].embedding
+    
+    async def _aguardar_cota(self, requisicao: dict) -> None:
+        """Aguarda as cotas de requisições e tokens por minuto antes de uma chamada."""
+        if self._limitador_requisicoes is not None:
+            await self._limitador_requisicoes.adquirir()
+        if self._limitador_tokens is not None:
+            # Estimativa de ~4 caracteres por token
+            await self._limitador_tokens.adquirir(
+                sum(len(mensagem["content"]) for mensagem in requisicao["messages"]) // 4
+            )
+    
+    def _registrar_uso(self, modelo: str, usage, latencia_s: float) -> None:
+        """Registra tokens (inclusive os do cache de prompt) e latência da chamada na telemetria."""
+        if usage is None:
+            return
         
-        # Limpar a resposta: remover [Seu Nome] e variações após "Atenciosamente,"
-        resposta_sugerida = self._limpar_resposta(resposta_sugerida)
-        
-        # Extrair metadados (podem ser null/None)
-        assunto = resposta.get("assunto")
-        remetente = resposta.get("remetente")
-        destinatario = resposta.get("destinatario")
-        
-        # Limpar valores "null" string
-        if assunto and str(assunto).lower() == "null":
-            assunto = None
-        if remetente and str(remetente).lower() == "null":
-            remetente = None
-        if destinatario and str(destinatario).lower() == "null":
-            destinatario = None
-        
-        return ClassificacaoResultado(
-            categoria=categoria,
-            confianca=confianca,
-            resposta_sugerida=resposta_sugerida,
-            assunto=assunto,
-            remetente=remetente,
-            destinatario=destinatario
+        detalhes = getattr(usage, "prompt_tokens_details", None)
+        tokens_cache = (detalhes.cached_tokens or 0) if detalhes is not None else 0
+        get_telemetria().registrar(
+            modelo,
+            tokens_entrada=usage.prompt_tokens,
+            tokens_saida=usage.completion_tokens,
+            tokens_cache=tokens_cache,
+            latencia_s=latencia_s
+        )
+        logger.debug(
+            "🗄️ [OpenAI] Uso: %s tokens de entrada (%s do cache de prompt) | %s de saída | %.2fs",
+            usage.prompt_tokens,
+            tokens_cache,
+            usage.completion_tokens,
+            latencia_s
         )
+    
+    def _escolher_modelo(self, texto: str) -> str:
+        """Escolhe o modelo pelo tamanho do email: os longos podem ir para um modelo maior."""
+        # Estimativa de ~4 caracteres por token
+        if self._modelo_longo and len(texto) // 4 >= self._tokens_modelo_longo:
+            return self._modelo_longo
+        return self._modelo
+    
+    def _criar_requisicao(self, texto: str) -> dict:
+        """Monta os parâmetros da chamada de chat completion para o email."""
+        return {
+            "model": self._escolher_modelo(texto),
+            "messages": [
+                _MENSAGEM_SISTEMA,
+                {"role": "user", "content": self._criar_user_prompt(texto)}
+            ],
+            "temperature": 0.3,
+            "max_tokens": self._max_tokens,
+            "response_format": _FORMATO_RESPOSTA,
+            # Via extra_body: não depende da versão do SDK aceitar o parâmetro
+            "extra_body": {"prompt_cache_key": _CHAVE_CACHE_PROMPT}
+        }
+    
+    def _criar_requisicao_grupo(self, textos: Sequence[str]) -> dict:
+        """Monta os parâmetros da chamada que classifica vários emails de uma vez."""
+        emails = "\n".join(
+            f"--- EMAIL {indice} ---\n{texto}" for indice, texto in enumerate(textos, start=1)
+        )
+        return {
+            "model": self._modelo,
+            "messages": [
+                _MENSAGEM_SISTEMA,
+                {
+                    "role": "user",
+                    "content": (
+                        f"EMAILS RECEBIDOS ({len(textos)}): analise CADA um de forma independente e "
+                        f"retorne exatamente {len(textos)} resultados, na mesma ordem.\n{emails}"
+                    )
+                }
+            ],
+            "temperature": 0.3,
+            "max_tokens": min(_MAX_TOKENS_MODELO, self._max_tokens * len(textos)),
+            "response_format": _FORMATO_RESPOSTA_GRUPO,
+            # Via extra_body: não depende da versão do SDK aceitar o parâmetro
+            "extra_body": {"prompt_cache_key": _CHAVE_CACHE_PROMPT}
+        }
+    
+    async def _preparar_texto(self, conteudo: str) -> str:
+        """Pré-processa o email e limita seu tamanho para o prompt."""
+        texto = await self._preprocessador.processar_async(conteudo)
+        return self._preprocessador.truncar(texto, _MAX_EMAIL_CHARS)
+    
+    def _criar_user_prompt(self, texto: str) -> str:
+        """Cria o prompt do usuário com o conteúdo do email."""
+        return _USER_PROMPT_PREFIX + texto
@@ -0,0 +1,87 @@
+"""
+Limitador de taxa (token bucket) para as chamadas às APIs de IA.
+
+Mantém o ritmo das chamadas dentro das cotas por minuto do provedor
+(requisições e tokens), evitando erros 429 e as retentativas que eles forçam.
+"""
+
+import asyncio
+import time
+from functools import lru_cache
+
+
+class AsyncTokenBucket:
+    """
+    Balde de tokens assíncrono: reabastece continuamente até a capacidade.
+    
+    Usado apenas a partir do event loop; a verificação e o consumo do saldo
+    acontecem sem pontos de suspensão entre si, então dispensa lock.
+    """
+    
+    def __init__(self, taxa_por_minuto: float, capacidade: float | None = None):
+        """
+        Inicializa o balde cheio.
+        
+        Args:
+            taxa_por_minuto: Tokens repostos por minuto
+            capacidade: Saldo máximo acumulado (padrão: a taxa por minuto)
+        """
+        if taxa_por_minuto <= 0:
+            raise ValueError("A taxa por minuto deve ser positiva")
+        
+        self._taxa_por_segundo = taxa_por_minuto / 60.0
+        self._capacidade = float(capacidade if capacidade is not None else taxa_por_minuto)
+        self._saldo = self._capacidade
+        self._ultimo_reabastecimento = time.monotonic()
+    
+    async def adquirir(self, tokens: float = 1) -> None:
+        """
+        Consome tokens do balde, aguardando o reabastecimento se necessário.
+        
+        Pedidos maiores que a capacidade são limitados a ela, para não
+        esperarem para sempre.
+        
+        Args:
+            tokens: Quantidade de tokens a consumir
+        """
+        tokens = min(tokens, self._capacidade)
+        while True:
+            self._reabastecer()
+            if self._saldo >= tokens:
+                self._saldo -= tokens
+                return
+            await asyncio.sleep((tokens - self._saldo) / self._taxa_por_segundo)
+    
+    def sincronizar(self, restantes: float) -> None:
+        """
+        Reduz o saldo ao que o provedor informa ainda restar na cota.
+        
+        O provedor enxerga o consumo de todos os processos que usam a chave;
+        alinhar o saldo local evita que este processo gaste o que outros já
+        consumiram e receba 429.
+        
+        Args:
+            restantes: Saldo restante informado pelo provedor
+        """
+        self._reabastecer()
+        self._saldo = min(self._saldo, max(0.0, restantes))
+    
+    def _reabastecer(self) -> None:
+        """Repõe os tokens acumulados desde o último reabastecimento."""
+        agora = time.monotonic()
+        self._saldo = min(
+            self._capacidade,
+            self._saldo + (agora - self._ultimo_reabastecimento) * self._taxa_por_segundo
+        )
+        self._ultimo_reabastecimento = agora
+
+
+@lru_cache(maxsize=32)
+def get_limitador(provedor: str, api_key: str, cota: str, limite_por_minuto: int) -> AsyncTokenBucket:
+    """
+    Retorna o limitador de uma cota por minuto ("rpm" ou "tpm") do provedor.
+    
+    A cota é por chave de API, então o limitador é compartilhado por todos
+    os classificadores do processo que usam a mesma chave.
+    """
+    return AsyncTokenBucket(limite_por_minuto)
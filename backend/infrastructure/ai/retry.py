@@ -0,0 +1,57 @@
+"""
+Retentativas com backoff exponencial para chamadas às APIs de IA.
+
+Erros de limite de requisições (HTTP 429) são transitórios: repetir a
+chamada após uma espera crescente costuma resolver sem falhar a requisição.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def com_retentativas(
+    operacao: Callable[[], Awaitable[T]],
+    excecoes: Tuple[Type[BaseException], ...],
+    tentativas: int = 5,
+    espera_inicial: float = 1.0,
+    espera_maxima: float = 30.0
+) -> T:
+    """
+    Executa a operação, repetindo-a quando falhar com uma das exceções informadas.
+    
+    A espera dobra a cada tentativa (limitada a espera_maxima) e recebe um
+    jitter aleatório de até espera_inicial, para que chamadas simultâneas
+    não voltem todas ao mesmo tempo.
+    
+    Args:
+        operacao: Função sem argumentos que cria a corrotina a ser executada
+        excecoes: Exceções consideradas transitórias
+        tentativas: Número máximo de tentativas
+        espera_inicial: Espera antes da segunda tentativa (segundos)
+        espera_maxima: Teto da espera entre tentativas (segundos)
+    
+    Returns:
+        O resultado da operação
+    
+    Raises:
+        A última exceção, se todas as tentativas falharem
+    """
+    tentativa = 1
+    while True:
+        try:
+            return await operacao()
+        except excecoes as e:
+            if tentativa >= tentativas:
+                raise
+            espera = min(espera_maxima, espera_inicial * 2 ** (tentativa - 1))
+            espera += random.uniform(0, espera_inicial)
+            logger.warning("⏳ [Retry] Tentativa %s/%s falhou (%s); nova tentativa em %.1fs", tentativa, tentativas, e, espera)
+            await asyncio.sleep(espera)
+            tentativa += 1
@@ -0,0 +1,115 @@
+"""
+Telemetria de uso das APIs de IA.
+
+Acumula, por modelo, os tokens consumidos, a latência e o custo estimado das
+chamadas, para orientar os ajustes de prompt, cache e escolha de modelo.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+# Preço em USD por milhão de tokens: (entrada, entrada em cache, saída)
+_PRECO_POR_MILHAO: Dict[str, Tuple[float, float, float]] = {
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-3.5-turbo": (0.50, 0.50, 1.50),
+    "text-embedding-3-small": (0.02, 0.02, 0.0),
+}
+
+
+class _UsoModelo:
+    """Contadores acumulados de um modelo."""
+    
+    __slots__ = ("chamadas", "tokens_entrada", "tokens_cache", "tokens_saida", "latencia_total_s")
+    
+    def __init__(self) -> None:
+        self.chamadas = 0
+        self.tokens_entrada = 0
+        self.tokens_cache = 0
+        self.tokens_saida = 0
+        self.latencia_total_s = 0.0
+
+
+class TelemetriaUso:
+    """
+    Registro em memória do uso das APIs de IA, por modelo.
+    
+    Usado apenas a partir do event loop, então dispensa lock. Os contadores
+    valem para o processo (cada worker mantém os seus).
+    """
+    
+    def __init__(self) -> None:
+        """Inicializa o registro vazio."""
+        self._por_modelo: Dict[str, _UsoModelo] = {}
+    
+    def registrar(
+        self,
+        modelo: str,
+        tokens_entrada: int,
+        tokens_saida: int,
+        tokens_cache: int = 0,
+        latencia_s: float = 0.0
+    ) -> None:
+        """
+        Registra uma chamada à API.
+        
+        Args:
+            modelo: Modelo que atendeu a chamada
+            tokens_entrada: Tokens de entrada, incluindo os vindos do cache de prompt
+            tokens_saida: Tokens gerados
+            tokens_cache: Tokens de entrada atendidos pelo cache de prompt
+            latencia_s: Duração da chamada, em segundos
+        """
+        uso = self._por_modelo.get(modelo)
+        if uso is None:
+            uso = self._por_modelo[modelo] = _UsoModelo()
+        uso.chamadas += 1
+        uso.tokens_entrada += tokens_entrada
+        uso.tokens_cache += tokens_cache
+        uso.tokens_saida += tokens_saida
+        uso.latencia_total_s += latencia_s
+    
+    def resumo(self) -> dict:
+        """
+        Retorna o uso acumulado por modelo.
+        
+        Returns:
+            Dicionário modelo -> chamadas, tokens, fração da entrada atendida
+            pelo cache de prompt, latência média e custo estimado em USD (None
+            para modelos sem preço conhecido)
+        """
+        return {
+            modelo: {
+                "chamadas": uso.chamadas,
+                "tokens_entrada": uso.tokens_entrada,
+                "tokens_cache": uso.tokens_cache,
+                "tokens_saida": uso.tokens_saida,
+                "taxa_cache_prompt": round(uso.tokens_cache / uso.tokens_entrada, 3) if uso.tokens_entrada else 0.0,
+                "latencia_media_s": round(uso.latencia_total_s / uso.chamadas, 3),
+                "custo_usd": _custo(modelo, uso),
+            }
+            for modelo, uso in self._por_modelo.items()
+        }
+
+
+def _custo(modelo: str, uso: _UsoModelo) -> Optional[float]:
+    """Estima o custo acumulado do modelo pela tabela de preços."""
+    # Versões datadas ("gpt-4o-mini-2024-07-18") usam o preço do modelo base
+    base = max((nome for nome in _PRECO_POR_MILHAO if modelo.startswith(nome)), key=len, default=None)
+    if base is None:
+        return None
+    
+    entrada, cache, saida = _PRECO_POR_MILHAO[base]
+    custo = (
+        (uso.tokens_entrada - uso.tokens_cache) * entrada
+        + uso.tokens_cache * cache
+        + uso.tokens_saida * saida
+    ) / 1_000_000
+    return round(custo, 6)
+
+
+@lru_cache(maxsize=1)
+def get_telemetria() -> TelemetriaUso:
+    """Retorna o registro de uso compartilhado pelo processo."""
+    return TelemetriaUso()
@@ -0,0 +1,37 @@
+"""
+Formatação dos cabeçalhos de email.
+
+Compartilhada pelos leitores de EML e MBOX.
+"""
+
+from email.message import Message
+from typing import List
+
+
+# Cabeçalho do email -> rótulo exibido no texto enviado ao classificador
+_CABECALHOS = (
+    ("From", "De"),
+    ("To", "Para"),
+    ("Subject", "Assunto"),
+    ("Date", "Data"),
+)
+
+
+def formatar_cabecalhos(msg: Message) -> List[str]:
+    """
+    Formata os cabeçalhos relevantes presentes no email, um por linha.
+    
+    Cada cabeçalho é lido uma única vez.
+    
+    Args:
+        msg: Email parseado
+    
+    Returns:
+        Linhas "Rótulo: valor", na ordem De, Para, Assunto, Data
+    """
+    linhas = []
+    for nome, rotulo in _CABECALHOS:
+        valor = msg.get(nome)
+        if valor:
+            linhas.append(f"{rotulo}: {valor}")
+    return linhas
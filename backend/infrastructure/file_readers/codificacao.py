@@ -0,0 +1,66 @@
+"""
+Decodificação de conteúdo textual com codificação declarada incerta.
+
+Compartilhada pelos leitores de TXT, EML e MBOX.
+"""
+
+import codecs
+from typing import Optional
+
+try:
+    # charset-normalizer é opcional: detecta a codificação em uma análise só,
+    # em vez de tentar decodificar o conteúdo inteiro várias vezes
+    from charset_normalizer import from_bytes
+except ImportError:  # pragma: no cover - depende do ambiente
+    from_bytes = None
+
+
+# Codificações legadas possíveis em emails em português. Sem essa restrição a
+# detecção erra em textos curtos (escolhe páginas de código árabes ou do
+# Leste Europeu)
+_CODIFICACOES_CANDIDATAS = ['cp1252', 'latin_1', 'iso8859_15']
+
+# Marcas de ordem de bytes (BOM) e a codificação que cada uma identifica
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def decodificar(conteudo: bytes, charset: Optional[str] = None) -> str:
+    """
+    Decodifica bytes para texto, tentando primeiro a codificação declarada.
+    
+    Sem codificação declarada, um BOM no início do conteúdo a identifica. Se
+    ela faltar, for desconhecida ou não servir, a codificação é detectada
+    (charset-normalizer); na falta dele, vale UTF-8 ou, por último, latin-1,
+    que aceita qualquer sequência de bytes.
+    
+    Args:
+        conteudo: Bytes a decodificar
+        charset: Codificação declarada (ex.: do cabeçalho Content-Type)
+    
+    Returns:
+        Texto decodificado
+    """
+    if not charset:
+        for bom, codificacao in _BOMS:
+            if conteudo.startswith(bom):
+                charset = codificacao
+                break
+    
+    try:
+        return conteudo.decode(charset or 'utf-8')
+    except (UnicodeDecodeError, LookupError):
+        pass
+    
+    if from_bytes is not None:
+        melhor = from_bytes(conteudo, cp_isolation=_CODIFICACOES_CANDIDATAS).best()
+        if melhor is not None:
+            return str(melhor)
+    
+    try:
+        return conteudo.decode('utf-8')
+    except UnicodeDecodeError:
+        return conteudo.decode('latin-1')
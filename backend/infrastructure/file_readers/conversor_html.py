@@ -0,0 +1,50 @@
+"""
+Conversão de corpos de email em HTML para texto simples.
+
+Compartilhada pelos leitores de EML e MBOX.
+"""
+
+import re
+from html import unescape
+
+try:
+    # selectolax é opcional: parser em C, bem mais rápido que as regex abaixo
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - depende do ambiente
+    HTMLParser = None
+
+
+# Caminho sem selectolax, compilado uma única vez por processo
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_HTML_RE = re.compile(r'<[^>]+>')
+_ESPACOS_RE = re.compile(r'\s+')
+
+
+def html_para_texto(html: str) -> str:
+    """
+    Extrai o texto visível de um HTML, em uma única linha.
+    
+    Descarta scripts e estilos, decodifica entidades (&amp;, &nbsp;...) e
+    colapsa os espaços em branco.
+    
+    Args:
+        html: Conteúdo HTML
+    
+    Returns:
+        Texto sem marcação
+    """
+    if HTMLParser is not None:
+        try:
+            arvore = HTMLParser(html)
+            arvore.strip_tags(["script", "style"])
+            raiz = arvore.body or arvore.root
+            texto = raiz.text(separator=" ") if raiz is not None else ""
+            return _ESPACOS_RE.sub(" ", texto).strip()
+        except Exception:
+            # HTML que o parser não aceita: segue pelas regex
+            pass
+    
+    texto = _SCRIPT_STYLE_RE.sub(" ", html)
+    texto = _TAG_HTML_RE.sub(" ", texto)
+    texto = unescape(texto)
+    return _ESPACOS_RE.sub(" ", texto).strip()
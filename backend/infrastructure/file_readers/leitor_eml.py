@@ -7,13 +7,15 @@ Implementação do LeitorArquivoPort para arquivos de email no formato EML (RFC
 import email
 from email import policy
 from email.message import EmailMessage
-from typing import Optional
+from typing import BinaryIO, Optional
 
-from application.ports.leitor_arquivo_port import LeitorArquivoPort
 from domain.exceptions import ArquivoInvalidoException
+from infrastructure.file_readers.cabecalhos import formatar_cabecalhos
+from infrastructure.file_readers.codificacao import decodificar
+from infrastructure.file_readers.conversor_html import html_para_texto
 
 
-class LeitorEml(LeitorArquivoPort):
+class LeitorEml:
     """
     Leitor para arquivos de email (.eml).
     
@@ -22,26 +24,25 @@ class LeitorEml(LeitorArquivoPort):
     """
     
     EXTENSOES_SUPORTADAS = {'.eml'}
-    ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
     
-    def ler(self, arquivo: bytes) -> str:
+    def ler(self, arquivo: BinaryIO) -> str:
         """
         Extrai o texto de um arquivo EML.
         
         Extrai cabeçalhos relevantes (De, Para, Assunto) e o corpo do email.
         
         Args:
-            arquivo: Conteúdo do arquivo em bytes
-            
+            arquivo: Stream binário do arquivo
+        
         Returns:
             Texto extraído do arquivo incluindo metadados
-            
+        
         Raises:
             ArquivoInvalidoException: Se não for possível ler o arquivo EML
         """
         try:
             # Tentar parsear o email
-            msg = email.message_from_bytes(arquivo, policy=policy.default)
+            msg = email.message_from_binary_file(arquivo, policy=policy.default)
             
             # Extrair cabeçalhos
             headers = self._extrair_cabecalhos(msg)
@@ -61,7 +62,7 @@ class LeitorEml(LeitorArquivoPort):
             partes.append(corpo)
             
             return "\n\n".join(partes)
-            
+        
         except Exception as e:
             if isinstance(e, ArquivoInvalidoException):
                 raise
@@ -71,21 +72,23 @@ class LeitorEml(LeitorArquivoPort):
     
     def _extrair_cabecalhos(self, msg: EmailMessage) -> str:
         """Extrai os cabeçalhos relevantes do email."""
-        cabecalhos = []
-        
-        if msg.get('From'):
-            cabecalhos.append(f"De: {msg.get('From')}")
-        if msg.get('To'):
-            cabecalhos.append(f"Para: {msg.get('To')}")
-        if msg.get('Subject'):
-            cabecalhos.append(f"Assunto: {msg.get('Subject')}")
-        if msg.get('Date'):
-            cabecalhos.append(f"Data: {msg.get('Date')}")
-        
-        return "\n".join(cabecalhos) if cabecalhos else ""
+        return "\n".join(formatar_cabecalhos(msg))
     
     def _extrair_corpo(self, msg: EmailMessage) -> Optional[str]:
         """Extrai o corpo do email, preferindo texto simples."""
+        # Vai direto à parte principal, sem decodificar as demais
+        parte = msg.get_body(preferencelist=('plain', 'html'))
+        if parte is not None:
+            corpo = self._decode_payload(parte)
+            if corpo:
+                if parte.get_content_type() == 'text/html':
+                    return self._limpar_html(corpo)
+                return corpo
+        
+        return self._percorrer_partes(msg)
+    
+    def _percorrer_partes(self, msg: EmailMessage) -> Optional[str]:
+        """Procura o corpo em todas as partes (estruturas que get_body não reconhece)."""
         corpo = None
         
         if msg.is_multipart():
@@ -97,7 +100,7 @@ class LeitorEml(LeitorArquivoPort):
                     corpo = self._decode_payload(part)
                     if corpo:
                         break
-                        
+                
                 # Usar HTML como fallback
                 elif content_type == 'text/html' and not corpo:
                     html_content = self._decode_payload(part)
@@ -118,30 +121,19 @@ class LeitorEml(LeitorArquivoPort):
         try:
             payload = part.get_payload(decode=True)
             if payload:
-                # Tentar diferentes encodings
-                charset = part.get_content_charset() or 'utf-8'
-                try:
-                    return payload.decode(charset)
-                except (UnicodeDecodeError, LookupError):
-                    for enc in self.ENCODINGS:
-                        try:
-                            return payload.decode(enc)
-                        except UnicodeDecodeError:
-                            continue
+                return decodificar(payload, part.get_content_charset())
         except Exception:
             pass
         return None
     
     def _limpar_html(self, html: str) -> str:
-        """Remove tags HTML de forma simples."""
-        import re
-        # Remover tags
-        texto = re.sub(r'<[^>]+>', ' ', html)
-        # Remover múltiplos espaços
-        texto = re.sub(r'\s+', ' ', texto)
-        # Remover espaços no início/fim de linhas
-        texto = "\n".join(line.strip() for line in texto.split('\n'))
-        return texto.strip()
+        """Remove tags HTML, scripts e estilos."""
+        # Já sai em uma única linha, sem espaços nas pontas
+        return html_para_texto(html)
+    
+    def extensoes_suportadas(self) -> tuple[str, ...]:
+        """Retorna as extensões suportadas pelo leitor."""
+        return tuple(self.EXTENSOES_SUPORTADAS)
     
     def suporta_extensao(self, extensao: str) -> bool:
         """
@@ -149,7 +141,7 @@ class LeitorEml(LeitorArquivoPort):
         
         Args:
             extensao: Extensão do arquivo (ex: '.eml')
-            
+        
         Returns:
             True se a extensão for suportada
         """
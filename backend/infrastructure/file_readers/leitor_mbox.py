@@ -4,16 +4,18 @@ Leitor de arquivos MBOX.
 Implementação do LeitorArquivoPort para arquivos MBOX (múltiplos emails).
 """
 
-import mailbox
-import tempfile
-import os
-from typing import List
+from email import policy
+from email.message import EmailMessage
+from email.parser import BytesFeedParser
+from typing import BinaryIO, Iterator, List, Optional
 
-from application.ports.leitor_arquivo_port import LeitorArquivoPort
 from domain.exceptions import ArquivoInvalidoException
+from infrastructure.file_readers.cabecalhos import formatar_cabecalhos
+from infrastructure.file_readers.codificacao import decodificar
+from infrastructure.file_readers.conversor_html import html_para_texto
 
 
-class LeitorMbox(LeitorArquivoPort):
+class LeitorMbox:
     """
     Leitor para arquivos MBOX (.mbox).
     
@@ -24,57 +26,48 @@ class LeitorMbox(LeitorArquivoPort):
     """
     
     EXTENSOES_SUPORTADAS = {'.mbox'}
-    ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
     MAX_EMAILS = 10  # Limitar quantidade de emails para não sobrecarregar
     
-    def ler(self, arquivo: bytes) -> str:
+    def ler(self, arquivo: BinaryIO) -> str:
         """
         Extrai o texto de um arquivo MBOX.
         
-        Extrai até MAX_EMAILS emails do arquivo.
+        Extrai até MAX_EMAILS emails do arquivo, lendo o stream uma única
+        vez: os emails além do limite são apenas contados.
         
         Args:
-            arquivo: Conteúdo do arquivo em bytes
-            
+            arquivo: Stream binário do arquivo
+        
         Returns:
             Texto extraído de todos os emails concatenados
-            
+        
         Raises:
             ArquivoInvalidoException: Se não for possível ler o arquivo MBOX
         """
         try:
-            # Salvar em arquivo temporário para processar
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mbox') as tmp:
-                tmp.write(arquivo)
-                tmp_path = tmp.name
+            emails_texto: List[str] = []
+            mensagens = self._iterar_mensagens(arquivo)
             
-            try:
-                mbox = mailbox.mbox(tmp_path)
-                emails_texto = []
-                
-                for i, msg in enumerate(mbox):
-                    if i >= self.MAX_EMAILS:
-                        emails_texto.append(
-                            f"\n[... Mais {len(mbox) - self.MAX_EMAILS} emails não exibidos ...]"
-                        )
-                        break
-                    
-                    email_texto = self._extrair_email(msg, i + 1)
-                    if email_texto:
-                        emails_texto.append(email_texto)
-                
-                mbox.close()
-                
-                if not emails_texto:
-                    raise ArquivoInvalidoException(
-                        "O arquivo MBOX não contém emails legíveis."
+            for i, msg in enumerate(mensagens):
+                if i >= self.MAX_EMAILS:
+                    # O gerador segue só contando os separadores restantes
+                    restantes = 1 + sum(1 for _ in mensagens)
+                    emails_texto.append(
+                        f"\n[... Mais {restantes} emails não exibidos ...]"
                     )
+                    break
                 
-                return "\n\n".join(emails_texto)
-                
-            finally:
-                os.unlink(tmp_path)
-                
+                email_texto = self._extrair_email(msg, i + 1)
+                if email_texto:
+                    emails_texto.append(email_texto)
+            
+            if not emails_texto:
+                raise ArquivoInvalidoException(
+                    "O arquivo MBOX não contém emails legíveis."
+                )
+            
+            return "\n\n".join(emails_texto)
+        
         except Exception as e:
             if isinstance(e, ArquivoInvalidoException):
                 raise
@@ -82,19 +75,39 @@ class LeitorMbox(LeitorArquivoPort):
                 f"Não foi possível ler o arquivo MBOX: {str(e)}"
             )
     
+    def _iterar_mensagens(self, arquivo: BinaryIO) -> Iterator[Optional[EmailMessage]]:
+        """
+        Percorre o stream separando os emails pelas linhas "From " do formato MBOX.
+        
+        Cada email é montado por um parser incremental, sem arquivo temporário.
+        Após MAX_EMAILS mensagens, as seguintes não são mais parseadas: o
+        gerador só sinaliza cada uma com None, para a contagem.
+        """
+        parser: Optional[BytesFeedParser] = None
+        lidas = 0
+        
+        for linha in arquivo:
+            if linha.startswith(b"From "):
+                if parser is not None:
+                    yield parser.close()
+                lidas += 1
+                if lidas > self.MAX_EMAILS:
+                    parser = None
+                    yield None
+                else:
+                    parser = BytesFeedParser(policy=policy.default)
+            elif parser is not None:
+                parser.feed(linha)
+        
+        if parser is not None:
+            yield parser.close()
+    
     def _extrair_email(self, msg, numero: int) -> str:
         """Extrai texto de um email individual do MBOX."""
         partes = [f"=== Email {numero} ==="]
         
         # Cabeçalhos
-        if msg.get('From'):
-            partes.append(f"De: {msg.get('From')}")
-        if msg.get('To'):
-            partes.append(f"Para: {msg.get('To')}")
-        if msg.get('Subject'):
-            partes.append(f"Assunto: {msg.get('Subject')}")
-        if msg.get('Date'):
-            partes.append(f"Data: {msg.get('Date')}")
+        partes.extend(formatar_cabecalhos(msg))
         
         partes.append("")  # Linha em branco
         
@@ -106,7 +119,21 @@ class LeitorMbox(LeitorArquivoPort):
         return "\n".join(partes)
     
     def _extrair_corpo(self, msg) -> str:
-        """Extrai o corpo do email."""
+        """Extrai o corpo do email, preferindo texto simples."""
+        # Vai direto à parte principal, sem decodificar as demais
+        parte = msg.get_body(preferencelist=('plain', 'html'))
+        if parte is not None:
+            payload = parte.get_payload(decode=True)
+            corpo = self._decode_payload(payload, parte) if payload else ""
+            if corpo:
+                if parte.get_content_type() == 'text/html':
+                    return self._limpar_html(corpo)
+                return corpo
+        
+        return self._percorrer_partes(msg)
+    
+    def _percorrer_partes(self, msg) -> str:
+        """Procura o corpo em todas as partes (estruturas que get_body não reconhece)."""
         corpo = None
         
         if msg.is_multipart():
@@ -119,7 +146,7 @@ class LeitorMbox(LeitorArquivoPort):
                         corpo = self._decode_payload(payload, part)
                         if corpo:
                             break
-                            
+                
                 elif content_type == 'text/html' and not corpo:
                     payload = part.get_payload(decode=True)
                     if payload:
@@ -137,23 +164,15 @@ class LeitorMbox(LeitorArquivoPort):
     
     def _decode_payload(self, payload: bytes, part) -> str:
         """Decodifica o payload."""
-        charset = part.get_content_charset() or 'utf-8'
-        try:
-            return payload.decode(charset)
-        except (UnicodeDecodeError, LookupError):
-            for enc in self.ENCODINGS:
-                try:
-                    return payload.decode(enc)
-                except UnicodeDecodeError:
-                    continue
-        return ""
+        return decodificar(payload, part.get_content_charset())
     
     def _limpar_html(self, html: str) -> str:
-        """Remove tags HTML."""
-        import re
-        texto = re.sub(r'<[^>]+>', ' ', html)
-        texto = re.sub(r'\s+', ' ', texto)
-        return texto.strip()
+        """Remove tags HTML, scripts e estilos."""
+        return html_para_texto(html)
+    
+    def extensoes_suportadas(self) -> tuple[str, ...]:
+        """Retorna as extensões suportadas pelo leitor."""
+        return tuple(self.EXTENSOES_SUPORTADAS)
     
     def suporta_extensao(self, extensao: str) -> bool:
         """
@@ -161,7 +180,7 @@ class LeitorMbox(LeitorArquivoPort):
         
         Args:
             extensao: Extensão do arquivo (ex: '.mbox')
-            
+        
         Returns:
             True se a extensão for suportada
         """
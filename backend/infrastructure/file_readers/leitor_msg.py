@@ -4,14 +4,31 @@ Leitor de arquivos MSG.
 Implementação do LeitorArquivoPort para arquivos de email no formato MSG (Microsoft Outlook).
 """
 
-import struct
-from typing import Optional
+import re
+from typing import BinaryIO, Optional
 
-from application.ports.leitor_arquivo_port import LeitorArquivoPort
 from domain.exceptions import ArquivoInvalidoException
 
+try:
+    # extract-msg é opcional: sem ele, o texto é extraído de forma simplificada
+    import extract_msg
+except ImportError:  # pragma: no cover - depende do ambiente
+    extract_msg = None
 
-class LeitorMsg(LeitorArquivoPort):
+
+# Sequências de texto legível no binário do MSG (extração sem extract-msg)
+_CLASSE_LEGIVEL = r'[\w\s@.\-,!?:;()]'
+_TEXTO_LEGIVEL_RE = re.compile(_CLASSE_LEGIVEL + '{20,}')
+
+# Tabela para bytes.translate: bytes ASCII fora da classe legível viram \x00
+# (separador); bytes >= 0x80 são mantidos, pois podem compor caracteres UTF-8
+_TABELA_LEGIVEL = bytes(
+    i if i >= 0x80 or re.fullmatch(_CLASSE_LEGIVEL, chr(i)) else 0
+    for i in range(256)
+)
+
+
+class LeitorMsg:
     """
     Leitor para arquivos de email MSG (.msg).
     
@@ -21,12 +38,12 @@ class LeitorMsg(LeitorArquivoPort):
     
     EXTENSOES_SUPORTADAS = {'.msg'}
     
-    def ler(self, arquivo: bytes) -> str:
+    def ler(self, arquivo: BinaryIO) -> str:
         """
         Extrai o texto de um arquivo MSG.
         
         Args:
-            arquivo: Conteúdo do arquivo em bytes
+            arquivo: Stream binário do arquivo
             
         Returns:
             Texto extraído do arquivo
@@ -35,46 +52,30 @@ class LeitorMsg(LeitorArquivoPort):
             ArquivoInvalidoException: Se não for possível ler o arquivo MSG
         """
         try:
-            # Tentar usar a biblioteca extract-msg se disponível
-            try:
-                import extract_msg
+            if extract_msg is None:
+                # Fallback: extrair texto de forma simplificada
+                return self._extrair_texto_simplificado(arquivo.read())
+            
+            # O extract-msg (olefile) lê direto do stream: sem arquivo temporário
+            with extract_msg.Message(arquivo) as msg:
+                partes = []
                 
-                # Salvar temporariamente para processar
-                import tempfile
-                import os
+                # Extrair cabeçalhos
+                if msg.sender:
+                    partes.append(f"De: {msg.sender}")
+                if msg.to:
+                    partes.append(f"Para: {msg.to}")
+                if msg.subject:
+                    partes.append(f"Assunto: {msg.subject}")
+                if msg.date:
+                    partes.append(f"Data: {msg.date}")
                 
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.msg') as tmp:
-                    tmp.write(arquivo)
-                    tmp_path = tmp.name
+                # Extrair corpo
+                corpo = msg.body or ""
                 
-                try:
-                    msg = extract_msg.Message(tmp_path)
-                    
-                    partes = []
-                    
-                    # Extrair cabeçalhos
-                    if msg.sender:
-                        partes.append(f"De: {msg.sender}")
-                    if msg.to:
-                        partes.append(f"Para: {msg.to}")
-                    if msg.subject:
-                        partes.append(f"Assunto: {msg.subject}")
-                    if msg.date:
-                        partes.append(f"Data: {msg.date}")
-                    
-                    # Extrair corpo
-                    corpo = msg.body or ""
-                    
-                    if partes:
-                        return "\n".join(partes) + "\n\n" + corpo
-                    return corpo
-                    
-                finally:
-                    os.unlink(tmp_path)
-                    
-            except ImportError:
-                # Fallback: extrair texto de forma simplificada
-                return self._extrair_texto_simplificado(arquivo)
+                if partes:
+                    return "\n".join(partes) + "\n\n" + corpo
+                return corpo
                 
         except Exception as e:
             if isinstance(e, ArquivoInvalidoException):
@@ -98,31 +99,30 @@ class LeitorMsg(LeitorArquivoPort):
         # Extrair strings UTF-16 e ASCII do arquivo
         texto_partes = []
         
-        # Tentar extrair texto UTF-16
-        try:
-            # Procurar por sequências de texto UTF-16
-            i = 0
-            while i < len(arquivo) - 2:
-                if arquivo[i:i+2] == b'\xff\xfe':  # BOM UTF-16 LE
-                    # Tentar decodificar
-                    end = arquivo.find(b'\x00\x00', i + 2)
-                    if end > i:
-                        try:
-                            texto = arquivo[i:end+2].decode('utf-16-le', errors='ignore')
-                            if len(texto) > 10 and texto.isprintable():
-                                texto_partes.append(texto)
-                        except:
-                            pass
-                i += 1
-        except:
-            pass
+        # Procurar por sequências de texto UTF-16 a partir de cada BOM UTF-16 LE;
+        # bytes.find percorre o buffer em C, sem uma fatia por posição
+        i = arquivo.find(b'\xff\xfe')
+        while i != -1 and i < len(arquivo) - 2:
+            end = arquivo.find(b'\x00\x00', i + 2)
+            if end == -1:
+                # Nenhum BOM adiante terá terminador
+                break
+            # Trechos de até 10 caracteres (2 bytes cada) são descartados sem decodificar
+            if (end + 2 - i) // 2 > 10:
+                texto = arquivo[i:end+2].decode('utf-16-le', errors='ignore')
+                if len(texto) > 10 and texto.isprintable():
+                    texto_partes.append(texto)
+            i = arquivo.find(b'\xff\xfe', i + 1)
         
-        # Tentar extrair texto ASCII/UTF-8
-        import re
-        texto_ascii = arquivo.decode('utf-8', errors='ignore')
-        # Encontrar sequências de texto legível
-        matches = re.findall(r'[\w\s@.\-,!?:;()]{20,}', texto_ascii)
-        texto_partes.extend(matches)
+        # Tentar extrair texto ASCII/UTF-8: translate + split separam, em C,
+        # os trechos candidatos; só os que têm bytes não ASCII passam pela regex
+        for trecho in arquivo.translate(_TABELA_LEGIVEL).split(b'\x00'):
+            if len(trecho) < 20:
+                continue
+            if trecho.isascii():
+                texto_partes.append(trecho.decode('ascii'))
+            else:
+                texto_partes.extend(_TEXTO_LEGIVEL_RE.findall(trecho.decode('utf-8', errors='ignore')))
         
         if not texto_partes:
             raise ArquivoInvalidoException(
@@ -130,7 +130,12 @@ class LeitorMsg(LeitorArquivoPort):
                 "Considere instalar a biblioteca 'extract-msg' para melhor suporte."
             )
         
-        return "\n".join(set(texto_partes))
+        # Remove repetições mantendo a primeira ocorrência (trechos UTF-16 antes dos ASCII)
+        return "\n".join(dict.fromkeys(texto_partes))
+    
+    def extensoes_suportadas(self) -> tuple[str, ...]:
+        """Retorna as extensões suportadas pelo leitor."""
+        return tuple(self.EXTENSOES_SUPORTADAS)
     
     def suporta_extensao(self, extensao: str) -> bool:
         """
@@ -4,11 +4,12 @@ Leitor de arquivos TXT.
 Implementação do LeitorArquivoPort para arquivos de texto simples.
 """
 
-from application.ports.leitor_arquivo_port import LeitorArquivoPort
-from domain.exceptions import ArquivoInvalidoException
+from typing import BinaryIO
 
+from infrastructure.file_readers.codificacao import decodificar
 
-class LeitorTxt(LeitorArquivoPort):
+
+class LeitorTxt:
     """
     Leitor para arquivos de texto (.txt).
     
@@ -16,31 +17,24 @@ class LeitorTxt(LeitorArquivoPort):
     """
     
     EXTENSOES_SUPORTADAS = {'.txt', '.text'}
-    ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
     
-    def ler(self, arquivo: bytes) -> str:
+    def ler(self, arquivo: BinaryIO) -> str:
         """
         Extrai o texto de um arquivo TXT.
         
         Args:
-            arquivo: Conteúdo do arquivo em bytes
+            arquivo: Stream binário do arquivo
             
         Returns:
             Texto extraído do arquivo
-            
-        Raises:
-            ArquivoInvalidoException: Se não for possível decodificar o arquivo
         """
-        for encoding in self.ENCODINGS:
-            try:
-                return arquivo.decode(encoding)
-            except UnicodeDecodeError:
-                continue
-        
-        raise ArquivoInvalidoException(
-            "Não foi possível decodificar o arquivo. "
-            "Verifique se é um arquivo de texto válido."
-        )
+        # BOM, UTF-8 ou detecção da codificação: uma decodificação na maioria
+        # dos casos, em vez de tentar as codificações uma a uma
+        return decodificar(arquivo.read())
+    
+    def extensoes_suportadas(self) -> tuple[str, ...]:
+        """Retorna as extensões suportadas pelo leitor."""
+        return tuple(self.EXTENSOES_SUPORTADAS)
     
     def suporta_extensao(self, extensao: str) -> bool:
         """
@@ -1,4 +1,5 @@
 # NLP - Natural Language Processing
 from infrastructure.nlp.preprocessador import PreprocessadorTexto
+from infrastructure.nlp.classificador_heuristico import ClassificadorHeuristico
 
-__all__ = ["PreprocessadorTexto"]
+__all__ = ["PreprocessadorTexto", "ClassificadorHeuristico"]
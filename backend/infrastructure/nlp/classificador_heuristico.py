@@ -0,0 +1,133 @@
+"""
+Classificador heurístico local.
+
+Reconhece emails claramente improdutivos (felicitações, newsletters,
+notificações automáticas) por palavras-chave, sem chamar a API de IA.
+"""
+
+import re
+from typing import Optional
+
+from domain.entities.email import CategoriaEmail
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+
+
+# Sinais de email improdutivo, um padrão por tipo de resposta
+_FELICITACAO_RE = re.compile(
+    r'\b(feliz natal|feliz ano novo|boas festas|feliz anivers[aá]rio|parab[eé]ns)\b',
+    re.IGNORECASE
+)
+_MARKETING_RE = re.compile(
+    r'\b(newsletter|inscreva-se|descadastr\w*|unsubscribe|promo[cç][aã]o)\b',
+    re.IGNORECASE
+)
+_NOTIFICACAO_RE = re.compile(
+    r'\b(n[aã]o[- ]?responda|no[- ]?reply|noreply|(?:boleto|fatura) vence\w*)\b',
+    re.IGNORECASE
+)
+
+# Sinais de que há um pedido real: nestes casos a decisão fica com o modelo.
+# Amplo de propósito: deixar passar um improdutivo custa uma chamada à API,
+# enquanto responder um pedido com a resposta pronta perde o pedido
+_PEDIDO_RE = re.compile(
+    r'\?|\b(problema|erro|errad\w*|ajuda|suporte|chamado|status|d[uú]vida|solicit\w*|'
+    r'urgente|preciso|precisamos|favor|corrig\w*|consegu\w*|falta\w*|pedido|nota fiscal|'
+    r'reenvi\w*|recus\w*|cancel\w*|reembols\w*|estorn\w*|contrato|reuni[aã]o)\b',
+    re.IGNORECASE
+)
+
+# Respostas cordiais prontas, no mesmo formato das geradas pelo modelo
+_RESPOSTA_FELICITACAO = (
+    "Olá,\n\n"
+    "Agradecemos a mensagem e o carinho! Retribuímos os votos e desejamos "
+    "muito sucesso.\n\n"
+    "Atenciosamente,"
+)
+_RESPOSTA_MARKETING = (
+    "Olá,\n\n"
+    "Agradecemos o envio da comunicação. Registramos o conteúdo e, havendo "
+    "interesse, entraremos em contato.\n\n"
+    "Atenciosamente,"
+)
+_RESPOSTA_NOTIFICACAO = (
+    "Olá,\n\n"
+    "Agradecemos a notificação. A informação foi recebida e registrada pela "
+    "nossa equipe.\n\n"
+    "Atenciosamente,"
+)
+
+# Sinais em ordem decrescente de confiança: felicitações são inequívocas,
+# enquanto um aviso de vencimento ainda pode acompanhar um pedido
+_SINAIS = (
+    (_FELICITACAO_RE, 0.95, _RESPOSTA_FELICITACAO),
+    (_MARKETING_RE, 0.90, _RESPOSTA_MARKETING),
+    (_NOTIFICACAO_RE, 0.85, _RESPOSTA_NOTIFICACAO),
+)
+
+
+class ClassificadorHeuristico:
+    """
+    Filtro local para emails obviamente improdutivos.
+    
+    Só decide quando o texto é curto, contém um sinal claro de improdutivo
+    e nenhum sinal de pedido, e a confiança do sinal atinge o limiar; caso
+    contrário devolve None e o email segue para o modelo de IA.
+    """
+    
+    LIMIAR_PADRAO = 0.85
+    
+    def __init__(self, tamanho_maximo: int = 300, limiar: float = LIMIAR_PADRAO):
+        """
+        Inicializa o classificador.
+        
+        Args:
+            tamanho_maximo: Tamanho máximo (em caracteres) de texto avaliado
+            limiar: Confiança mínima para decidir sem o modelo; ajustado pela
+                taxa_decisao e pelos erros observados (acima de 0.95 desativa)
+        """
+        self._tamanho_maximo = tamanho_maximo
+        self._limiar = limiar
+        self._avaliados = 0
+        self._decididos = 0
+    
+    @property
+    def taxa_decisao(self) -> float:
+        """Fração dos emails avaliados que foram decididos localmente."""
+        return self._decididos / self._avaliados if self._avaliados else 0.0
+    
+    def classificar(self, conteudo: str) -> Optional[ClassificacaoResultado]:
+        """
+        Classifica o email localmente, se houver sinal suficiente.
+        
+        Args:
+            conteudo: Texto do email
+        
+        Returns:
+            ClassificacaoResultado improdutivo, ou None se a decisão deve ficar com o modelo
+        """
+        self._avaliados += 1
+        if len(conteudo) > self._tamanho_maximo or _PEDIDO_RE.search(conteudo):
+            return None
+        
+        for padrao, confianca, resposta in _SINAIS:
+            if confianca < self._limiar:
+                return None
+            if padrao.search(conteudo):
+                self._decididos += 1
+                return ClassificacaoResultado(
+                    categoria=CategoriaEmail.IMPRODUTIVO,
+                    confianca=confianca,
+                    resposta_sugerida=resposta
+                )
+        return None
+    
+    def sugere_improdutivo(self, conteudo: str) -> bool:
+        """
+        Indica se o email tem sinais de improdutivo, sem limite de tamanho.
+        
+        Sinal mais fraco que classificar(): serve para prever o resultado
+        provável, não para dispensar o modelo.
+        """
+        if _PEDIDO_RE.search(conteudo):
+            return False
+        return any(padrao.search(conteudo) for padrao, _, _ in _SINAIS)
@@ -4,10 +4,66 @@ Preprocessador de Texto para NLP.
 Responsável pelo pré-processamento de texto antes da classificação.
 """
 
+import asyncio
 import re
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import List
 
 
+# Padrões compilados uma única vez por processo
+_HEADER_RE = re.compile(
+    r'^(?:De|From|Para|To|Cc|Bcc|Assunto|Subject|Data|Date):.*$|^-{3,}.*$|^={3,}.*$',
+    re.MULTILINE | re.IGNORECASE
+)
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+\.\S+')
+# Só casam trechos que de fato mudam: quebras e espaços simples, a maioria
+# em textos comuns, ficam como estão, sem uma substituição por palavra
+_QUEBRAS_RE = re.compile(r'\n{2,}')
+_ESPACOS_RE = re.compile(r'\t[ \t]*| [ \t]+')
+
+# Trechos sem os quais nenhuma das substituições acima altera o texto
+_GATILHOS_SUBSTITUICAO = ('://', 'www.', '\n\n', '\t', '  ')
+
+# Stopwords em português, montadas uma única vez e compartilhadas
+_STOPWORDS_PT: frozenset[str] = frozenset({
+    'a', 'o', 'e', 'é', 'de', 'da', 'do', 'em', 'um', 'uma',
+    'para', 'com', 'não', 'uma', 'os', 'no', 'se', 'na', 'por',
+    'mais', 'as', 'dos', 'como', 'mas', 'foi', 'ao', 'ele', 'das',
+    'tem', 'à', 'seu', 'sua', 'ou', 'ser', 'quando', 'muito', 'há',
+    'nos', 'já', 'está', 'eu', 'também', 'só', 'pelo', 'pela', 'até',
+    'isso', 'ela', 'entre', 'era', 'depois', 'sem', 'mesmo', 'aos',
+    'ter', 'seus', 'quem', 'nas', 'me', 'esse', 'eles', 'estão',
+    'você', 'tinha', 'foram', 'essa', 'num', 'nem', 'suas', 'meu',
+    'às', 'minha', 'têm', 'numa', 'pelos', 'elas', 'havia', 'seja',
+    'qual', 'será', 'nós', 'tenho', 'lhe', 'deles', 'essas', 'esses',
+    'pelas', 'este', 'fosse', 'dele', 'tu', 'te', 'vocês', 'vos',
+    'lhes', 'meus', 'minhas', 'teu', 'tua', 'teus', 'tuas', 'nosso',
+    'nossa', 'nossos', 'nossas', 'dela', 'delas', 'esta', 'estes',
+    'estas', 'aquele', 'aquela', 'aqueles', 'aquelas', 'isto',
+    'aquilo', 'estou', 'está', 'estamos', 'estão', 'estive',
+    'esteve', 'estivemos', 'estiveram', 'estava', 'estávamos',
+    'estavam', 'estivera', 'estivéramos', 'esteja', 'estejamos',
+    'estejam', 'estivesse', 'estivéssemos', 'estivessem', 'estiver',
+    'estivermos', 'estiverem', 'hei', 'há', 'havemos', 'hão',
+    'houve', 'houvemos', 'houveram', 'houvera', 'houvéramos',
+    'haja', 'hajamos', 'hajam', 'houvesse', 'houvéssemos',
+    'houvessem', 'houver', 'houvermos', 'houverem', 'houverei',
+    'houverá', 'houveremos', 'houverão', 'houveria', 'houveríamos',
+    'houveriam', 'sou', 'somos', 'são', 'era', 'éramos', 'eram',
+    'fui', 'foi', 'fomos', 'foram', 'fora', 'fôramos', 'seja',
+    'sejamos', 'sejam', 'fosse', 'fôssemos', 'fossem', 'for',
+    'formos', 'forem', 'serei', 'será', 'seremos', 'serão', 'seria',
+    'seríamos', 'seriam', 'tenho', 'tem', 'temos', 'tém', 'tinha',
+    'tínhamos', 'tinham', 'tive', 'teve', 'tivemos', 'tiveram',
+    'tivera', 'tivéramos', 'tenha', 'tenhamos', 'tenham', 'tivesse',
+    'tivéssemos', 'tivessem', 'tiver', 'tivermos', 'tiverem',
+    'terei', 'terá', 'teremos', 'terão', 'teria', 'teríamos', 'teriam'
+})
+
+
 class PreprocessadorTexto:
     """
     Responsável pelo pré-processamento de texto para análise de NLP.
@@ -18,6 +74,12 @@ class PreprocessadorTexto:
     - Limpeza de formatação de email
     """
     
+    # Acima deste tamanho (~1 ms de processamento) o texto é processado fora do event loop
+    LIMITE_PROCESSAMENTO_SINCRONO = 20_000
+    
+    # Textos processados mantidos para reenvios do mesmo email
+    TAMANHO_CACHE = 1024
+    
     def __init__(self, remover_stopwords: bool = False):
         """
         Inicializa o preprocessador.
@@ -26,7 +88,10 @@ class PreprocessadorTexto:
             remover_stopwords: Se deve remover stopwords (palavras comuns)
         """
         self._remover_stopwords = remover_stopwords
-        self._stopwords_pt = self._carregar_stopwords()
+        # Indexado pelo hash do texto original; o lock cobre as chamadas vindas
+        # do pool de threads (textos longos)
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock_cache = threading.Lock()
     
     def processar(self, texto: str, preservar_headers: bool = True) -> str:
         """
@@ -36,10 +101,38 @@ class PreprocessadorTexto:
             texto: Texto original a ser processado
             preservar_headers: Se True, mantém os headers do email (De, Para, Assunto)
                               para que a IA possa extrair metadados. Default: True
-            
+        
         Returns:
             Texto processado e normalizado
         """
+        # Caminho rápido (comum em textos curtos): sem URL nem espaços a
+        # normalizar, o resultado é o próprio texto sem as bordas
+        if (
+            preservar_headers
+            and not self._remover_stopwords
+            and not any(gatilho in texto for gatilho in _GATILHOS_SUBSTITUICAO)
+        ):
+            return texto.strip()
+        
+        chave = blake2b(
+            (b"h" if preservar_headers else b"-") + texto.encode("utf-8"), digest_size=16
+        ).digest()
+        with self._lock_cache:
+            processado = self._cache.get(chave)
+            if processado is not None:
+                self._cache.move_to_end(chave)
+                return processado
+        
+        processado = self._processar_sem_cache(texto, preservar_headers)
+        
+        with self._lock_cache:
+            self._cache[chave] = processado
+            if len(self._cache) > self.TAMANHO_CACHE:
+                self._cache.popitem(last=False)
+        return processado
+    
+    def _processar_sem_cache(self, texto: str, preservar_headers: bool) -> str:
+        """Aplica as etapas de pré-processamento ao texto."""
         # NÃO remover headers por padrão - a IA precisa deles para extrair metadados
         if not preservar_headers:
             texto = self._limpar_headers_email(texto)
@@ -54,70 +147,67 @@ class PreprocessadorTexto:
         
         return texto.strip()
     
+    async def processar_async(self, texto: str, preservar_headers: bool = True) -> str:
+        """
+        Versão para o event loop de processar().
+        
+        Textos curtos são processados direto; textos longos vão para o pool de
+        threads padrão, para não bloquear as outras requisições em andamento.
+        
+        Args:
+            texto: Texto original a ser processado
+            preservar_headers: Se True, mantém os headers do email
+        
+        Returns:
+            Texto processado e normalizado
+        """
+        if len(texto) <= self.LIMITE_PROCESSAMENTO_SINCRONO:
+            return self.processar(texto, preservar_headers)
+        
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.processar, texto, preservar_headers
+        )
+    
+    def truncar(self, texto: str, max_caracteres: int) -> str:
+        """
+        Limita o tamanho do texto preservando início e fim.
+        
+        Cabeçalhos e assunto ficam no início e a assinatura/pedido final no fim,
+        por isso o trecho removido é o do meio.
+        
+        Args:
+            texto: Texto a ser limitado
+            max_caracteres: Tamanho máximo aproximado do resultado
+        
+        Returns:
+            O próprio texto, se couber, ou início + marcador + fim
+        """
+        if len(texto) <= max_caracteres:
+            return texto
+        
+        metade = max_caracteres // 2
+        return texto[:metade] + "\n[...TRUNCADO...]\n" + texto[-metade:]
+    
     def _limpar_headers_email(self, texto: str) -> str:
         """Remove headers comuns de email (De:, Para:, Assunto:, etc.)."""
-        padroes = [
-            r'^(De|From|Para|To|Cc|Bcc|Assunto|Subject|Data|Date):.*$',
-            r'^-{3,}.*$',
-            r'^={3,}.*$',
-        ]
-        for padrao in padroes:
-            texto = re.sub(padrao, '', texto, flags=re.MULTILINE | re.IGNORECASE)
-        return texto
+        # Cabeçalhos e linhas separadoras em uma única passada
+        return _HEADER_RE.sub('', texto)
     
     def _remover_urls(self, texto: str) -> str:
         """Remove URLs do texto."""
-        return re.sub(r'https?://\S+|www\.\S+', '', texto)
+        return _URL_RE.sub('', texto)
     
     def _remover_emails(self, texto: str) -> str:
         """Remove endereços de email do texto."""
-        return re.sub(r'\S+@\S+\.\S+', '', texto)
+        return _EMAIL_RE.sub('', texto)
     
     def _normalizar_espacos(self, texto: str) -> str:
         """Normaliza múltiplos espaços e quebras de linha."""
-        texto = re.sub(r'\n+', '\n', texto)
-        texto = re.sub(r'[ \t]+', ' ', texto)
-        return texto
+        texto = _QUEBRAS_RE.sub('\n', texto)
+        return _ESPACOS_RE.sub(' ', texto)
     
     def _filtrar_stopwords(self, texto: str) -> str:
         """Remove stopwords do texto."""
         palavras = texto.lower().split()
-        palavras_filtradas = [p for p in palavras if p not in self._stopwords_pt]
+        palavras_filtradas = [p for p in palavras if p not in _STOPWORDS_PT]
         return ' '.join(palavras_filtradas)
-    
-    def _carregar_stopwords(self) -> set:
-        """Carrega lista de stopwords em português."""
-        return {
-            'a', 'o', 'e', 'é', 'de', 'da', 'do', 'em', 'um', 'uma',
-            'para', 'com', 'não', 'uma', 'os', 'no', 'se', 'na', 'por',
-            'mais', 'as', 'dos', 'como', 'mas', 'foi', 'ao', 'ele', 'das',
-            'tem', 'à', 'seu', 'sua', 'ou', 'ser', 'quando', 'muito', 'há',
-            'nos', 'já', 'está', 'eu', 'também', 'só', 'pelo', 'pela', 'até',
-            'isso', 'ela', 'entre', 'era', 'depois', 'sem', 'mesmo', 'aos',
-            'ter', 'seus', 'quem', 'nas', 'me', 'esse', 'eles', 'estão',
-            'você', 'tinha', 'foram', 'essa', 'num', 'nem', 'suas', 'meu',
-            'às', 'minha', 'têm', 'numa', 'pelos', 'elas', 'havia', 'seja',
-            'qual', 'será', 'nós', 'tenho', 'lhe', 'deles', 'essas', 'esses',
-            'pelas', 'este', 'fosse', 'dele', 'tu', 'te', 'vocês', 'vos',
-            'lhes', 'meus', 'minhas', 'teu', 'tua', 'teus', 'tuas', 'nosso',
-            'nossa', 'nossos', 'nossas', 'dela', 'delas', 'esta', 'estes',
-            'estas', 'aquele', 'aquela', 'aqueles', 'aquelas', 'isto',
-            'aquilo', 'estou', 'está', 'estamos', 'estão', 'estive',
-            'esteve', 'estivemos', 'estiveram', 'estava', 'estávamos',
-            'estavam', 'estivera', 'estivéramos', 'esteja', 'estejamos',
-            'estejam', 'estivesse', 'estivéssemos', 'estivessem', 'estiver',
-            'estivermos', 'estiverem', 'hei', 'há', 'havemos', 'hão',
-            'houve', 'houvemos', 'houveram', 'houvera', 'houvéramos',
-            'haja', 'hajamos', 'hajam', 'houvesse', 'houvéssemos',
-            'houvessem', 'houver', 'houvermos', 'houverem', 'houverei',
-            'houverá', 'houveremos', 'houverão', 'houveria', 'houveríamos',
-            'houveriam', 'sou', 'somos', 'são', 'era', 'éramos', 'eram',
-            'fui', 'foi', 'fomos', 'foram', 'fora', 'fôramos', 'seja',
-            'sejamos', 'sejam', 'fosse', 'fôssemos', 'fossem', 'for',
-            'formos', 'forem', 'serei', 'será', 'seremos', 'serão', 'seria',
-            'seríamos', 'seriam', 'tenho', 'tem', 'temos', 'tém', 'tinha',
-            'tínhamos', 'tinham', 'tive', 'teve', 'tivemos', 'tiveram',
-            'tivera', 'tivéramos', 'tenha', 'tenhamos', 'tenham', 'tivesse',
-            'tivéssemos', 'tivessem', 'tiver', 'tivermos', 'tiverem',
-            'terei', 'terá', 'teremos', 'terão', 'teria', 'teríamos', 'teriam'
-        }
@@ -0,0 +1,44 @@
+"""
+Limite de tamanho do corpo das requisições.
+
+Middleware ASGI que recusa, pelo cabeçalho Content-Length, requisições
+maiores que o limite antes que o corpo seja lido.
+"""
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class LimiteCorpoMiddleware:
+    """
+    Recusa com 413 requisições cujo Content-Length excede o limite.
+    
+    Sem ele, um upload grande é recebido e gravado por inteiro pelo parser de
+    multipart antes de o endpoint verificar o tamanho do arquivo.
+    """
+    
+    def __init__(self, app: ASGIApp, tamanho_maximo: int, mensagem: str):
+        """
+        Inicializa o middleware.
+        
+        Args:
+            app: Aplicação ASGI envolvida
+            tamanho_maximo: Tamanho máximo do corpo, em bytes
+            mensagem: Detalhe devolvido na resposta 413
+        """
+        self.app = app
+        self._tamanho_maximo = tamanho_maximo
+        self._mensagem = mensagem
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Responde 413 se o Content-Length declarado exceder o limite; senão segue adiante."""
+        if scope["type"] == "http":
+            for nome, valor in scope["headers"]:
+                if nome == b"content-length":
+                    if valor.isdigit() and int(valor) > self._tamanho_maximo:
+                        resposta = JSONResponse({"detail": self._mensagem}, status_code=413)
+                        await resposta(scope, receive, send)
+                        return
+                    break
+        
+        await self.app(scope, receive, send)
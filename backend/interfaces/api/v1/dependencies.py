@@ -5,13 +5,21 @@ Configura e fornece as dependências necessárias para os controllers.
 """
 
 from functools import lru_cache
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
-from config.settings import Settings
+from config.settings import get_settings
 from application.use_cases.classificar_email_use_case import ClassificarEmailUseCase
 from application.use_cases.classificar_arquivo_use_case import ClassificarArquivoUseCase
 from application.ports.classificador_port import ClassificadorPort
+from application.ports.leitor_arquivo_port import LeitorArquivoPort
+from infrastructure.ai.cache_classificacao import CacheClassificacao
+from infrastructure.ai.cache_persistente import CacheClassificacaoPersistente
+from infrastructure.ai.cache_semantico import CacheSemantico
 from infrastructure.ai.classificador_factory import ClassificadorFactory
+from infrastructure.ai.dynamic_batch_classificador import DynamicBatchClassificador
+from infrastructure.ai.prompts import VERSAO_PROMPT
+from infrastructure.ai.telemetria_uso import get_telemetria
 from infrastructure.nlp.preprocessador import PreprocessadorTexto
 from infrastructure.file_readers.leitor_txt import LeitorTxt
 from infrastructure.file_readers.leitor_pdf import LeitorPdf
@@ -20,14 +28,19 @@ from infrastructure.file_readers.leitor_msg import LeitorMsg
 from infrastructure.file_readers.leitor_mbox import LeitorMbox
 
 
-@lru_cache
-def get_settings() -> Settings:
-    """Retorna as configurações da aplicação (cached)."""
-    return Settings()
+# Classificadores com laço de lotes em segundo plano, encerrados no desligamento
+_classificadores_em_lote: List[DynamicBatchClassificador] = []
 
 
+@lru_cache(maxsize=1)
 def get_preprocessador() -> PreprocessadorTexto:
-    """Retorna uma instância do preprocessador de texto."""
+    """
+    Retorna o preprocessador de texto, compartilhado entre requisições.
+    
+    As stopwords são compartilhadas pelo módulo e o cache de textos
+    processados é protegido por lock, então a instância atende requisições
+    concorrentes.
+    """
     return PreprocessadorTexto(remover_stopwords=False)
 
 
@@ -35,59 +48,192 @@ def get_classificador(provider: Optional[str] = None) -> ClassificadorPort:
     """
     Retorna uma instância do classificador baseado no provider.
     
+    Instância única por provedor e processo: o classificador não guarda
+    estado por requisição, e reaproveitá-lo evita refazer a montagem
+    (factory, caches, limitadores) a cada chamada.
+    
     Args:
         provider: 'openai' ou 'gemini'. Se None, usa o padrão do settings.
     """
+    # Usar provider do request ou o padrão do settings
+    return _get_classificador_por_nome((provider or get_settings().ai_provider).lower())
+
+
+@lru_cache(maxsize=None)
+def _get_classificador_por_nome(provider_name: str) -> ClassificadorPort:
+    """Cria o classificador do provedor (nomes inválidos geram ValueError e não ficam em cache)."""
     settings = get_settings()
     preprocessador = get_preprocessador()
     
-    # Usar provider do request ou o padrão do settings
-    provider_name = provider or settings.ai_provider
-    
     # Selecionar API key, modelo e max_tokens baseado no provider
-    if provider_name.lower() == "gemini":
+    if provider_name == "gemini":
+        if settings.gemini_dynamic_batch:
+            return get_classificador_gemini_em_lote()
         api_key = settings.gemini_api_key
         modelo = settings.gemini_model
         max_tokens = settings.gemini_max_tokens
+        cache = get_cache_gemini()
+        cache_semantico = None
+        duas_fases = settings.gemini_two_phase
+        lote_dinamico = False
+        modelo_longo = None
+        rpm_limit = tpm_limit = None
     else:
         api_key = settings.openai_api_key
         modelo = settings.openai_model
         max_tokens = settings.openai_max_tokens
+        cache = get_cache_openai()
+        cache_semantico = get_cache_semantico_openai()
+        duas_fases = False
+        # Único por processo (cache por provedor): os lotes se formam entre requisições
+        lote_dinamico = settings.openai_dynamic_batch
+        modelo_longo = settings.openai_long_model or None
+        rpm_limit = settings.openai_rpm_limit
+        tpm_limit = settings.openai_tpm_limit
     
-    return ClassificadorFactory.criar_por_nome(
+    return _registrar_lote_dinamico(ClassificadorFactory.criar_por_nome(
         provider_name=provider_name,
         api_key=api_key,
         modelo=modelo,
         preprocessador=preprocessador,
-        max_tokens=max_tokens
+        max_tokens=max_tokens,
+        cache=cache,
+        cache_semantico=cache_semantico,
+        enable_two_phase=duas_fases,
+        enable_dynamic_batch=lote_dinamico,
+        modelo_longo=modelo_longo,
+        tokens_modelo_longo=settings.openai_long_model_min_tokens,
+        rpm_limit=rpm_limit,
+        tpm_limit=tpm_limit,
+        limiar_filtro_local=settings.local_filter_threshold
+    ))
+
+
+@lru_cache(maxsize=1)
+def get_cache_gemini() -> Optional[CacheClassificacao]:
+    """Retorna o cache de classificações do Gemini, compartilhado entre requisições."""
+    settings = get_settings()
+    return _criar_cache(settings.gemini_cache_size, f"gemini|{settings.gemini_model}")
+
+
+@lru_cache(maxsize=1)
+def get_cache_openai() -> Optional[CacheClassificacao]:
+    """Retorna o cache de classificações da OpenAI, compartilhado entre requisições."""
+    settings = get_settings()
+    return _criar_cache(settings.openai_cache_size, f"openai|{settings.openai_model}")
+
+
+def _criar_cache(tamanho: int, namespace: str) -> Optional[CacheClassificacao]:
+    """
+    Cria o cache de classificações (None se desativado).
+    
+    A chave inclui o modelo e a versão do prompt: ao trocar qualquer um dos
+    dois, classificações antigas deixam de ser reaproveitadas. Com
+    CLASSIFICATION_CACHE_PATH definido, o cache também é gravado em SQLite.
+    """
+    if tamanho <= 0:
+        return None
+    
+    namespace = f"{namespace}|{VERSAO_PROMPT}"
+    caminho = get_settings().classification_cache_path
+    if caminho:
+        return CacheClassificacaoPersistente(caminho, tamanho_maximo=tamanho, namespace=namespace)
+    return CacheClassificacao(tamanho_maximo=tamanho, namespace=namespace)
+
+
+@lru_cache(maxsize=1)
+def get_cache_semantico_openai() -> Optional[CacheSemantico]:
+    """Retorna o cache semântico da OpenAI, compartilhado entre requisições (desativado por padrão)."""
+    settings = get_settings()
+    if settings.openai_semantic_cache_size <= 0:
+        return None
+    return CacheSemantico(
+        limiar=settings.openai_semantic_cache_threshold,
+        tamanho_maximo=settings.openai_semantic_cache_size
     )
 
 
-def get_leitores():
-    """Retorna a lista de leitores de arquivo disponíveis."""
-    return [
+@lru_cache(maxsize=1)
+def get_classificador_gemini_em_lote() -> ClassificadorPort:
+    """
+    Retorna o classificador Gemini com lotes dinâmicos.
+    
+    Instância única por processo: os lotes só se formam quando requisições
+    concorrentes compartilham a mesma fila.
+    """
+    settings = get_settings()
+    return _registrar_lote_dinamico(ClassificadorFactory.criar_por_nome(
+        provider_name="gemini",
+        api_key=settings.gemini_api_key,
+        modelo=settings.gemini_model,
+        preprocessador=get_preprocessador(),
+        max_tokens=settings.gemini_max_tokens,
+        enable_dynamic_batch=True,
+        cache=get_cache_gemini(),
+        enable_two_phase=settings.gemini_two_phase,
+        limiar_filtro_local=settings.local_filter_threshold
+    ))
+
+
+def _registrar_lote_dinamico(classificador: ClassificadorPort) -> ClassificadorPort:
+    """Guarda o classificador para fechar_classificadores(), se ele formar lotes dinâmicos."""
+    if isinstance(classificador, DynamicBatchClassificador):
+        _classificadores_em_lote.append(classificador)
+    return classificador
+
+
+async def fechar_classificadores() -> None:
+    """Encerra os laços de lotes dinâmicos (chamado no desligamento da aplicação)."""
+    for classificador in _classificadores_em_lote:
+        await classificador.fechar()
+
+
+@lru_cache(maxsize=1)
+def get_leitores() -> Mapping[str, LeitorArquivoPort]:
+    """
+    Retorna o registro imutável extensão -> leitor de arquivo.
+    
+    Montado uma única vez por processo e compartilhado entre os use cases.
+    """
+    leitores = [
         LeitorTxt(),
         LeitorPdf(),
         LeitorEml(),
         LeitorMsg(),
         LeitorMbox()
     ]
+    
+    leitor_por_extensao: Dict[str, LeitorArquivoPort] = {}
+    for leitor in leitores:
+        for extensao in leitor.extensoes_suportadas():
+            # O primeiro leitor registrado para a extensão tem prioridade
+            leitor_por_extensao.setdefault(extensao, leitor)
+    
+    return MappingProxyType(leitor_por_extensao)
 
 
 def get_classificar_email_use_case(provider: Optional[str] = None) -> ClassificarEmailUseCase:
-    """Retorna o use case de classificação por texto."""
-    classificador = get_classificador(provider)
-    return ClassificarEmailUseCase(classificador=classificador)
+    """Retorna o use case de classificação por texto (um por classificador)."""
+    return _criar_use_case_email(get_classificador(provider))
 
 
 def get_classificar_arquivo_use_case(provider: Optional[str] = None) -> ClassificarArquivoUseCase:
-    """Retorna o use case de classificação por arquivo."""
-    classificador = get_classificador(provider)
-    leitores = get_leitores()
-    
+    """Retorna o use case de classificação por arquivo (um por classificador)."""
+    return _criar_use_case_arquivo(get_classificador(provider))
+
+
+@lru_cache(maxsize=None)
+def _criar_use_case_email(classificador: ClassificadorPort) -> ClassificarEmailUseCase:
+    """Cria o use case de classificação por texto para o classificador."""
+    return ClassificarEmailUseCase(classificador=classificador)
+
+
+@lru_cache(maxsize=None)
+def _criar_use_case_arquivo(classificador: ClassificadorPort) -> ClassificarArquivoUseCase:
+    """Cria o use case de classificação por arquivo para o classificador."""
     return ClassificarArquivoUseCase(
         classificador=classificador,
-        leitores=leitores
+        leitores=get_leitores()
     )
 
 
@@ -111,3 +257,8 @@ def get_available_providers() -> dict:
             }
         }
     }
+
+
+def get_uso_apis() -> dict:
+    """Retorna o uso acumulado das APIs de IA (tokens, latência e custo) por modelo."""
+    return {"modelos": get_telemetria().resumo()}
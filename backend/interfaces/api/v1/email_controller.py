@@ -5,7 +5,8 @@ Endpoints para classificação de emails via texto ou arquivo.
 """
 
 import logging
-from typing import Optional
+import os
+from typing import Any, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException, Query, status
 
 from application.dtos.email_dto import (
@@ -23,11 +24,15 @@ from interfaces.api.v1.dependencies import (
     get_classificar_email_use_case,
     get_classificar_arquivo_use_case,
     get_available_providers,
+    get_uso_apis,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Tamanho máximo do arquivo enviado para classificação (5MB)
+MAX_SIZE = 5 * 1024 * 1024
+
 
 router = APIRouter(prefix="/emails", tags=["Emails"])
 
@@ -38,7 +43,7 @@ router = APIRouter(prefix="/emails", tags=["Emails"])
     summary="Listar provedores de IA",
     description="Retorna os provedores de IA disponíveis e seus status."
 )
-async def listar_providers():
+async def listar_providers() -> dict[str, Any]:
     """
     Endpoint para listar os provedores de IA disponíveis.
     
@@ -47,6 +52,21 @@ async def listar_providers():
     return get_available_providers()
 
 
+@router.get(
+    "/uso",
+    status_code=status.HTTP_200_OK,
+    summary="Uso das APIs de IA",
+    description="Retorna tokens consumidos, latência média e custo estimado por modelo desde o início do processo."
+)
+async def uso_apis() -> dict[str, Any]:
+    """
+    Endpoint de telemetria de uso das APIs de IA.
+    
+    Os contadores são do processo atual (cada worker mantém os seus).
+    """
+    return get_uso_apis()
+
+
 @router.post(
     "/classificar",
     response_model=ClassificarEmailResponse,
@@ -67,23 +87,23 @@ async def classificar_email(
     """
     try:
         provider_solicitado = request.provider or "padrão"
-        logger.info(f"🔵 [Controller] Requisição de classificação por texto | Provider solicitado: {provider_solicitado}")
+        logger.info("🔵 [Controller] Requisição de classificação por texto | Provider solicitado: %s", provider_solicitado)
         
         use_case = get_classificar_email_use_case(provider=request.provider)
-        resultado = use_case.executar(request)
+        resultado = await use_case.executar(request)
         
-        logger.info(f"🟢 [Controller] Resposta gerada com: {resultado.modelo_usado} | Categoria: {resultado.categoria}")
+        logger.info("🟢 [Controller] Resposta gerada com: %s | Categoria: %s", resultado.modelo_usado, resultado.categoria)
         
         return resultado
     
     except ConteudoInvalidoException as e:
-        logger.warning(f"🟡 [Controller] Conteúdo inválido: {e}")
+        logger.warning("🟡 [Controller] Conteúdo inválido: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except ClassificacaoException as e:
-        logger.error(f"🔴 [Controller] Erro na classificação: {e}")
+        logger.error("🔴 [Controller] Erro na classificação: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(e)
@@ -115,17 +135,17 @@ async def classificar_arquivo(
     
     Retorna a categoria, nível de confiança, resposta sugerida e nome do arquivo.
     """
-    # Validar tamanho do arquivo (máximo 5MB)
-    MAX_SIZE = 5 * 1024 * 1024  # 5MB
-    conteudo = await arquivo.read()
+    # Validar tamanho do arquivo (máximo 5MB) sem carregá-lo em memória
+    tamanho = arquivo.file.seek(0, os.SEEK_END)
+    arquivo.file.seek(0)
     
-    if len(conteudo) > MAX_SIZE:
+    if tamanho > MAX_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail="Arquivo muito grande. Tamanho máximo: 5MB"
         )
     
-    if len(conteudo) == 0:
+    if tamanho == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Arquivo está vazio"
@@ -133,38 +153,38 @@ async def classificar_arquivo(
     
     try:
         provider_solicitado = provider or "padrão"
-        logger.info(f"🔵 [Controller] Requisição de classificação por arquivo | Arquivo: {arquivo.filename} | Provider: {provider_solicitado}")
+        logger.info("🔵 [Controller] Requisição de classificação por arquivo | Arquivo: %s | Provider: %s", arquivo.filename, provider_solicitado)
         
         use_case = get_classificar_arquivo_use_case(provider=provider)
-        resultado = use_case.executar(
-            arquivo=conteudo,
+        resultado = await use_case.executar(
+            arquivo=arquivo.file,
             nome_arquivo=arquivo.filename or "arquivo_sem_nome"
         )
         
-        logger.info(f"🟢 [Controller] Resposta gerada com: {resultado.modelo_usado} | Categoria: {resultado.categoria}")
+        logger.info("🟢 [Controller] Resposta gerada com: %s | Categoria: %s", resultado.modelo_usado, resultado.categoria)
         
         return resultado
     
     except FormatoNaoSuportadoException as e:
-        logger.warning(f"🟡 [Controller] Formato não suportado: {e}")
+        logger.warning("🟡 [Controller] Formato não suportado: %s", e)
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail=str(e)
         )
     except ArquivoInvalidoException as e:
-        logger.warning(f"🟡 [Controller] Arquivo inválido: {e}")
+        logger.warning("🟡 [Controller] Arquivo inválido: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except ConteudoInvalidoException as e:
-        logger.warning(f"🟡 [Controller] Conteúdo inválido: {e}")
+        logger.warning("🟡 [Controller] Conteúdo inválido: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except ClassificacaoException as e:
-        logger.error(f"🔴 [Controller] Erro na classificação: {e}")
+        logger.error("🔴 [Controller] Erro na classificação: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(e)
@@ -177,6 +197,6 @@ async def classificar_arquivo(
     summary="Health check",
     description="Verifica se o serviço está funcionando."
 )
-async def health_check():
+async def health_check() -> dict[str, str]:
     """Endpoint de health check."""
     return {"status": "healthy", "service": "email-classifier"}
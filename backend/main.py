@@ -4,11 +4,61 @@ Email Classifier API - Entry Point
 Aplicação FastAPI para classificação de emails usando IA.
 """
 
-from fastapi import FastAPI
+import json
+import logging
+from contextlib import asynccontextmanager
+from hashlib import blake2b
+from typing import Optional
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from application.dtos.email_dto import (
+    ClassificarEmailResponse,
+    ClassificarArquivoResponse,
+)
+from config.settings import get_settings
+from interfaces.api.limite_corpo import LimiteCorpoMiddleware
+from interfaces.api.v1.dependencies import (
+    fechar_classificadores,
+    get_classificar_arquivo_use_case,
+    get_classificar_email_use_case,
+)
+from interfaces.api.v1.email_controller import MAX_SIZE, router as email_router
+
+
+logger = logging.getLogger(__name__)
+
 
-from config.settings import Settings
-from interfaces.api.v1.email_controller import router as email_router
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida da aplicação.
+    
+    Os DTOs de resposta usam defer_build=True; aqui os schemas pendentes são construídos
+    antes de o servidor aceitar requisições, para que a primeira não pague o custo.
+    Pelo mesmo motivo, o schema OpenAPI e os use cases do provedor padrão
+    (SDK, cliente HTTP, caches e leitores de arquivo) são montados já na
+    inicialização. No desligamento, os laços de lotes dinâmicos são encerrados.
+    """
+    for dto in (ClassificarEmailResponse, ClassificarArquivoResponse):
+        dto.model_rebuild()
+    
+    # Fica guardado em app.openapi_schema: /openapi.json e /docs não o refazem
+    app.openapi()
+    
+    try:
+        get_classificar_email_use_case()
+        get_classificar_arquivo_use_case()
+    except Exception as e:
+        # Configuração incompleta (ex.: sem chave de API) não impede a subida:
+        # o erro volta a aparecer, por requisição, quando o provedor for usado
+        logger.warning("⚠️ Classificador padrão não pôde ser pré-carregado: %s", e)
+    yield
+    
+    # Laços de lotes dinâmicos rodam em segundo plano até serem cancelados
+    await fechar_classificadores()
 
 
 def create_app() -> FastAPI:
@@ -18,8 +68,11 @@ def create_app() -> FastAPI:
     Returns:
         Instância configurada do FastAPI
     """
-    settings = Settings()
+    settings = get_settings()
     
+    # Sem default_response_class customizado (ORJSONResponse está obsoleto): nas
+    # rotas com response_model ou tipo de retorno anotado o FastAPI serializa
+    # direto para JSON via pydantic-core (sem jsonable_encoder + json.dumps)
     app = FastAPI(
         title=settings.app_name,
         version=settings.app_version,
@@ -38,9 +91,23 @@ def create_app() -> FastAPI:
         """,
         docs_url="/docs",
         redoc_url="/redoc",
-        openapi_url="/openapi.json"
+        openapi_url="/openapi.json",
+        lifespan=lifespan
     )
     
+    # Recusar uploads grandes pelo Content-Length, antes de receber o corpo;
+    # a folga cobre os campos e delimitadores do multipart. Registrado antes
+    # do CORS para que a resposta 413 também leve os cabeçalhos de CORS
+    app.add_middleware(
+        LimiteCorpoMiddleware,
+        tamanho_maximo=MAX_SIZE + 64 * 1024,
+        mensagem="Arquivo muito grande. Tamanho máximo: 5MB"
+    )
+    
+    # Comprimir respostas maiores (a resposta sugerida é o campo mais longo);
+    # as curtas não compensam o custo
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+    
     # Configurar CORS
     app.add_middleware(
         CORSMiddleware,
@@ -53,18 +120,36 @@ def create_app() -> FastAPI:
     # Registrar routers
     app.include_router(email_router, prefix="/api/v1")
     
-    # Root endpoint
+    # Root endpoint: conteúdo fixo, serializado uma única vez
+    corpo_raiz = json.dumps({
+        "message": "Email Classifier API",
+        "version": settings.app_version,
+        "docs": "/docs"
+    }, separators=(",", ":")).encode("utf-8")
+    
+    # Fixo por implantação: clientes que revalidam recebem 304 sem corpo
+    etag_raiz = f'"{blake2b(corpo_raiz, digest_size=16).hexdigest()}"'
+    cabecalhos_raiz = {"ETag": etag_raiz, "Cache-Control": "public, max-age=60"}
+    
     @app.get("/", tags=["Root"])
-    async def root():
-        return {
-            "message": "Email Classifier API",
-            "version": settings.app_version,
-            "docs": "/docs"
-        }
+    async def root(request: Request) -> Response:
+        if _etag_corresponde(request.headers.get("if-none-match"), etag_raiz):
+            return Response(status_code=304, headers=cabecalhos_raiz)
+        return Response(content=corpo_raiz, media_type="application/json", headers=cabecalhos_raiz)
     
     return app
 
 
+def _etag_corresponde(if_none_match: Optional[str], etag: str) -> bool:
+    """Verifica se o cabeçalho If-None-Match aceita o ETag (comparação fraca, como no RFC 9110)."""
+    if not if_none_match:
+        return False
+    return any(
+        valor == "*" or valor.removeprefix("W/") == etag
+        for valor in (item.strip() for item in if_none_match.split(","))
+    )
+
+
 # Criar instância da aplicação
 app = create_app()
 
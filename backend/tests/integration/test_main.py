@@ -0,0 +1,88 @@
+"""
+Testes de integração para o endpoint raiz e o limite de corpo da aplicação.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from interfaces.api.v1.email_controller import MAX_SIZE
+from main import create_app
+
+
+_ORIGEM = "http://localhost:4200"
+
+
+class TestEndpointRaiz:
+    """Testes para o ETag do endpoint raiz."""
+    
+    def setup_method(self):
+        """Cria o cliente sem o lifespan (não pré-carrega os classificadores)."""
+        self.cliente = TestClient(create_app())
+    
+    def test_responde_com_etag(self):
+        """A resposta deve trazer o corpo, o ETag e o Cache-Control."""
+        resposta = self.cliente.get("/")
+        
+        assert resposta.status_code == 200
+        assert resposta.json()["message"] == "Email Classifier API"
+        assert resposta.headers["etag"].startswith('"')
+        assert resposta.headers["cache-control"] == "public, max-age=60"
+    
+    @pytest.mark.parametrize(
+        "if_none_match",
+        [
+            "{etag}",
+            "W/{etag}",
+            "*",
+            '"outro", {etag}',
+            '"outro",W/{etag}',
+        ],
+    )
+    def test_etag_correspondente_retorna_304(self, if_none_match):
+        """If-None-Match forte, fraco, curinga ou em lista deve resultar em 304 sem corpo."""
+        etag = self.cliente.get("/").headers["etag"]
+        
+        resposta = self.cliente.get("/", headers={"If-None-Match": if_none_match.format(etag=etag)})
+        
+        assert resposta.status_code == 304
+        assert resposta.content == b""
+        assert resposta.headers["etag"] == etag
+    
+    @pytest.mark.parametrize("if_none_match", ['"outro"', "W/\"outro\"", ""])
+    def test_etag_diferente_retorna_200(self, if_none_match):
+        """If-None-Match que não aceita o ETag atual deve devolver o corpo."""
+        resposta = self.cliente.get("/", headers={"If-None-Match": if_none_match})
+        
+        assert resposta.status_code == 200
+        assert resposta.json()["message"] == "Email Classifier API"
+
+
+class TestLimiteCorpo:
+    """Testes para o LimiteCorpoMiddleware registrado na aplicação."""
+    
+    def setup_method(self):
+        """Cria o cliente sem o lifespan (não pré-carrega os classificadores)."""
+        self.cliente = TestClient(create_app())
+    
+    def test_corpo_grande_retorna_413_com_cors(self):
+        """Content-Length acima do limite deve ser recusado com 413 e cabeçalhos de CORS."""
+        resposta = self.cliente.post(
+            "/api/v1/emails/classificar/arquivo",
+            content=b"x" * (MAX_SIZE + 64 * 1024 + 1),
+            headers={"Origin": _ORIGEM, "Content-Type": "multipart/form-data; boundary=limite"},
+        )
+        
+        assert resposta.status_code == 413
+        assert resposta.json() == {"detail": "Arquivo muito grande. Tamanho máximo: 5MB"}
+        assert resposta.headers["access-control-allow-origin"] == _ORIGEM
+    
+    def test_corpo_dentro_do_limite_segue_para_a_rota(self):
+        """Abaixo do limite, a requisição chega à rota (aqui, recusada por faltar o campo arquivo)."""
+        resposta = self.cliente.post(
+            "/api/v1/emails/classificar/arquivo",
+            files={"outro_campo": ("email.txt", b"x" * 1024, "text/plain")},
+            headers={"Origin": _ORIGEM},
+        )
+        
+        assert resposta.status_code == 422
+        assert resposta.headers["access-control-allow-origin"] == _ORIGEM
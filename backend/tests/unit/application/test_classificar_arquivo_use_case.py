@@ -0,0 +1,65 @@
+"""
+Testes unitários para o use case ClassificarArquivoUseCase.
+"""
+
+import io
+
+import pytest
+from unittest.mock import Mock
+
+from application.use_cases.classificar_arquivo_use_case import ClassificarArquivoUseCase
+from application.ports.classificador_port import ClassificadorPort
+from application.ports.leitor_arquivo_port import LeitorArquivoPort
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from domain.entities.email import CategoriaEmail
+from domain.exceptions import FormatoNaoSuportadoException
+
+
+class TestClassificarArquivoUseCase:
+    """Testes para o use case ClassificarArquivoUseCase."""
+    
+    def setup_method(self):
+        """Setup executado antes de cada teste."""
+        self.mock_classificador = Mock(spec_set=ClassificadorPort)
+        self.mock_classificador.get_modelo.return_value = "modelo-teste"
+        self.mock_classificador.get_provider.return_value = "teste"
+        self.mock_leitor = Mock(spec_set=LeitorArquivoPort)
+        self.use_case = ClassificarArquivoUseCase(
+            classificador=self.mock_classificador,
+            leitores={'.txt': self.mock_leitor}
+        )
+    
+    @pytest.mark.asyncio
+    async def test_classificar_arquivo_suportado(self):
+        """Deve usar o leitor registrado para a extensão do arquivo."""
+        # Arrange
+        self.mock_leitor.ler.return_value = "Preciso de suporte técnico."
+        self.mock_classificador.classificar.return_value = ClassificacaoResultado(
+            categoria=CategoriaEmail.PRODUTIVO,
+            confianca=0.9,
+            resposta_sugerida="Vamos analisar sua solicitação."
+        )
+        
+        # Act
+        arquivo = io.BytesIO(b"conteudo")
+        resultado = await self.use_case.executar(arquivo, "Email.TXT")
+        
+        # Assert
+        assert resultado.categoria == "Produtivo"
+        assert resultado.nome_arquivo == "Email.TXT"
+        assert resultado.modelo_usado == "modelo-teste"
+        self.mock_leitor.ler.assert_called_once_with(arquivo)
+    
+    @pytest.mark.asyncio
+    async def test_formato_nao_suportado_deve_lancar_erro(self):
+        """Deve lançar erro quando nenhum leitor suporta a extensão."""
+        with pytest.raises(FormatoNaoSuportadoException):
+            await self.use_case.executar(io.BytesIO(b"conteudo"), "email.doc")
+        
+        self.mock_leitor.ler.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_arquivo_sem_extensao_deve_lancar_erro(self):
+        """Deve lançar erro quando o arquivo não tem extensão."""
+        with pytest.raises(FormatoNaoSuportadoException):
+            await self.use_case.executar(io.BytesIO(b"conteudo"), "email")
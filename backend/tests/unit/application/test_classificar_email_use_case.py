@@ -18,12 +18,13 @@ class TestClassificarEmailUseCase:
     
     def setup_method(self):
         """Setup executado antes de cada teste."""
-        self.mock_classificador = Mock(spec=ClassificadorPort)
+        self.mock_classificador = Mock(spec_set=ClassificadorPort)
         self.use_case = ClassificarEmailUseCase(
             classificador=self.mock_classificador
         )
     
-    def test_classificar_email_produtivo(self):
+    @pytest.mark.asyncio
+    async def test_classificar_email_produtivo(self):
         """Deve classificar email como produtivo corretamente."""
         # Arrange
         self.mock_classificador.classificar.return_value = ClassificacaoResultado(
@@ -36,7 +37,7 @@ class TestClassificarEmailUseCase:
         )
         
         # Act
-        resultado = self.use_case.executar(request)
+        resultado = await self.use_case.executar(request)
         
         # Assert
         assert resultado.categoria == "Produtivo"
@@ -44,7 +45,8 @@ class TestClassificarEmailUseCase:
         assert resultado.resposta_sugerida == "Vamos analisar sua solicitação."
         self.mock_classificador.classificar.assert_called_once()
     
-    def test_classificar_email_improdutivo(self):
+    @pytest.mark.asyncio
+    async def test_classificar_email_improdutivo(self):
         """Deve classificar email como improdutivo corretamente."""
         # Arrange
         self.mock_classificador.classificar.return_value = ClassificacaoResultado(
@@ -57,22 +59,24 @@ class TestClassificarEmailUseCase:
         )
         
         # Act
-        resultado = self.use_case.executar(request)
+        resultado = await self.use_case.executar(request)
         
         # Assert
         assert resultado.categoria == "Improdutivo"
         assert resultado.confianca == 0.88
     
-    def test_conteudo_vazio_deve_lancar_erro(self):
+    @pytest.mark.asyncio
+    async def test_conteudo_vazio_deve_lancar_erro(self):
         """Deve lançar erro quando conteúdo está vazio."""
         # Arrange
         request = ClassificarEmailRequest(conteudo="   ")
         
         # Act & Assert
         with pytest.raises(ConteudoInvalidoException):
-            self.use_case.executar(request)
+            await self.use_case.executar(request)
     
-    def test_erro_classificacao_deve_propagar(self):
+    @pytest.mark.asyncio
+    async def test_erro_classificacao_deve_propagar(self):
         """Deve propagar erro quando classificador falha."""
         # Arrange
         self.mock_classificador.classificar.side_effect = ClassificacaoException(
@@ -84,4 +88,4 @@ class TestClassificarEmailUseCase:
         
         # Act & Assert
         with pytest.raises(ClassificacaoException):
-            self.use_case.executar(request)
+            await self.use_case.executar(request)
@@ -0,0 +1,45 @@
+"""
+Testes unitários para o value object ClassificacaoParcial.
+"""
+
+import pytest
+from domain.value_objects.classificacao_parcial import ClassificacaoParcial
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from domain.entities.email import CategoriaEmail
+
+
+class TestClassificacaoParcial:
+    """Testes para o value object ClassificacaoParcial."""
+    
+    def test_parcial_sem_resultado_nao_esta_completo(self):
+        """Deve indicar que o evento ainda não traz o resultado completo."""
+        parcial = ClassificacaoParcial(
+            categoria=CategoriaEmail.IMPRODUTIVO,
+            confianca=0.9
+        )
+        
+        assert parcial.completo is False
+        assert parcial.resultado is None
+    
+    def test_de_resultado_cria_evento_completo(self):
+        """Deve copiar categoria e confiança do resultado completo."""
+        resultado = ClassificacaoResultado(
+            categoria=CategoriaEmail.PRODUTIVO,
+            confianca=0.85,
+            resposta_sugerida="Obrigado pelo contato."
+        )
+        
+        parcial = ClassificacaoParcial.de_resultado(resultado)
+        
+        assert parcial.completo is True
+        assert parcial.categoria == CategoriaEmail.PRODUTIVO
+        assert parcial.confianca == 0.85
+        assert parcial.resultado is resultado
+    
+    def test_confianca_invalida_deve_lancar_erro(self):
+        """Deve lançar erro quando confiança está fora de 0 a 1."""
+        with pytest.raises(ValueError, match="entre 0 e 1"):
+            ClassificacaoParcial(
+                categoria=CategoriaEmail.PRODUTIVO,
+                confianca=1.2
+            )
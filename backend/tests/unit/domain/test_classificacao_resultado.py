@@ -52,29 +52,48 @@ class TestClassificacaoResultado:
         
         assert resultado.alta_confianca is False
     
-    def test_confianca_menor_que_zero_deve_lancar_erro(self):
-        """Deve lançar erro quando confiança < 0."""
-        with pytest.raises(ValueError, match="entre 0 e 1"):
+    @pytest.mark.parametrize(
+        "confianca,resposta_sugerida,mensagem",
+        [
+            (-0.1, "Teste", "entre 0 e 1"),
+            (1.5, "Teste", "entre 0 e 1"),
+            (0.9, "", "não pode estar vazia"),
+        ],
+        ids=["confianca_menor_que_zero", "confianca_maior_que_um", "resposta_vazia"]
+    )
+    def test_dados_invalidos_devem_lancar_erro(self, confianca, resposta_sugerida, mensagem):
+        """Deve lançar erro quando a confiança está fora de [0, 1] ou a resposta está vazia."""
+        with pytest.raises(ValueError, match=mensagem):
             ClassificacaoResultado(
                 categoria=CategoriaEmail.PRODUTIVO,
-                confianca=-0.1,
-                resposta_sugerida="Teste"
+                confianca=confianca,
+                resposta_sugerida=resposta_sugerida
             )
     
-    def test_confianca_maior_que_um_deve_lancar_erro(self):
-        """Deve lançar erro quando confiança > 1."""
-        with pytest.raises(ValueError, match="entre 0 e 1"):
-            ClassificacaoResultado(
-                categoria=CategoriaEmail.PRODUTIVO,
-                confianca=1.5,
-                resposta_sugerida="Teste"
-            )
+    def test_resultado_nao_possui_dict_de_instancia(self):
+        """Deve usar __slots__, sem __dict__ por instância."""
+        resultado = ClassificacaoResultado(
+            categoria=CategoriaEmail.PRODUTIVO,
+            confianca=0.9,
+            resposta_sugerida="Teste"
+        )
+        
+        assert not hasattr(resultado, "__dict__")
     
-    def test_resposta_vazia_deve_lancar_erro(self):
-        """Deve lançar erro quando resposta está vazia."""
-        with pytest.raises(ValueError, match="não pode estar vazia"):
-            ClassificacaoResultado(
-                categoria=CategoriaEmail.PRODUTIVO,
-                confianca=0.9,
-                resposta_sugerida=""
-            )
+    def test_para_dict(self):
+        """Deve retornar os campos com a categoria como texto."""
+        resultado = ClassificacaoResultado(
+            categoria=CategoriaEmail.IMPRODUTIVO,
+            confianca=0.9,
+            resposta_sugerida="Obrigado!",
+            remetente="Ana <ana@email.com>"
+        )
+        
+        assert resultado.para_dict() == {
+            "categoria": "Improdutivo",
+            "confianca": 0.9,
+            "resposta_sugerida": "Obrigado!",
+            "assunto": None,
+            "remetente": "Ana <ana@email.com>",
+            "destinatario": None,
+        }
@@ -28,15 +28,11 @@ class TestEmail:
         assert email.e_produtivo is True
         assert email.e_improdutivo is False
     
-    def test_email_vazio_deve_lancar_erro(self):
-        """Deve lançar erro ao criar email com conteúdo vazio."""
+    @pytest.mark.parametrize("conteudo", ["", "   "], ids=["vazio", "apenas_espacos"])
+    def test_email_sem_conteudo_deve_lancar_erro(self, conteudo):
+        """Deve lançar erro ao criar email vazio ou apenas com espaços."""
         with pytest.raises(ValueError, match="não pode estar vazio"):
-            Email(conteudo="")
-    
-    def test_email_apenas_espacos_deve_lancar_erro(self):
-        """Deve lançar erro ao criar email apenas com espaços."""
-        with pytest.raises(ValueError, match="não pode estar vazio"):
-            Email(conteudo="   ")
+            Email(conteudo=conteudo)
     
     def test_email_nao_classificado(self):
         """Deve retornar False para esta_classificado quando não há categoria."""
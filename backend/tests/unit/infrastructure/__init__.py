@@ -0,0 +1 @@
+# Infrastructure Tests
@@ -0,0 +1,95 @@
+"""
+Testes unitários para o BatchClassificador.
+"""
+
+import json
+
+import pytest
+from domain.entities.email import CategoriaEmail
+from infrastructure.ai.batch_classificador import BatchClassificador
+
+
+def _linha(custom_id, status_code=200, conteudo=None, erro=None) -> str:
+    """Monta uma linha do JSONL de saída da Batch API."""
+    corpo = {"choices": [{"message": {"content": conteudo}}]}
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "body": corpo} if status_code else None,
+        "error": erro,
+    })
+
+
+def _resposta(categoria: str) -> str:
+    return json.dumps({"categoria": categoria, "confianca": 0.9, "resposta_sugerida": "Obrigado!"})
+
+
+class TestBatchClassificador:
+    """Testes para a leitura da saída da Batch API."""
+    
+    def setup_method(self):
+        """Configura o classificador para cada teste (sem chamadas reais à API)."""
+        self.classificador = BatchClassificador(api_key="sk-teste", rpm_limit=None, tpm_limit=None)
+    
+    def test_ler_saida_mapeia_custom_id_para_indice(self):
+        """Cada resposta válida deve ficar no índice do seu custom_id, em qualquer ordem."""
+        saida = "\n".join([_linha("2", conteudo=_resposta("Produtivo")), "", _linha("0", conteudo=_resposta("Improdutivo"))])
+        
+        respostas = self.classificador._ler_saida(saida)
+        
+        assert sorted(respostas) == [0, 2]
+        assert respostas[0]["categoria"] == "Improdutivo"
+        assert respostas[2]["categoria"] == "Produtivo"
+    
+    @pytest.mark.parametrize(
+        "linha",
+        [
+            _linha("0", status_code=None, erro={"code": "server_error"}),
+            _linha("0", conteudo=_resposta("Produtivo"), erro={"code": "server_error"}),
+            _linha("0", status_code=500, conteudo=_resposta("Produtivo")),
+            _linha("0", status_code=429, conteudo=_resposta("Produtivo")),
+            _linha("0", conteudo="não é json"),
+            _linha("0", conteudo=json.dumps(["Produtivo"])),
+            _linha("0", conteudo=None),
+            json.dumps({"custom_id": "0", "response": {"status_code": 200, "body": {"choices": []}}, "error": None}),
+        ],
+    )
+    def test_ler_saida_ignora_itens_com_falha(self, linha):
+        """Erros, status diferente de 200 e conteúdo que não é um objeto JSON devem ser ignorados."""
+        assert self.classificador._ler_saida(linha) == {}
+    
+    @pytest.mark.asyncio
+    async def test_reclassifica_itens_sem_resultado_pela_api_sincrona(self, monkeypatch):
+        """Itens ausentes ou inválidos na saída do job devem passar pela API síncrona."""
+        async def executar_lote(textos):
+            return {
+                0: json.loads(_resposta("Improdutivo")),
+                2: {"categoria": "Produtivo", "confianca": "alta"},
+            }
+        
+        enviados = []
+        
+        async def enviar(requisicao):
+            conteudo = requisicao["messages"][-1]["content"]
+            enviados.append(conteudo)
+            return {"resultados": [json.loads(_resposta("Produtivo"))] * conteudo.count("--- EMAIL ")}
+        
+        monkeypatch.setattr(self.classificador, "_executar_lote", executar_lote)
+        monkeypatch.setattr(self.classificador, "_enviar", enviar)
+        
+        resultados = await self.classificador._classificar_pela_api(["email 0", "email 1", "email 2"])
+        
+        assert [resultado.categoria for resultado in resultados] == [
+            CategoriaEmail.IMPRODUTIVO, CategoriaEmail.PRODUTIVO, CategoriaEmail.PRODUTIVO
+        ]
+        assert len(enviados) == 1
+        assert "email 1" in enviados[0] and "email 2" in enviados[0] and "email 0" not in enviados[0]
+    
+    @pytest.mark.asyncio
+    async def test_lote_vazio_nao_cria_job(self, monkeypatch):
+        """Sem emails pendentes, nenhum job deve ser criado."""
+        async def executar_lote(textos):
+            raise AssertionError("job criado sem emails")
+        
+        monkeypatch.setattr(self.classificador, "_executar_lote", executar_lote)
+        
+        assert await self.classificador._classificar_pela_api([]) == []
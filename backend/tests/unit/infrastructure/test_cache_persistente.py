@@ -0,0 +1,70 @@
+"""
+Testes unitários para o CacheClassificacaoPersistente.
+"""
+
+import pytest
+from domain.entities.email import CategoriaEmail
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from infrastructure.ai import cache_persistente
+from infrastructure.ai.cache_persistente import CacheClassificacaoPersistente
+
+
+def _resultado(confianca: float = 0.95) -> ClassificacaoResultado:
+    return ClassificacaoResultado(
+        categoria=CategoriaEmail.IMPRODUTIVO,
+        confianca=confianca,
+        resposta_sugerida="Obrigado pela mensagem!"
+    )
+
+
+class TestCacheClassificacaoPersistente:
+    """Testes para o cache de classificações em SQLite."""
+    
+    @pytest.fixture
+    def caminho(self, tmp_path):
+        """Caminho de um banco novo para cada teste."""
+        return str(tmp_path / "cache.db")
+    
+    @pytest.mark.asyncio
+    async def test_reaproveita_entre_instancias(self, caminho):
+        """Uma classificação gravada deve ser lida por outra instância do mesmo namespace."""
+        await CacheClassificacaoPersistente(caminho, namespace="m1").guardar("texto", _resultado())
+        
+        assert await CacheClassificacaoPersistente(caminho, namespace="m1").obter("texto") == _resultado()
+        assert await CacheClassificacaoPersistente(caminho, namespace="m2").obter("texto") is None
+    
+    @pytest.mark.asyncio
+    async def test_nao_grava_baixa_confianca(self, caminho):
+        """Resultados de baixa confiança não devem ser persistidos."""
+        await CacheClassificacaoPersistente(caminho).guardar("texto", _resultado(confianca=0.5))
+        
+        assert await CacheClassificacaoPersistente(caminho).obter("texto") is None
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "valor",
+        [b"{nao e json", b'{"confianca": 0.9}', b'{"categoria": "Outra"}', b'"texto"'],
+    )
+    async def test_descarta_entrada_invalida(self, caminho, valor):
+        """Uma linha corrompida deve ser tratada como ausência e apagada do banco."""
+        cache = CacheClassificacaoPersistente(caminho)
+        chave = cache._chave("texto")
+        cache._conexao.execute("INSERT INTO classificacoes (chave, valor) VALUES (?, ?)", (chave, valor))
+        
+        assert await cache.obter("texto") is None
+        assert cache._ler(chave) is None
+    
+    @pytest.mark.asyncio
+    async def test_poda_mantem_as_mais_recentes(self, caminho, monkeypatch):
+        """A poda periódica deve manter apenas as gravações mais recentes."""
+        monkeypatch.setattr(cache_persistente, "_INTERVALO_PODA", 5)
+        cache = CacheClassificacaoPersistente(caminho, tamanho_maximo_banco=3)
+        
+        for i in range(5):
+            await cache.guardar(f"texto {i}", _resultado())
+        
+        linhas = cache._conexao.execute("SELECT COUNT(*) FROM classificacoes").fetchone()[0]
+        assert linhas == 3
+        novo = CacheClassificacaoPersistente(caminho)
+        assert await novo.obter("texto 0") is None
+        assert await novo.obter("texto 4") == _resultado()
@@ -0,0 +1,33 @@
+"""
+Testes unitários para o CacheSemantico.
+"""
+
+from domain.entities.email import CategoriaEmail
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from infrastructure.ai.cache_semantico import CacheSemantico
+
+
+class TestCacheSemantico:
+    """Testes para o cache de classificações por embedding."""
+    
+    def setup_method(self):
+        """Configura o cache para cada teste."""
+        self.cache = CacheSemantico(limiar=0.9)
+        self.cache.guardar(
+            [1.0, 0.0, 0.1],
+            ClassificacaoResultado(
+                categoria=CategoriaEmail.IMPRODUTIVO,
+                confianca=0.95,
+                resposta_sugerida="Olá João, obrigado pelos votos!",
+                assunto="Feliz Natal",
+                remetente="João <joao@exemplo.com>"
+            )
+        )
+    
+    def test_reaproveita_apenas_categoria_e_confianca(self):
+        """Um email parecido deve receber só a categoria e a confiança, sem os dados do original."""
+        assert self.cache.obter([2.0, 0.0, 0.15]) == (CategoriaEmail.IMPRODUTIVO, 0.95)
+    
+    def test_ignora_email_diferente(self):
+        """Um email abaixo do limiar de similaridade não deve ser reaproveitado."""
+        assert self.cache.obter([0.0, 1.0, 0.0]) is None
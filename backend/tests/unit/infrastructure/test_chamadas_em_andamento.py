@@ -0,0 +1,134 @@
+"""
+Testes unitários para o ChamadasEmAndamento.
+"""
+
+import asyncio
+
+import pytest
+from infrastructure.ai.chamadas_em_andamento import ChamadasEmAndamento
+
+
+class TestChamadasEmAndamento:
+    """Testes para a coalescência de chamadas simultâneas."""
+    
+    def setup_method(self):
+        """Configura o registro e o contador de chamadas para cada teste."""
+        self.chamadas = ChamadasEmAndamento()
+        self.executadas = []
+        self.liberar = None
+    
+    async def _chamada(self, valor):
+        """Chamada falsa que registra a execução e aguarda ser liberada."""
+        self.executadas.append(valor)
+        await self.liberar.wait()
+        return f"resultado {valor}"
+    
+    async def _grupo(self, chaves):
+        """Chamada em grupo falsa: um resultado por chave, na mesma ordem."""
+        self.executadas.append(list(chaves))
+        await self.liberar.wait()
+        return [f"resultado {chave}" for chave in chaves]
+    
+    @pytest.mark.asyncio
+    async def test_compartilha_chamada_da_mesma_chave(self):
+        """Requisições simultâneas da mesma chave devem disparar uma única chamada."""
+        self.liberar = asyncio.Event()
+        tarefas = [
+            asyncio.create_task(self.chamadas.executar("a", lambda: self._chamada("a")))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        self.liberar.set()
+        
+        assert await asyncio.gather(*tarefas) == ["resultado a"] * 3
+        assert self.executadas == ["a"]
+    
+    @pytest.mark.asyncio
+    async def test_remove_chave_ao_concluir(self):
+        """A chave deve sair do registro ao terminar, e uma nova requisição chama de novo."""
+        self.liberar = asyncio.Event()
+        self.liberar.set()
+        
+        await self.chamadas.executar("a", lambda: self._chamada("a"))
+        assert len(self.chamadas) == 0
+        
+        await self.chamadas.executar("a", lambda: self._chamada("a"))
+        assert self.executadas == ["a", "a"]
+    
+    @pytest.mark.asyncio
+    async def test_excecao_chega_a_todos(self):
+        """Uma falha deve ser entregue a todas as requisições e limpar o registro."""
+        async def falhar():
+            await asyncio.sleep(0)
+            raise RuntimeError("falha na API")
+        
+        resultados = await asyncio.gather(
+            *(self.chamadas.executar("a", falhar) for _ in range(3)),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(resultado, RuntimeError) for resultado in resultados)
+        assert len(self.chamadas) == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelamento_nao_afeta_as_demais(self):
+        """Cancelar uma requisição não deve cancelar a chamada compartilhada."""
+        self.liberar = asyncio.Event()
+        primeira = asyncio.create_task(self.chamadas.executar("a", lambda: self._chamada("a")))
+        segunda = asyncio.create_task(self.chamadas.executar("a", lambda: self._chamada("a")))
+        await asyncio.sleep(0)
+        
+        primeira.cancel()
+        await asyncio.sleep(0)
+        self.liberar.set()
+        
+        assert await segunda == "resultado a"
+        assert primeira.cancelled()
+        assert self.executadas == ["a"]
+    
+    @pytest.mark.asyncio
+    async def test_grupo_reaproveita_chaves_em_andamento(self):
+        """O grupo deve chamar só as chaves novas, sem repetição, e aguardar as em andamento."""
+        self.liberar = asyncio.Event()
+        individual = asyncio.create_task(self.chamadas.executar("a", lambda: self._chamada("a")))
+        await asyncio.sleep(0)
+        
+        grupo = asyncio.create_task(self.chamadas.executar_grupo(["a", "b", "c", "b"], self._grupo))
+        await asyncio.sleep(0)
+        self.liberar.set()
+        
+        assert await grupo == ["resultado a", "resultado b", "resultado c", "resultado b"]
+        assert await individual == "resultado a"
+        assert self.executadas == ["a", ["b", "c"]]
+        assert len(self.chamadas) == 0
+    
+    @pytest.mark.asyncio
+    async def test_individual_aguarda_grupo(self):
+        """Uma requisição individual de uma chave do grupo deve aguardar o grupo."""
+        self.liberar = asyncio.Event()
+        grupo = asyncio.create_task(self.chamadas.executar_grupo(["a", "b"], self._grupo))
+        await asyncio.sleep(0)
+        individual = asyncio.create_task(self.chamadas.executar("b", lambda: self._chamada("b")))
+        await asyncio.sleep(0)
+        self.liberar.set()
+        
+        assert await individual == "resultado b"
+        assert await grupo == ["resultado a", "resultado b"]
+        assert self.executadas == [["a", "b"]]
+    
+    @pytest.mark.asyncio
+    async def test_falha_do_grupo_chega_a_cada_chave(self):
+        """Uma falha do grupo deve ser entregue a quem aguarda qualquer uma das chaves."""
+        async def falhar(chaves):
+            await asyncio.sleep(0)
+            raise RuntimeError("falha no grupo")
+        
+        grupo = asyncio.create_task(self.chamadas.executar_grupo(["a", "b"], falhar))
+        await asyncio.sleep(0)
+        individual = self.chamadas.executar("b", lambda: self._chamada("b"))
+        
+        resultados = await asyncio.gather(grupo, individual, return_exceptions=True)
+        
+        assert all(isinstance(resultado, RuntimeError) for resultado in resultados)
+        assert self.executadas == []
+        assert len(self.chamadas) == 0
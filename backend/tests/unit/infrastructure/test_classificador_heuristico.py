@@ -0,0 +1,76 @@
+"""
+Testes unitários para o filtro local ClassificadorHeuristico.
+"""
+
+import pytest
+from domain.entities.email import CategoriaEmail
+from infrastructure.nlp.classificador_heuristico import ClassificadorHeuristico
+
+
+class TestClassificadorHeuristico:
+    """Testes para o filtro local de emails improdutivos."""
+    
+    def setup_method(self):
+        """Configura o classificador para cada teste."""
+        self.classificador = ClassificadorHeuristico()
+    
+    @pytest.mark.parametrize(
+        "conteudo,confianca",
+        [
+            ("Feliz Natal a toda a equipe!", 0.95),
+            ("Parabéns pelos 10 anos da empresa!", 0.95),
+            ("Confira a nossa newsletter de março.", 0.90),
+            ("Mensagem automática, não responda.", 0.85),
+            ("Seu boleto vence amanhã.", 0.85),
+            ("Aviso: sua fatura vence dia 10.", 0.85),
+        ],
+        ids=["felicitacao", "parabens", "newsletter", "nao_responda", "boleto_vence", "fatura_vence"]
+    )
+    def test_sinal_claro_de_improdutivo_decide_localmente(self, conteudo, confianca):
+        """Deve classificar como improdutivo emails curtos com sinal claro."""
+        resultado = self.classificador.classificar(conteudo)
+        
+        assert resultado is not None
+        assert resultado.categoria == CategoriaEmail.IMPRODUTIVO
+        assert resultado.confianca == confianca
+    
+    @pytest.mark.parametrize(
+        "conteudo",
+        [
+            "Não consegui pagar o boleto, o banco recusa o código de barras.",
+            "Recebi o boleto com valor errado, favor corrigir e reenviar.",
+            "Parabéns pelo atendimento! Mas ainda falta a nota fiscal do pedido 55.",
+            "Lembrete: reunião amanhã às 10h para revisar o contrato.",
+            "Feliz Natal! Poderiam confirmar o recebimento do pagamento?",
+            "Segue o boleto do mês.",
+        ],
+        ids=["boleto_recusado", "boleto_errado", "parabens_com_pedido", "lembrete_reuniao", "pergunta", "boleto_sem_aviso"]
+    )
+    def test_pedido_real_fica_com_o_modelo(self, conteudo):
+        """Deve devolver None quando o email pode conter um pedido."""
+        assert self.classificador.classificar(conteudo) is None
+    
+    def test_texto_longo_fica_com_o_modelo(self):
+        """Deve devolver None para textos acima do tamanho máximo."""
+        conteudo = "Feliz Natal! " + "Votos de sucesso. " * 30
+        
+        assert self.classificador.classificar(conteudo) is None
+    
+    def test_limiar_acima_do_sinal_nao_decide(self):
+        """Deve ignorar sinais com confiança abaixo do limiar."""
+        classificador = ClassificadorHeuristico(limiar=0.9)
+        
+        assert classificador.classificar("Mensagem automática, não responda.") is None
+        assert classificador.classificar("Feliz Natal a toda a equipe!") is not None
+    
+    def test_taxa_decisao(self):
+        """Deve contar a fração de emails decididos localmente."""
+        self.classificador.classificar("Feliz Natal a toda a equipe!")
+        self.classificador.classificar("Preciso de ajuda com o sistema.")
+        
+        assert self.classificador.taxa_decisao == 0.5
+    
+    def test_sugere_improdutivo_sem_limite_de_tamanho(self):
+        """Deve sugerir improdutivo em textos longos, exceto quando há pedido."""
+        assert self.classificador.sugere_improdutivo("Feliz Natal! " + "Votos de sucesso. " * 30)
+        assert not self.classificador.sugere_improdutivo("Feliz Natal! Falta a nota fiscal do pedido 55.")
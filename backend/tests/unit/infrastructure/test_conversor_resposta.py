@@ -0,0 +1,134 @@
+"""
+Testes unitários para a conversão das respostas dos modelos de IA.
+"""
+
+import re
+
+import pytest
+from domain.entities.email import CategoriaEmail
+from infrastructure.ai.conversor_resposta import (
+    RESPOSTA_PADRAO,
+    converter_categoria,
+    converter_resposta,
+    limpar_resposta,
+)
+
+
+def _limpar_resposta_original(resposta: str) -> str:
+    """As quatro substituições em sequência que o padrão único substituiu."""
+    padroes_remover = [
+        r'(Atenciosamente,?)\s*\[.*?\]',
+        r'(Cordialmente,?)\s*\[.*?\]',
+        r'(Atenciosamente,?)\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+(\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+)*\s*$',
+        r'(Cordialmente,?)\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+(\s+[A-Z][a-záàâãéèêíïóôõöúçñ]+)*\s*$',
+    ]
+    resultado = resposta
+    for padrao in padroes_remover:
+        resultado = re.sub(padrao, r'\1', resultado, flags=re.IGNORECASE | re.MULTILINE)
+    return resultado.strip()
+
+
+RESPOSTAS = [
+    ("Olá,\n\nRecebemos o pedido.\n\nAtenciosamente,\n[Seu Nome]", "Olá,\n\nRecebemos o pedido.\n\nAtenciosamente,"),
+    ("Obrigado!\n\nCordialmente, [Nome da Empresa]", "Obrigado!\n\nCordialmente,"),
+    ("Obrigado!\n\nAtenciosamente,\nMaria Silva", "Obrigado!\n\nAtenciosamente,"),
+    ("Obrigado!\n\nCordialmente,\nJoão", "Obrigado!\n\nCordialmente,"),
+    ("Obrigado!\n\nAtenciosamente, [Seu Nome]\nJoão Souza", "Obrigado!\n\nAtenciosamente,"),
+    ("Obrigado!\n\natenciosamente,\n[Nome]", "Obrigado!\n\natenciosamente,"),
+    ("Obrigado!\n\nAtenciosamente,", "Obrigado!\n\nAtenciosamente,"),
+    ("Obrigado!\n\nAtenciosamente,\nEquipe de Suporte 24h", "Obrigado!\n\nAtenciosamente,\nEquipe de Suporte 24h"),
+    ("  Sem despedida nenhuma.  ", "Sem despedida nenhuma."),
+    ("Atenciosamente, [A]\n\nObs.: texto.\nCordialmente, [B]", "Atenciosamente,\n\nObs.: texto.\nCordialmente,"),
+]
+
+
+class TestLimparResposta:
+    """Testes para a limpeza da despedida na resposta sugerida."""
+    
+    @pytest.mark.parametrize("resposta,esperada", RESPOSTAS)
+    def test_remove_placeholder_e_nome(self, resposta, esperada):
+        """Placeholders e nomes após a despedida devem ser removidos."""
+        assert limpar_resposta(resposta) == esperada
+    
+    @pytest.mark.parametrize("resposta", [resposta for resposta, _ in RESPOSTAS])
+    def test_equivale_as_substituicoes_originais(self, resposta):
+        """O padrão único deve produzir o mesmo texto que as quatro substituições originais."""
+        assert limpar_resposta(resposta) == _limpar_resposta_original(resposta)
+
+
+class TestConverterCategoria:
+    """Testes para a normalização da categoria."""
+    
+    @pytest.mark.parametrize(
+        "categoria,esperada",
+        [
+            ("Produtivo", CategoriaEmail.PRODUTIVO),
+            ("Improdutivo", CategoriaEmail.IMPRODUTIVO),
+            ("improdutivo", CategoriaEmail.IMPRODUTIVO),
+            ("  IMPRODUTIVO ", CategoriaEmail.IMPRODUTIVO),
+            ("produtivo", CategoriaEmail.PRODUTIVO),
+            ("Spam", CategoriaEmail.PRODUTIVO),
+            ("", CategoriaEmail.PRODUTIVO),
+            (None, CategoriaEmail.PRODUTIVO),
+            (1, CategoriaEmail.PRODUTIVO),
+        ],
+    )
+    def test_normaliza_categoria(self, categoria, esperada):
+        """Só "improdutivo" (em qualquer caixa) vira Improdutivo; o resto, Produtivo."""
+        assert converter_categoria(categoria) is esperada
+
+
+class TestConverterResposta:
+    """Testes para a conversão do JSON do modelo no value object."""
+    
+    def test_converte_resposta_completa(self):
+        """Todos os campos devem ser copiados, com a resposta limpa."""
+        resultado = converter_resposta({
+            "categoria": "Improdutivo",
+            "confianca": 0.93,
+            "resposta_sugerida": "Obrigado!\n\nAtenciosamente,\n[Seu Nome]",
+            "assunto": "Feliz Natal",
+            "remetente": "Ana <ana@exemplo.com>",
+            "destinatario": "suporte@exemplo.com",
+        })
+        
+        assert resultado.categoria is CategoriaEmail.IMPRODUTIVO
+        assert resultado.confianca == 0.93
+        assert resultado.resposta_sugerida == "Obrigado!\n\nAtenciosamente,"
+        assert resultado.assunto == "Feliz Natal"
+        assert resultado.remetente == "Ana <ana@exemplo.com>"
+        assert resultado.destinatario == "suporte@exemplo.com"
+    
+    def test_usa_padroes_para_campos_ausentes(self):
+        """Sem categoria, confiança e resposta, valem Produtivo, 0.5 e a resposta padrão."""
+        resultado = converter_resposta({})
+        
+        assert resultado.categoria is CategoriaEmail.PRODUTIVO
+        assert resultado.confianca == 0.5
+        assert resultado.resposta_sugerida == RESPOSTA_PADRAO
+        assert resultado.assunto is None
+    
+    @pytest.mark.parametrize("confianca,esperada", [(1.7, 1.0), (-0.2, 0.0), ("0.8", 0.8)])
+    def test_limita_confianca(self, confianca, esperada):
+        """A confiança deve ser convertida para float e limitada a [0, 1]."""
+        resultado = converter_resposta({"confianca": confianca, "resposta_sugerida": "Ok."})
+        
+        assert resultado.confianca == esperada
+    
+    @pytest.mark.parametrize("valor", ["null", "NULL", "None", "none", "", "  ", None])
+    def test_metadados_nulos_viram_none(self, valor):
+        """Valores que o modelo usa para "ausente" devem virar None."""
+        resultado = converter_resposta({
+            "resposta_sugerida": "Ok.",
+            "assunto": valor,
+            "remetente": valor,
+            "destinatario": valor,
+        })
+        
+        assert (resultado.assunto, resultado.remetente, resultado.destinatario) == (None, None, None)
+    
+    def test_preserva_metadados_com_conteudo(self):
+        """Textos que só contêm "null" como parte de algo maior devem ser mantidos."""
+        resultado = converter_resposta({"resposta_sugerida": "Ok.", "assunto": "null pointer no sistema"})
+        
+        assert resultado.assunto == "null pointer no sistema"
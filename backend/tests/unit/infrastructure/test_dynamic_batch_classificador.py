@@ -0,0 +1,135 @@
+"""
+Testes unitários para o DynamicBatchClassificador.
+"""
+
+import asyncio
+
+import pytest
+from domain.entities.email import CategoriaEmail
+from domain.exceptions import ClassificacaoException
+from domain.value_objects.classificacao_resultado import ClassificacaoResultado
+from infrastructure.ai.dynamic_batch_classificador import DynamicBatchClassificador
+
+
+def _resultado(conteudo: str) -> ClassificacaoResultado:
+    return ClassificacaoResultado(
+        categoria=CategoriaEmail.PRODUTIVO,
+        confianca=0.9,
+        resposta_sugerida=f"Resposta para {conteudo}"
+    )
+
+
+class ClassificadorFalso:
+    """Classificador com classificar_agrupado que registra as chamadas."""
+    
+    def __init__(self, falhar_grupo: bool = False):
+        self.falhar_grupo = falhar_grupo
+        self.grupos = []
+        self.individuais = []
+        self.liberar = asyncio.Event()
+        self.liberar.set()
+    
+    async def classificar(self, conteudo: str) -> ClassificacaoResultado:
+        self.individuais.append(conteudo)
+        await self.liberar.wait()
+        if conteudo == "inválido":
+            raise ClassificacaoException("Falha na classificação")
+        return _resultado(conteudo)
+    
+    async def classificar_agrupado(self, conteudos):
+        self.grupos.append(list(conteudos))
+        await self.liberar.wait()
+        if self.falhar_grupo:
+            raise ClassificacaoException("Resposta em grupo inválida")
+        return [_resultado(conteudo) for conteudo in conteudos]
+
+
+class TestDynamicBatchClassificador:
+    """Testes para a formação de lotes dinâmicos."""
+    
+    @pytest.mark.asyncio
+    async def test_agrupa_chamadas_concorrentes(self):
+        """Chamadas simultâneas devem ir juntas em um único classificar_agrupado."""
+        falso = ClassificadorFalso()
+        classificador = DynamicBatchClassificador(falso, max_batch_size=8, batch_wait_timeout_s=0.01)
+        
+        resultados = await asyncio.gather(*(classificador.classificar(f"email {i}") for i in range(3)))
+        
+        assert [resultado.resposta_sugerida for resultado in resultados] == [
+            "Resposta para email 0", "Resposta para email 1", "Resposta para email 2"
+        ]
+        assert falso.grupos == [["email 0", "email 1", "email 2"]]
+        assert falso.individuais == []
+        await classificador.fechar()
+    
+    @pytest.mark.asyncio
+    async def test_respeita_tamanho_maximo_do_lote(self):
+        """Lotes não devem passar de max_batch_size; o que sobra forma outro lote."""
+        falso = ClassificadorFalso()
+        classificador = DynamicBatchClassificador(falso, max_batch_size=2, batch_wait_timeout_s=0.01)
+        
+        await asyncio.gather(*(classificador.classificar(f"email {i}") for i in range(5)))
+        
+        assert sorted(len(grupo) for grupo in falso.grupos) == [2, 2]
+        assert len(falso.individuais) == 1
+        await classificador.fechar()
+    
+    @pytest.mark.asyncio
+    async def test_email_sozinho_usa_classificar(self):
+        """Um lote de um só email deve seguir o caminho normal de classificar()."""
+        falso = ClassificadorFalso()
+        classificador = DynamicBatchClassificador(falso, batch_wait_timeout_s=0.001)
+        
+        resultado = await classificador.classificar("email único")
+        
+        assert resultado == _resultado("email único")
+        assert falso.individuais == ["email único"]
+        assert falso.grupos == []
+        await classificador.fechar()
+    
+    @pytest.mark.asyncio
+    async def test_falha_do_grupo_classifica_individualmente(self):
+        """Se o grupo falhar, cada email deve ser classificado sozinho, com o seu próprio erro."""
+        falso = ClassificadorFalso(falhar_grupo=True)
+        classificador = DynamicBatchClassificador(falso, batch_wait_timeout_s=0.01)
+        
+        resultados = await asyncio.gather(
+            classificador.classificar("email 0"),
+            classificador.classificar("inválido"),
+            return_exceptions=True
+        )
+        
+        assert resultados[0] == _resultado("email 0")
+        assert isinstance(resultados[1], ClassificacaoException)
+        assert falso.grupos == [["email 0", "inválido"]]
+        assert falso.individuais == ["email 0", "inválido"]
+        await classificador.fechar()
+    
+    @pytest.mark.asyncio
+    async def test_fechar_encerra_laco_e_cancela_pendentes(self):
+        """fechar() deve parar o laço e cancelar as requisições de lotes interrompidos."""
+        falso = ClassificadorFalso()
+        falso.liberar.clear()
+        classificador = DynamicBatchClassificador(falso, batch_wait_timeout_s=0.001)
+        requisicoes = [asyncio.create_task(classificador.classificar(f"email {i}")) for i in range(2)]
+        await asyncio.sleep(0.05)
+        laco = classificador._laco
+        
+        await classificador.fechar()
+        resultados = await asyncio.gather(*requisicoes, return_exceptions=True)
+        
+        assert laco.done()
+        assert classificador._laco is None
+        assert len(classificador._em_andamento) == 0
+        assert all(isinstance(resultado, asyncio.CancelledError) for resultado in resultados)
+    
+    @pytest.mark.asyncio
+    async def test_volta_a_funcionar_depois_de_fechar(self):
+        """Uma nova chamada depois de fechar() deve recriar a fila e o laço."""
+        falso = ClassificadorFalso()
+        classificador = DynamicBatchClassificador(falso, batch_wait_timeout_s=0.001)
+        await classificador.classificar("email 0")
+        await classificador.fechar()
+        
+        assert await classificador.classificar("email 1") == _resultado("email 1")
+        await classificador.fechar()
@@ -0,0 +1,97 @@
+"""
+Testes unitários para o LeitorMbox.
+"""
+
+from io import BytesIO
+
+import pytest
+from domain.exceptions import ArquivoInvalidoException
+from infrastructure.file_readers.leitor_mbox import LeitorMbox
+
+
+def _mensagem(numero: int, corpo: str = None) -> str:
+    """Monta um email do MBOX, com a linha separadora "From "."""
+    return (
+        f"From remetente{numero}@exemplo.com Mon Jan  1 00:00:00 2024\n"
+        f"From: Remetente {numero} <remetente{numero}@exemplo.com>\n"
+        f"To: suporte@exemplo.com\n"
+        f"Subject: Assunto {numero}\n"
+        f"\n"
+        f"{corpo or f'Corpo do email {numero}.'}\n"
+        f"\n"
+    )
+
+
+def _mbox(*mensagens: str, fim_de_linha: str = "\n") -> BytesIO:
+    return BytesIO("".join(mensagens).replace("\n", fim_de_linha).encode("utf-8"))
+
+
+class TestLeitorMbox:
+    """Testes para a leitura de arquivos MBOX."""
+    
+    def setup_method(self):
+        """Configura o leitor para cada teste."""
+        self.leitor = LeitorMbox()
+    
+    def test_le_todos_os_emails(self):
+        """Cada email deve aparecer numerado, com cabeçalhos e corpo."""
+        texto = self.leitor.ler(_mbox(_mensagem(1), _mensagem(2)))
+        
+        assert "=== Email 1 ===" in texto and "=== Email 2 ===" in texto
+        assert "De: Remetente 1 <remetente1@exemplo.com>" in texto
+        assert "Assunto: Assunto 2" in texto
+        assert "Corpo do email 2." in texto
+        assert "Mais" not in texto
+    
+    def test_arquivo_com_crlf(self):
+        """Arquivos com fim de linha CRLF devem ser separados e lidos igualmente."""
+        texto = self.leitor.ler(_mbox(_mensagem(1), _mensagem(2), fim_de_linha="\r\n"))
+        
+        assert "=== Email 2 ===" in texto
+        assert "Assunto: Assunto 1" in texto
+        assert "Corpo do email 2." in texto
+    
+    def test_ignora_conteudo_antes_do_primeiro_separador(self):
+        """Texto antes da primeira linha "From " não é um email e deve ser ignorado."""
+        texto = self.leitor.ler(_mbox("Lixo antes do primeiro email\n\n", _mensagem(1)))
+        
+        assert "Lixo" not in texto
+        assert texto.startswith("=== Email 1 ===")
+        assert "=== Email 2 ===" not in texto
+    
+    def test_limita_a_max_emails_e_conta_os_restantes(self):
+        """Só MAX_EMAILS emails devem ser extraídos; os demais, apenas contados."""
+        total = LeitorMbox.MAX_EMAILS + 3
+        texto = self.leitor.ler(_mbox(*(_mensagem(i) for i in range(1, total + 1))))
+        
+        assert f"=== Email {LeitorMbox.MAX_EMAILS} ===" in texto
+        assert f"=== Email {LeitorMbox.MAX_EMAILS + 1} ===" not in texto
+        assert f"Corpo do email {LeitorMbox.MAX_EMAILS + 1}." not in texto
+        assert texto.endswith("[... Mais 3 emails não exibidos ...]")
+    
+    def test_exatamente_max_emails_nao_mostra_aviso(self):
+        """Com exatamente MAX_EMAILS emails, não há restantes a avisar."""
+        texto = self.leitor.ler(_mbox(*(_mensagem(i) for i in range(1, LeitorMbox.MAX_EMAILS + 1))))
+        
+        assert f"=== Email {LeitorMbox.MAX_EMAILS} ===" in texto
+        assert "Mais" not in texto
+    
+    def test_corpo_html_vira_texto(self):
+        """Um corpo só em HTML deve ser convertido para texto."""
+        mensagem = (
+            "From a@exemplo.com Mon Jan  1 00:00:00 2024\n"
+            "From: a@exemplo.com\n"
+            "Content-Type: text/html; charset=utf-8\n"
+            "\n"
+            "<html><body><p>Preciso de <b>ajuda</b></p><script>x()</script></body></html>\n"
+        )
+        
+        texto = self.leitor.ler(_mbox(mensagem))
+        
+        assert "Preciso de" in texto and "ajuda" in texto
+        assert "<b>" not in texto and "x()" not in texto
+    
+    def test_arquivo_sem_emails(self):
+        """Um arquivo sem nenhuma linha "From " deve ser recusado."""
+        with pytest.raises(ArquivoInvalidoException):
+            self.leitor.ler(BytesIO(b"apenas texto, sem separadores\n"))
@@ -0,0 +1,97 @@
+"""
+Testes unitários para a extração simplificada do LeitorMsg (sem extract-msg).
+"""
+
+import random
+import re
+from io import BytesIO
+
+import pytest
+from domain.exceptions import ArquivoInvalidoException
+from infrastructure.file_readers import leitor_msg
+from infrastructure.file_readers.leitor_msg import LeitorMsg
+
+
+_ASSINATURA = b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
+
+
+def _extrair_original(arquivo: bytes) -> str:
+    """A extração antes do translate: a regex sobre o arquivo inteiro decodificado."""
+    texto_partes = []
+    i = arquivo.find(b'\xff\xfe')
+    while i != -1 and i < len(arquivo) - 2:
+        end = arquivo.find(b'\x00\x00', i + 2)
+        if end == -1:
+            break
+        texto = arquivo[i:end+2].decode('utf-16-le', errors='ignore')
+        if len(texto) > 10 and texto.isprintable():
+            texto_partes.append(texto)
+        i = arquivo.find(b'\xff\xfe', i + 1)
+    texto_partes.extend(re.findall(r'[\w\s@.\-,!?:;()]{20,}', arquivo.decode('utf-8', errors='ignore')))
+    return "\n".join(dict.fromkeys(texto_partes))
+
+
+class TestLeitorMsgSimplificado:
+    """Testes para a extração de texto do binário MSG."""
+    
+    def setup_method(self):
+        """Configura o leitor para cada teste."""
+        self.leitor = LeitorMsg()
+    
+    def test_ler_sem_extract_msg_usa_extracao_simplificada(self, monkeypatch):
+        """Sem extract-msg, ler() deve extrair os trechos legíveis do binário."""
+        monkeypatch.setattr(leitor_msg, "extract_msg", None)
+        arquivo = _ASSINATURA + b"\x00\x01" + b"Assunto: Pedido de reembolso urgente\x00\x02\x03"
+        
+        assert self.leitor.ler(BytesIO(arquivo)) == "Assunto: Pedido de reembolso urgente"
+    
+    def test_recusa_arquivo_sem_assinatura(self, monkeypatch):
+        """Arquivos sem a assinatura Compound File Binary devem ser recusados."""
+        monkeypatch.setattr(leitor_msg, "extract_msg", None)
+        
+        with pytest.raises(ArquivoInvalidoException):
+            self.leitor.ler(BytesIO(b"texto qualquer que nao e um arquivo MSG"))
+    
+    def test_recusa_arquivo_sem_texto(self):
+        """Sem nenhum trecho legível, a extração deve falhar."""
+        with pytest.raises(ArquivoInvalidoException):
+            self.leitor._extrair_texto_simplificado(_ASSINATURA + b"\x00curto\x00")
+    
+    def test_remove_repeticoes(self):
+        """Trechos repetidos devem aparecer uma só vez."""
+        trecho = b"Mensagem repetida no arquivo"
+        arquivo = _ASSINATURA + b"\x01" + trecho + b"\x02" + trecho + b"\x03"
+        
+        assert self.leitor._extrair_texto_simplificado(arquivo) == trecho.decode()
+    
+    @pytest.mark.parametrize(
+        "arquivo",
+        [
+            _ASSINATURA + b"\x01Preciso de ajuda com o boleto (vencido)!\x02",
+            _ASSINATURA + "\x01Solicitação de reembolso: pedido nº 123\x02".encode("utf-8"),
+            _ASSINATURA + b"\x01Texto com byte invalido\xff no meio da frase\x02",
+            _ASSINATURA + b"\x01" + "ação".encode("utf-8") * 8 + b"\x7f" + b"a" * 25,
+            _ASSINATURA + b"\x01curto\x02" + b"x" * 19 + b"\x03" + b"y" * 20,
+            _ASSINATURA + "\x01São Paulo — centro, sala 12 (térreo)\x02".encode("utf-8"),
+        ],
+    )
+    def test_equivale_a_regex_sobre_o_arquivo(self, arquivo):
+        """translate + split deve produzir os mesmos trechos que a regex sobre o arquivo decodificado."""
+        assert self.leitor._extrair_texto_simplificado(arquivo) == _extrair_original(arquivo)
+    
+    def test_equivale_a_regex_em_bytes_aleatorios(self):
+        """A equivalência deve valer para binários arbitrários, inclusive com BOMs UTF-16."""
+        aleatorio = random.Random(42)
+        alfabeto = [bytes([i]) for i in range(256)]
+        alfabeto += ["á".encode(), "ç".encode(), b"a" * 8, b" " * 4, b"\xff\xfe", b"\x00\x00"]
+        # Bytes legíveis mais frequentes, para que surjam trechos de 20+ caracteres
+        alfabeto += [bytes([c]) for c in b"abcdefghij klmno,.-"] * 20
+        
+        for _ in range(300):
+            arquivo = _ASSINATURA + b"".join(aleatorio.choice(alfabeto) for _ in range(400))
+            esperado = _extrair_original(arquivo)
+            if not esperado:
+                with pytest.raises(ArquivoInvalidoException):
+                    self.leitor._extrair_texto_simplificado(arquivo)
+                continue
+            assert self.leitor._extrair_texto_simplificado(arquivo) == esperado
@@ -0,0 +1,161 @@
+"""
+Testes unitários para o AsyncTokenBucket e para com_retentativas.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from infrastructure.ai import rate_limiter, retry
+from infrastructure.ai.rate_limiter import AsyncTokenBucket
+from infrastructure.ai.retry import com_retentativas
+
+
+class RelogioFalso:
+    """Relógio controlado pelo teste; sleep() avança o tempo sem esperar."""
+    
+    def __init__(self):
+        self.agora = 1000.0
+        self.esperas = []
+    
+    def monotonic(self) -> float:
+        return self.agora
+    
+    async def sleep(self, segundos: float) -> None:
+        self.esperas.append(segundos)
+        self.agora += segundos
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    """Substitui time.monotonic e asyncio.sleep nos módulos do limitador e das retentativas."""
+    relogio = RelogioFalso()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=relogio.monotonic))
+    monkeypatch.setattr(rate_limiter, "asyncio", SimpleNamespace(sleep=relogio.sleep))
+    monkeypatch.setattr(retry, "asyncio", SimpleNamespace(sleep=relogio.sleep))
+    monkeypatch.setattr(retry, "random", SimpleNamespace(uniform=lambda inicio, fim: 0.0))
+    return relogio
+
+
+class TestAsyncTokenBucket:
+    """Testes para o balde de tokens."""
+    
+    def test_rejeita_taxa_nao_positiva(self):
+        """Uma taxa zero ou negativa não deve ser aceita."""
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(0)
+    
+    @pytest.mark.asyncio
+    async def test_consome_saldo_sem_esperar(self, relogio):
+        """Com saldo suficiente, adquirir() não deve esperar."""
+        balde = AsyncTokenBucket(60)
+        
+        for _ in range(60):
+            await balde.adquirir()
+        
+        assert relogio.esperas == []
+    
+    @pytest.mark.asyncio
+    async def test_espera_reabastecimento(self, relogio):
+        """Sem saldo, adquirir() deve esperar o tempo de repor os tokens que faltam."""
+        balde = AsyncTokenBucket(60)
+        await balde.adquirir(60)
+        
+        await balde.adquirir(3)
+        
+        assert relogio.esperas == [pytest.approx(3.0)]
+    
+    @pytest.mark.asyncio
+    async def test_reabastece_ate_a_capacidade(self, relogio):
+        """O saldo reposto com o tempo não deve passar da capacidade."""
+        balde = AsyncTokenBucket(60, capacidade=10)
+        await balde.adquirir(10)
+        relogio.agora += 3600
+        
+        await balde.adquirir(10)
+        await balde.adquirir(1)
+        
+        assert relogio.esperas == [pytest.approx(1.0)]
+    
+    @pytest.mark.asyncio
+    async def test_limita_pedido_maior_que_a_capacidade(self, relogio):
+        """Um pedido maior que a capacidade deve consumir só a capacidade, sem esperar para sempre."""
+        balde = AsyncTokenBucket(60, capacidade=10)
+        
+        await balde.adquirir(1000)
+        
+        assert relogio.esperas == []
+        await balde.adquirir(5)
+        assert relogio.esperas == [pytest.approx(5.0)]
+    
+    @pytest.mark.asyncio
+    async def test_sincronizar_reduz_o_saldo(self, relogio):
+        """sincronizar() deve baixar o saldo ao restante informado pelo provedor."""
+        balde = AsyncTokenBucket(60)
+        
+        balde.sincronizar(2)
+        await balde.adquirir(2)
+        await balde.adquirir(1)
+        
+        assert relogio.esperas == [pytest.approx(1.0)]
+    
+    @pytest.mark.asyncio
+    async def test_sincronizar_nao_aumenta_nem_fica_negativo(self, relogio):
+        """Um restante maior que o saldo não aumenta o saldo, e um negativo vale zero."""
+        balde = AsyncTokenBucket(60)
+        await balde.adquirir(59)
+        
+        balde.sincronizar(1000)
+        await balde.adquirir(1)
+        assert relogio.esperas == []
+        
+        balde.sincronizar(-5)
+        await balde.adquirir(1)
+        assert relogio.esperas == [pytest.approx(1.0)]
+
+
+class ErroTransitorio(Exception):
+    """Exceção tratada como transitória nos testes."""
+
+
+class TestComRetentativas:
+    """Testes para as retentativas com backoff exponencial."""
+    
+    def _operacao(self, falhas, excecao=ErroTransitorio):
+        """Cria uma operação que falha nas primeiras `falhas` chamadas."""
+        self.chamadas = 0
+        
+        async def operacao():
+            self.chamadas += 1
+            if self.chamadas <= falhas:
+                raise excecao("falha")
+            return "ok"
+        return operacao
+    
+    @pytest.mark.asyncio
+    async def test_repete_com_espera_exponencial(self, relogio):
+        """Falhas transitórias devem ser repetidas, dobrando a espera até o teto."""
+        resultado = await com_retentativas(
+            self._operacao(falhas=4), (ErroTransitorio,), espera_inicial=1.0, espera_maxima=5.0
+        )
+        
+        assert resultado == "ok"
+        assert self.chamadas == 5
+        assert relogio.esperas == [1.0, 2.0, 4.0, 5.0]
+    
+    @pytest.mark.asyncio
+    async def test_desiste_apos_tentativas(self, relogio):
+        """Depois de `tentativas` falhas, a última exceção deve ser propagada."""
+        with pytest.raises(ErroTransitorio):
+            await com_retentativas(self._operacao(falhas=10), (ErroTransitorio,), tentativas=3)
+        
+        assert self.chamadas == 3
+        assert len(relogio.esperas) == 2
+    
+    @pytest.mark.asyncio
+    async def test_excecao_nao_transitoria_passa_direto(self, relogio):
+        """Exceções fora da lista não devem ser repetidas."""
+        with pytest.raises(ValueError):
+            await com_retentativas(self._operacao(falhas=1, excecao=ValueError), (ErroTransitorio,))
+        
+        assert self.chamadas == 1
+        assert relogio.esperas == []